@@ -7,13 +7,14 @@ main.py에서 분리된 API 라우트들
 
 from fastapi import FastAPI, HTTPException
 from pydantic import BaseModel
+import asyncio
 import json
 import time
 import random
 from datetime import datetime
 from typing import Dict, List, Any, Optional
 from hardware_scanner import get_scanner, reset_scanner
-from sensor_handlers import test_sps30_sensor, read_sensor_data
+from sensor_handlers import test_sps30_sensor, read_sensor_data, hold_buses
 
 class SensorTestRequest(BaseModel):
     i2c_bus: int
@@ -58,7 +59,8 @@ def setup_api_routes(app: FastAPI):
         """
         try:
             scanner = get_scanner()
-            result = scanner.scan_dual_mux_system()
+            async with hold_buses():
+                result = await asyncio.to_thread(scanner.scan_dual_mux_system)
             return result
         except Exception as e:
             print(f"❌ 이중 멀티플렉서 스캔 실패: {e}")
@@ -100,7 +102,8 @@ def setup_api_routes(app: FastAPI):
                 }
             
             scanner = get_scanner()
-            result = scanner.scan_single_bus(bus_number)
+            async with hold_buses(bus_number):
+                result = await asyncio.to_thread(scanner.scan_single_bus, bus_number)
             return result
         except Exception as e:
             print(f"❌ 버스 {bus_number} 스캔 실패: {e}")
@@ -244,7 +247,8 @@ def setup_api_routes(app: FastAPI):
             scanner = get_scanner()
             
             # 최신 스캔 수행
-            scan_result = scanner.scan_dual_mux_system()
+            async with hold_buses():
+                scan_result = await asyncio.to_thread(scanner.scan_dual_mux_system)
             
             status = {
                 "timestamp": datetime.now().isoformat(),
@@ -281,7 +285,8 @@ def setup_api_routes(app: FastAPI):
         """
         try:
             scanner = get_scanner()
-            scan_result = scanner.scan_dual_mux_system()
+            async with hold_buses():
+                scan_result = await asyncio.to_thread(scanner.scan_dual_mux_system)
             
             sensors = scan_result.get("sensors", [])
             return sensors
@@ -311,7 +316,8 @@ def setup_api_routes(app: FastAPI):
         """
         try:
             scanner = get_scanner()
-            scan_result = scanner.scan_dual_mux_system()
+            async with hold_buses():
+                scan_result = await asyncio.to_thread(scanner.scan_dual_mux_system)
             
             # 센서별 그룹화
             groups = {
@@ -439,7 +445,8 @@ def setup_api_routes(app: FastAPI):
         """
         try:
             scanner = get_scanner()
-            scan_result = scanner.scan_dual_mux_system()
+            async with hold_buses():
+                scan_result = await asyncio.to_thread(scanner.scan_dual_mux_system)
             
             # SHT40 센서만 필터링
             sht40_sensors = [
@@ -523,7 +530,8 @@ def setup_api_routes(app: FastAPI):
             
             # SHT40 센서 스캔 실행
             if hasattr(scanner, 'scan_sht40_sensors'):
-                sht40_devices = scanner.scan_sht40_sensors()
+                async with hold_buses():
+                    sht40_devices = await asyncio.to_thread(scanner.scan_sht40_sensors)
                 
                 return {
                     "success": True,
@@ -559,7 +567,8 @@ def setup_api_routes(app: FastAPI):
         """
         try:
             scanner = get_scanner()
-            scan_result = scanner.scan_dual_mux_system()
+            async with hold_buses():
+                scan_result = await asyncio.to_thread(scanner.scan_dual_mux_system)
             
             # SDP810 센서만 필터링
             sdp810_sensors = [
@@ -608,86 +617,91 @@ def setup_api_routes(app: FastAPI):
             scanner = get_scanner()
             
             if scanner.is_raspberry_pi:
-                # 멀티플렉서 채널 선택
-                if not scanner._select_channel(bus, channel):
-                    return {"success": False, "error": "멀티플렉서 채널 선택 실패"}
-                
-                # SDP810 센서에서 원시 데이터 읽기
-                bus_obj = scanner.buses[bus]
-                address = 0x25
-                
-                # 직접 센서 측정 (test_sdp810_realtime_data.py와 동일한 방식)
-                try:
-                    import smbus2
-                    import struct
-                    import time
+                def read_sdp810() -> Dict[str, Any]:
+                    """채널 선택부터 읽기까지 (I2C 블로킹 작업, 워커 스레드에서 실행)"""
+                    # 멀티플렉서 채널 선택
+                    if not scanner._select_channel(bus, channel):
+                        return {"success": False, "error": "멀티플렉서 채널 선택 실패"}
                     
-                    # 센서 안정화 대기
-                    time.sleep(0.05)
-                    
-                    # 3바이트 읽기: [pressure_msb, pressure_lsb, crc]
-                    read_msg = smbus2.i2c_msg.read(address, 3)
-                    bus_obj.i2c_rdwr(read_msg)
-                    raw_data = list(read_msg)
+                    # SDP810 센서에서 원시 데이터 읽기
+                    bus_obj = scanner.buses[bus]
+                    address = 0x25
                     
-                    if len(raw_data) == 3:
-                        pressure_msb = raw_data[0]
-                        pressure_lsb = raw_data[1]
-                        received_crc = raw_data[2]
+                    # 직접 센서 측정 (test_sdp810_realtime_data.py와 동일한 방식)
+                    try:
+                        import smbus2
+                        import struct
+                        import time
                         
-                        # CRC 검증
-                        def calculate_crc8(data):
-                            crc = 0xFF
-                            for byte in data:
-                                crc ^= byte
-                                for _ in range(8):
-                                    if crc & 0x80:
-                                        crc = (crc << 1) ^ 0x31
-                                    else:
-                                        crc = crc << 1
-                            return crc & 0xFF
+                        # 센서 안정화 대기
+                        time.sleep(0.05)
                         
-                        calculated_crc = calculate_crc8([pressure_msb, pressure_lsb])
-                        crc_valid = calculated_crc == received_crc
+                        # 3바이트 읽기: [pressure_msb, pressure_lsb, crc]
+                        read_msg = smbus2.i2c_msg.read(address, 3)
+                        bus_obj.i2c_rdwr(read_msg)
+                        raw_data = list(read_msg)
                         
-                        # 압력 계산
-                        raw_pressure = struct.unpack('>h', bytes([pressure_msb, pressure_lsb]))[0]
-                        pressure_pa = raw_pressure / 60.0  # SDP810 스케일링
-                        pressure_pa = max(-500.0, min(500.0, pressure_pa))  # 범위 제한
-                        
-                        # 멀티플렉서 채널 해제
-                        scanner._disable_all_channels(bus)
-                        
-                        # CRC 실패 시 에러 응답 (프론트엔드에서 skip 처리)
-                        if not crc_valid:
+                        if len(raw_data) == 3:
+                            pressure_msb = raw_data[0]
+                            pressure_lsb = raw_data[1]
+                            received_crc = raw_data[2]
+                            
+                            # CRC 검증
+                            def calculate_crc8(data):
+                                crc = 0xFF
+                                for byte in data:
+                                    crc ^= byte
+                                    for _ in range(8):
+                                        if crc & 0x80:
+                                            crc = (crc << 1) ^ 0x31
+                                        else:
+                                            crc = crc << 1
+                                return crc & 0xFF
+                            
+                            calculated_crc = calculate_crc8([pressure_msb, pressure_lsb])
+                            crc_valid = calculated_crc == received_crc
+                            
+                            # 압력 계산
+                            raw_pressure = struct.unpack('>h', bytes([pressure_msb, pressure_lsb]))[0]
+                            pressure_pa = raw_pressure / 60.0  # SDP810 스케일링
+                            pressure_pa = max(-500.0, min(500.0, pressure_pa))  # 범위 제한
+                            
+                            # 멀티플렉서 채널 해제
+                            scanner._disable_all_channels(bus)
+                            
+                            # CRC 실패 시 에러 응답 (프론트엔드에서 skip 처리)
+                            if not crc_valid:
+                                return {
+                                    "success": False, 
+                                    "error": "CRC 검증 실패", 
+                                    "data": None,
+                                    "crc_error": True
+                                }
+                            
+                            # CRC 성공 시 데이터 응답
                             return {
-                                "success": False, 
-                                "error": "CRC 검증 실패", 
-                                "data": None,
-                                "crc_error": True
+                                "success": True,
+                                "data": {
+                                    "pressure": round(pressure_pa, 4),
+                                    "timestamp": datetime.now().isoformat(),
+                                    "crc_valid": crc_valid
+                                },
+                                "sensor_info": {
+                                    "bus": bus,
+                                    "mux_channel": channel,
+                                    "address": "0x25"
+                                }
                             }
-                        
-                        # CRC 성공 시 데이터 응답
-                        return {
-                            "success": True,
-                            "data": {
-                                "pressure": round(pressure_pa, 4),
-                                "timestamp": datetime.now().isoformat(),
-                                "crc_valid": crc_valid
-                            },
-                            "sensor_info": {
-                                "bus": bus,
-                                "mux_channel": channel,
-                                "address": "0x25"
-                            }
-                        }
-                    else:
+                        else:
+                            scanner._disable_all_channels(bus)
+                            return {"success": False, "error": f"데이터 길이 오류: {len(raw_data)}"}
+                            
+                    except Exception as read_error:
                         scanner._disable_all_channels(bus)
-                        return {"success": False, "error": f"데이터 길이 오류: {len(raw_data)}"}
-                        
-                except Exception as read_error:
-                    scanner._disable_all_channels(bus)
-                    return {"success": False, "error": f"센서 읽기 오류: {read_error}"}
+                        return {"success": False, "error": f"센서 읽기 오류: {read_error}"}
+                
+                async with hold_buses(bus):  # 채널 선택부터 읽기까지 센서 읽기 작업과 겹치지 않도록 버스 잠금
+                    return await asyncio.to_thread(read_sdp810)
             else:
                 # Mock 데이터 (개발 환경)
                 import random
@@ -729,7 +743,8 @@ def setup_api_routes(app: FastAPI):
             
             # SDP810 센서 스캔 실행
             if hasattr(scanner, 'scan_sdp810_sensors'):
-                sdp810_devices = scanner.scan_sdp810_sensors()
+                async with hold_buses():
+                    sdp810_devices = await asyncio.to_thread(scanner.scan_sdp810_sensors)
                 
                 return {
                     "success": True,
@@ -765,7 +780,8 @@ def setup_api_routes(app: FastAPI):
         """
         try:
             scanner = get_scanner()
-            scan_result = scanner.scan_dual_mux_system()
+            async with hold_buses():
+                scan_result = await asyncio.to_thread(scanner.scan_dual_mux_system)
             
             # BME688 센서만 필터링
             bme688_sensors = [
@@ -860,7 +876,8 @@ def setup_api_routes(app: FastAPI):
             
             # BME688 센서 스캔 실행
             if hasattr(scanner, 'scan_bme688_sensors'):
-                bme688_devices = scanner.scan_bme688_sensors()
+                async with hold_buses():
+                    bme688_devices = await asyncio.to_thread(scanner.scan_bme688_sensors)
                 
                 return {
                     "success": True,
@@ -899,7 +916,8 @@ def setup_api_routes(app: FastAPI):
             
             # BH1750 센서 동적 스캔 실행
             if hasattr(scanner, 'scan_bh1750_sensors'):
-                bh1750_devices = scanner.scan_bh1750_sensors()
+                async with hold_buses():
+                    bh1750_devices = await asyncio.to_thread(scanner.scan_bh1750_sensors)
                 
                 return {
                     "success": True,
@@ -949,48 +967,53 @@ def setup_api_routes(app: FastAPI):
             
             # 실제 BH1750 센서 데이터 읽기
             if scanner.is_raspberry_pi:
-                # 실제 하드웨어에서 측정
-                try:
-                    # 채널이 'direct'가 아니면 멀티플렉서 채널 선택
-                    if str(channel).lower() != 'direct' and isinstance(channel, int):
-                        if not scanner._select_channel(bus, channel):
-                            return {"success": False, "error": "멀티플렉서 채널 선택 실패", "data": None}
-                    
-                    # BH1750 조도 측정
-                    bus_obj = scanner.buses[bus]
-                    light_value = scanner._test_bh1750_measurement(bus_obj, 0x23)  # 기본 주소 0x23
-                    
-                    # 0x23에서 실패하면 0x5C(ADDR=HIGH) 시도
-                    if light_value is None:
-                        light_value = scanner._test_bh1750_measurement(bus_obj, 0x5C)
-                    
-                    # 멀티플렉서 채널 비활성화
-                    if str(channel).lower() != 'direct' and isinstance(channel, int):
-                        scanner._disable_all_channels(bus)
-                    
-                    if light_value is not None:
-                        # 사용된 주소 확인 (추후 확장용)
-                        used_address = "0x23"  # 기본값
+                def measure_bh1750() -> Dict[str, Any]:
+                    """채널 선택부터 측정까지 (I2C 블로킹 작업, 워커 스레드에서 실행)"""
+                    # 실제 하드웨어에서 측정
+                    try:
+                        # 채널이 'direct'가 아니면 멀티플렉서 채널 선택
+                        if str(channel).lower() != 'direct' and isinstance(channel, int):
+                            if not scanner._select_channel(bus, channel):
+                                return {"success": False, "error": "멀티플렉서 채널 선택 실패", "data": None}
                         
-                        sensor_data = {
-                            "sensor_id": f"bh1750_{bus}_{channel}_{used_address[2:]}",
-                            "bus": bus,
-                            "channel": channel if str(channel).lower() != 'direct' else None,
-                            "address": used_address,
-                            "sensor_type": "BH1750",
-                            "timestamp": datetime.now().isoformat(),
-                            "light": light_value,
-                            "units": {
-                                "light": "lux"
-                            },
-                            "status": "connected"
-                        }
-                        return {"success": True, "data": sensor_data}
-                    else:
-                        return {"success": False, "error": "BH1750 센서 측정 실패", "data": None}
+                        # BH1750 조도 측정
+                        bus_obj = scanner.buses[bus]
+                        light_value = scanner._test_bh1750_measurement(bus_obj, 0x23)  # 기본 주소 0x23
                         
-                except Exception as hw_error:
-                    return {"success": False, "error": f"하드웨어 통신 오류: {str(hw_error)}", "data": None}
+                        # 0x23에서 실패하면 0x5C(ADDR=HIGH) 시도
+                        if light_value is None:
+                            light_value = scanner._test_bh1750_measurement(bus_obj, 0x5C)
+                        
+                        # 멀티플렉서 채널 비활성화
+                        if str(channel).lower() != 'direct' and isinstance(channel, int):
+                            scanner._disable_all_channels(bus)
+                        
+                        if light_value is not None:
+                            # 사용된 주소 확인 (추후 확장용)
+                            used_address = "0x23"  # 기본값
+                            
+                            sensor_data = {
+                                "sensor_id": f"bh1750_{bus}_{channel}_{used_address[2:]}",
+                                "bus": bus,
+                                "channel": channel if str(channel).lower() != 'direct' else None,
+                                "address": used_address,
+                                "sensor_type": "BH1750",
+                                "timestamp": datetime.now().isoformat(),
+                                "light": light_value,
+                                "units": {
+                                    "light": "lux"
+                                },
+                                "status": "connected"
+                            }
+                            return {"success": True, "data": sensor_data}
+                        else:
+                            return {"success": False, "error": "BH1750 센서 측정 실패", "data": None}
+                            
+                    except Exception as hw_error:
+                        return {"success": False, "error": f"하드웨어 통신 오류: {str(hw_error)}", "data": None}
+                
+                async with hold_buses(bus):  # 채널 선택부터 측정까지 센서 읽기 작업과 겹치지 않도록 버스 잠금
+                    return await asyncio.to_thread(measure_bh1750)
             else:
                 # Mock 데이터 (개발 환경)
                 mock_light = 345.0 + random.uniform(-50, 50)  # 295-395 lux 범위
@@ -1033,7 +1056,8 @@ def setup_api_routes(app: FastAPI):
             
             # BH1750 센서 스캔 실행
             if hasattr(scanner, 'scan_bh1750_sensors'):
-                bh1750_devices = scanner.scan_bh1750_sensors()
+                async with hold_buses():
+                    bh1750_devices = await asyncio.to_thread(scanner.scan_bh1750_sensors)
                 
                 return {
                     "success": True,
@@ -1070,7 +1094,8 @@ def setup_api_routes(app: FastAPI):
         try:
             from sensor_handlers import update_sht40_sensor_list
             
-            found_sensors = update_sht40_sensor_list()
+            async with hold_buses():
+                found_sensors = await asyncio.to_thread(update_sht40_sensor_list)
             
             return {
                 "success": True,
@@ -1127,36 +1152,42 @@ def setup_api_routes(app: FastAPI):
             sensors = get_sht40_sensor_list()
             status_data = []
             
-            for sensor_config in sensors:
-                try:
-                    # 빠른 상태 체크 (연결 테스트만)
-                    sensor = SHT40Sensor(
-                        bus=sensor_config['bus'],
-                        address=int(sensor_config['address'], 16) if isinstance(sensor_config['address'], str) else sensor_config['address'],
-                        mux_channel=sensor_config.get('mux_channel'),
-                        mux_address=int(sensor_config.get('mux_address', '0x70'), 16) if isinstance(sensor_config.get('mux_address'), str) else sensor_config.get('mux_address')
-                    )
-                    sensor.connect()
-                    success, message = sensor.test_connection()
-                    sensor.close()
-                    
-                    status_data.append({
-                        "sensor_id": sensor_config.get('sensor_id'),
-                        "location": sensor_config.get('location'),
-                        "bus": sensor_config['bus'],
-                        "channel": sensor_config.get('display_channel', 'direct'),
-                        "address": sensor_config.get('address'),
-                        "status": "connected" if success else "error",
-                        "message": message
-                    })
-                    
-                except Exception as e:
-                    status_data.append({
-                        "sensor_id": sensor_config.get('sensor_id'),
-                        "location": sensor_config.get('location'),
-                        "status": "error",
-                        "message": str(e)
-                    })
+            def check_sensors():
+                """센서별 연결 테스트 (I2C 블로킹 작업, 워커 스레드에서 실행)"""
+                for sensor_config in sensors:
+                    try:
+                        # 빠른 상태 체크 (연결 테스트만)
+                        sensor = SHT40Sensor(
+                            bus=sensor_config['bus'],
+                            address=int(sensor_config['address'], 16) if isinstance(sensor_config['address'], str) else sensor_config['address'],
+                            mux_channel=sensor_config.get('mux_channel'),
+                            mux_address=int(sensor_config.get('mux_address', '0x70'), 16) if isinstance(sensor_config.get('mux_address'), str) else sensor_config.get('mux_address')
+                        )
+                        sensor.connect()
+                        success, message = sensor.test_connection()
+                        sensor.close()
+                        
+                        status_data.append({
+                            "sensor_id": sensor_config.get('sensor_id'),
+                            "location": sensor_config.get('location'),
+                            "bus": sensor_config['bus'],
+                            "channel": sensor_config.get('display_channel', 'direct'),
+                            "address": sensor_config.get('address'),
+                            "status": "connected" if success else "error",
+                            "message": message
+                        })
+                        
+                    except Exception as e:
+                        status_data.append({
+                            "sensor_id": sensor_config.get('sensor_id'),
+                            "location": sensor_config.get('location'),
+                            "status": "error",
+                            "message": str(e)
+                        })
+            
+            # SHT40 모듈이 멀티플렉서를 직접 전환하므로 전체 버스 잠금
+            async with hold_buses():
+                await asyncio.to_thread(check_sensors)
             
             return {
                 "success": True,
@@ -1226,7 +1257,8 @@ def setup_api_routes(app: FastAPI):
             HTTPException: 리셋 실패 시 500 오류
         """
         try:
-            reset_scanner()
+            async with hold_buses():
+                await asyncio.to_thread(reset_scanner)
             return {"success": True, "message": "스캐너가 리셋되었습니다"}
         except Exception as e:
             print(f"❌ 스캐너 리셋 실패: {e}")
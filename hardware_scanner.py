@@ -77,6 +77,10 @@ class HardwareScanner:
         }
     }
     
+    # 멀티플렉서 채널 변경 카운터 (스캐너가 채널을 바꿀 때마다 증가, 스캐너 재생성 후에도 유지)
+    # sensor_handlers의 선택 채널 캐시가 이 값으로 유효성 확인
+    mux_epoch = 0
+    
     def __init__(self):
         self.is_raspberry_pi = self._check_raspberry_pi()
         self.buses = {}  # {bus_number: smbus_object}
@@ -86,6 +90,15 @@ class HardwareScanner:
             self._init_i2c_buses()
             self._detect_tca9548a()
         
+    def _mark_mux_changed(self):
+        """
+        멀티플렉서 채널 상태 변경 기록 (센서 읽기 측 채널 캐시 무효화)
+        
+        - 반드시 채널 쓰기 이후에 호출 (쓰기 전에 올리면 그 사이 기록된 캐시가 유효로 남음)
+        - 호출자는 sensor_handlers.hold_buses 버스 잠금을 잡은 상태에서 쓰기와 함께 수행
+        """
+        HardwareScanner.mux_epoch += 1
+    
     def _check_raspberry_pi(self) -> bool:
         """
         현재 시스템이 라즈베리파이인지 확인
@@ -185,6 +198,9 @@ class HardwareScanner:
             else:
                 print(f"  ✅ Bus {bus_num}: TCA9548A 감지 완료")
         
+        # 감지 과정에서 채널을 비활성화했으므로 쓰기 이후 채널 캐시 무효화
+        self._mark_mux_changed()
+        
         print(f"🏁 TCA9548A 감지 완료: {len(self.tca_info)}개 발견 {list(self.tca_info.keys())}")
     
     def _select_channel(self, bus_num: int, channel: int) -> bool:
@@ -221,6 +237,9 @@ class HardwareScanner:
         except Exception as e:
             print(f"채널 선택 실패 Bus {bus_num}, Ch {channel}: {e}")
             return False
+        finally:
+            # 쓰기 이후 무효화 (실패한 쓰기도 채널 상태를 알 수 없으므로 포함)
+            self._mark_mux_changed()
     
     def _disable_all_channels(self, bus_num: int):
         """TCA9548A 모든 채널 비활성화"""
@@ -237,6 +256,8 @@ class HardwareScanner:
             bus.write_byte(tca_addr, 0x00)
         except Exception as e:
             print(f"채널 비활성화 실패 Bus {bus_num}: {e}")
+        finally:
+            self._mark_mux_changed()
     
     def _detect_sensor_type(self, bus_num: int, address: int) -> Optional[str]:
         """주소 기반 센서 타입 감지"""
@@ -755,6 +776,9 @@ class HardwareScanner:
                 except Exception as e:
                     print(f"    ❌ Bus {bus_num} 멀티플렉서 스캔 실패: {e}")
         
+        # 채널별 스캔으로 멀티플렉서 상태가 바뀌었으므로 스캔 이후 채널 캐시 무효화
+        self._mark_mux_changed()
+        
         print(f"📊 SHT40 동적 스캔 결과: {len(sht40_devices)}개 센서 발견")
         
         # 발견된 센서 상세 정보 출력
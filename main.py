@@ -6,17 +6,29 @@ EG-ICON Dashboard - 메인 서버
 성능 최적화: 메모리 > 실시간성 > 응답속도
 """
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import HTMLResponse, Response
 from contextlib import asynccontextmanager
 import uvicorn
+import asyncio
+import gzip
+import hashlib
 from datetime import datetime
+from typing import Dict, Optional
+
+# 고성능 이벤트 루프 (선택사항, 미설치 시 표준 asyncio 루프 사용)
+try:
+    import uvloop  # noqa: F401
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
 
 # 분리된 모듈들 import
 from api_endpoints import setup_api_routes
 from websocket_manager import setup_websocket_routes
 from hardware_scanner import cleanup_scanner
+from sensor_handlers import close_buses, close_sps30
 
 # SPS30 백그라운드 스레드 import
 from sps30_background import SPS30BackgroundThread
@@ -38,6 +50,98 @@ def get_sps30_thread():
     """
     return sps30_thread
 
+# 응답용 현재 시각 문자열 (백그라운드 작업이 주기적으로 갱신, 요청마다 datetime 생성 안 함)
+NOW_ISO_INTERVAL = 0.1  # 초
+_now_iso = datetime.now().isoformat()
+
+async def _now_iso_ticker():
+    """
+    현재 시각 ISO 문자열 갱신 작업
+    
+    운영 시 중요사항:
+    - NOW_ISO_INTERVAL 간격으로 _now_iso 갱신 (최대 오차 0.1초)
+    - 헬스체크/상태 API는 갱신된 문자열을 그대로 사용
+    - 서버 종료 시 lifespan에서 취소됨
+    """
+    global _now_iso
+    while True:
+        _now_iso = datetime.now().isoformat()
+        await asyncio.sleep(NOW_ISO_INTERVAL)
+
+# 프론트엔드 파일 메모리 캐시 {파일명: MIME 타입}
+STATIC_FILES = {
+    "index.html": "text/html; charset=utf-8",
+    "settings.html": "text/html; charset=utf-8",
+    "dustsensor.html": "text/html; charset=utf-8",
+    "dashboard.js": "application/javascript",
+    "settings.js": "application/javascript",
+    "dustsensor.js": "application/javascript",
+    "style.css": "text/css"
+}
+_static_cache: Dict[str, Dict] = {}
+
+def load_static_file(name: str) -> Optional[Dict]:
+    """
+    프론트엔드 파일을 읽어 원본/gzip 바이트와 ETag를 캐시
+    
+    운영 시 중요사항:
+    - 서버 시작 시 1회 로드, 이후 요청은 디스크 접근 없이 메모리에서 응답
+    - gzip 압축본이 원본보다 작을 때만 보관
+    - 프론트엔드 파일 수정 시 서버 재시작 필요
+    
+    Args:
+        name: frontend/ 디렉토리 내 파일명
+        
+    Returns:
+        dict: content, gzip, etag, gzip_etag 캐시 항목 (파일이 없으면 None)
+    """
+    try:
+        with open(f"frontend/{name}", "rb") as f:
+            content = f.read()
+    except FileNotFoundError:
+        return None
+    
+    compressed = gzip.compress(content)
+    digest = hashlib.blake2b(content, digest_size=16).hexdigest()
+    entry = {
+        "content": content,
+        "gzip": compressed if len(compressed) < len(content) else None,
+        "etag": f'"{digest}"',
+        "gzip_etag": f'"{digest}-gz"'
+    }
+    _static_cache[name] = entry
+    return entry
+
+def static_response(request: Request, name: str) -> Optional[Response]:
+    """
+    캐시된 프론트엔드 파일 응답 생성
+    
+    운영 시 중요사항:
+    - If-None-Match가 ETag와 일치하면 본문 없이 304 응답
+    - 클라이언트가 gzip을 지원하면 미리 압축한 바이트로 응답 (ETag는 "-gz" 접미사로 구분)
+    - 캐시에 없으면 디스크에서 로드 시도, 파일이 없으면 None 반환
+    
+    Args:
+        request: 요청 객체 (조건부/압축 헤더 확인용)
+        name: frontend/ 디렉토리 내 파일명
+        
+    Returns:
+        Response 또는 None
+    """
+    entry = _static_cache.get(name) or load_static_file(name)
+    if entry is None:
+        return None
+    
+    use_gzip = entry["gzip"] is not None and "gzip" in request.headers.get("accept-encoding", "")
+    etag = entry["gzip_etag"] if use_gzip else entry["etag"]
+    headers = {"ETag": etag, "Cache-Control": "public, max-age=60", "Vary": "Accept-Encoding"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    if use_gzip:
+        headers["Content-Encoding"] = "gzip"
+        return Response(content=entry["gzip"], media_type=STATIC_FILES[name], headers=headers)
+    return Response(content=entry["content"], media_type=STATIC_FILES[name], headers=headers)
+
 # 라이프사이클 이벤트 핸들러 (FastAPI 최신 방식)
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -62,6 +166,14 @@ async def lifespan(app: FastAPI):
     print("   - websocket_manager.py: 실시간 WebSocket 통신")
     print("   - hardware_scanner.py: 하드웨어 스캔")
     
+    # 프론트엔드 파일 메모리 캐시
+    for name in STATIC_FILES:
+        load_static_file(name)
+    print(f"📦 프론트엔드 파일 {len(_static_cache)}개 캐시 완료")
+    
+    # 응답 타임스탬프 갱신 작업 시작
+    now_iso_task = asyncio.create_task(_now_iso_ticker())
+    
     # SPS30 백그라운드 스레드 초기화 및 시작
     print("🌪️ SPS30 백그라운드 스레드 초기화 중...")
     try:
@@ -79,12 +191,16 @@ async def lifespan(app: FastAPI):
     # 서버 종료 시 정리
     print("🛑 EG-ICON Dashboard 서버 종료")
     
+    now_iso_task.cancel()
+    
     # SPS30 백그라운드 스레드 중지
     if sps30_thread:
         print("🛑 SPS30 백그라운드 스레드 중지 중...")
         sps30_thread.stop()
         print("✅ SPS30 백그라운드 스레드 중지 완료")
     
+    close_sps30()
+    close_buses()
     cleanup_scanner()
 
 # FastAPI 앱 생성 (lifespan 이벤트 포함)
@@ -101,24 +217,22 @@ app.mount("/frontend", StaticFiles(directory="frontend"), name="frontend")
 
 # JS/CSS 파일 직접 서빙을 위한 추가 라우트
 @app.get("/dashboard.js")
-async def get_dashboard_js():
+async def get_dashboard_js(request: Request):
     """
     dashboard.js 파일 서빙
     
     운영 시 중요사항:
     - 프론트엔드 메인 대시보드 JavaScript 파일 제공
     - 파일이 없으면 404 에러 반환
-    - UTF-8 인코딩으로 읽어서 JavaScript MIME 타입으로 응답
+    - 시작 시 메모리에 캐시된 바이트로 JavaScript MIME 타입 응답 (ETag/gzip 지원)
     """
-    try:
-        with open("frontend/dashboard.js", "r", encoding="utf-8") as f:
-            content = f.read()
-        return Response(content=content, media_type="application/javascript")
-    except FileNotFoundError:
+    response = static_response(request, "dashboard.js")
+    if response is None:
         raise HTTPException(status_code=404, detail="dashboard.js not found")
+    return response
 
 @app.get("/settings.js")
-async def get_settings_js():
+async def get_settings_js(request: Request):
     """
     settings.js 파일 서빙
     
@@ -126,15 +240,13 @@ async def get_settings_js():
     - 프론트엔드 설정 페이지 JavaScript 파일 제공
     - 센서 설정 및 시스템 구성 관련 기능 포함
     """
-    try:
-        with open("frontend/settings.js", "r", encoding="utf-8") as f:
-            content = f.read()
-        return Response(content=content, media_type="application/javascript")
-    except FileNotFoundError:
+    response = static_response(request, "settings.js")
+    if response is None:
         raise HTTPException(status_code=404, detail="settings.js not found")
+    return response
 
 @app.get("/dustsensor.js")
-async def get_dustsensor_js():
+async def get_dustsensor_js(request: Request):
     """
     dustsensor.js 파일 서빙
     
@@ -142,15 +254,13 @@ async def get_dustsensor_js():
     - SPS30 미세먼지 센서 전용 페이지 JavaScript 파일 제공
     - PM1.0, PM2.5, PM10 데이터 시각화 및 실시간 모니터링 기능
     """
-    try:
-        with open("frontend/dustsensor.js", "r", encoding="utf-8") as f:
-            content = f.read()
-        return Response(content=content, media_type="application/javascript")
-    except FileNotFoundError:
+    response = static_response(request, "dustsensor.js")
+    if response is None:
         raise HTTPException(status_code=404, detail="dustsensor.js not found")
+    return response
 
 @app.get("/style.css")
-async def get_style_css():
+async def get_style_css(request: Request):
     """
     style.css 파일 서빙
     
@@ -158,12 +268,10 @@ async def get_style_css():
     - 전체 웹 애플리케이션의 CSS 스타일 파일 제공
     - 대시보드, 설정, 미세먼지 페이지의 통합 스타일링
     """
-    try:
-        with open("frontend/style.css", "r", encoding="utf-8") as f:
-            content = f.read()
-        return Response(content=content, media_type="text/css")
-    except FileNotFoundError:
+    response = static_response(request, "style.css")
+    if response is None:
         raise HTTPException(status_code=404, detail="style.css not found")
+    return response
 
 # 라우트 설정
 setup_api_routes(app)
@@ -171,7 +279,7 @@ setup_websocket_routes(app)
 
 # 기본 HTML 페이지 라우트
 @app.get("/", response_class=HTMLResponse)
-async def dashboard():
+async def dashboard(request: Request):
     """
     메인 대시보드 페이지 라우트
     
@@ -180,14 +288,13 @@ async def dashboard():
     - 모든 센서 데이터를 실시간으로 표시하는 메인 페이지
     - 파일이 없으면 404 에러 페이지 반환
     """
-    try:
-        with open("frontend/index.html", "r", encoding="utf-8") as f:
-            return HTMLResponse(content=f.read())
-    except FileNotFoundError:
+    response = static_response(request, "index.html")
+    if response is None:
         return HTMLResponse(content="<h1>Dashboard not found</h1>", status_code=404)
+    return response
 
 @app.get("/settings", response_class=HTMLResponse)
-async def settings():
+async def settings(request: Request):
     """
     설정 페이지 라우트
     
@@ -196,14 +303,13 @@ async def settings():
     - 하드웨어 스캔, 센서 테스트 기능 포함
     - 시스템 관리자용 인터페이스
     """
-    try:
-        with open("frontend/settings.html", "r", encoding="utf-8") as f:
-            return HTMLResponse(content=f.read())
-    except FileNotFoundError:
+    response = static_response(request, "settings.html")
+    if response is None:
         return HTMLResponse(content="<h1>Settings not found</h1>", status_code=404)
+    return response
 
 @app.get("/dustsensor", response_class=HTMLResponse)
-async def dustsensor():
+async def dustsensor(request: Request):
     """
     SPS30 미세먼지 센서 전용 페이지 라우트
     
@@ -212,11 +318,10 @@ async def dustsensor():
     - PM1.0, PM2.5, PM4.0, PM10 실시간 차트 및 데이터 표시
     - 공기질 지수 표시 및 알림 기능
     """
-    try:
-        with open("frontend/dustsensor.html", "r", encoding="utf-8") as f:
-            return HTMLResponse(content=f.read())
-    except FileNotFoundError:
+    response = static_response(request, "dustsensor.html")
+    if response is None:
         return HTMLResponse(content="<h1>Dust Sensor page not found</h1>", status_code=404)
+    return response
 
 # 시스템 정보 엔드포인트
 @app.get("/api/system/info")
@@ -238,7 +343,7 @@ async def system_info():
     return {
         "system": "EG-ICON Dashboard",
         "version": "1.0.0",
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": _now_iso,
         "mode": "hardware" if scanner.is_raspberry_pi else "development",
         "features": {
             "i2c_scanning": True,
@@ -275,7 +380,7 @@ async def get_sps30_data():
         return {
             "success": True,
             "data": data,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": _now_iso
         }
     except Exception as e:
         return {
@@ -310,7 +415,7 @@ async def get_sps30_status():
             "success": True,
             "status": status,
             "health": sps30_thread.is_healthy(),
-            "timestamp": datetime.now().isoformat()
+            "timestamp": _now_iso
         }
     except Exception as e:
         return {
@@ -335,7 +440,7 @@ async def health_check():
     """
     return {
         "status": "healthy",
-        "timestamp": datetime.now().isoformat()
+        "timestamp": _now_iso
     }
 
 # 구 방식의 이벤트 핸들러 제거됨 (lifespan으로 대체)
@@ -343,10 +448,12 @@ async def health_check():
 # 개발 서버 실행
 if __name__ == "__main__":
     print("🔧 개발 모드로 서버 시작...")
+    print(f"⚡ 이벤트 루프: {'uvloop' if UVLOOP_AVAILABLE else 'asyncio'}")
     uvicorn.run(
         "main:app",
         host="0.0.0.0",
         port=8001,
         reload=True,
+        loop="uvloop" if UVLOOP_AVAILABLE else "asyncio",
         log_level="info"
     )
\ No newline at end of file
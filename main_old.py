@@ -5,323 +5,541 @@ egicon_dash 기반 FastAPI 서버
 성능 최적화: 메모리 > 실시간성 > 응답속도
 """
 
-from fastapi import FastAPI, WebSocket, WebSocketDisconnect
+from fastapi import FastAPI, Request, WebSocket, WebSocketDisconnect
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, JSONResponse, Response
 import asyncio
+import concurrent.futures
+import hashlib
 import json
+import logging
+import logging.handlers
+import queue
 import time
 import math
 import random
+from collections import namedtuple
 from datetime import datetime
-from typing import Dict, List, Any
+from enum import IntEnum
+from typing import Any, Callable, Dict, List, Optional, Tuple
 import uvicorn
 from hardware_scanner import get_scanner, cleanup_scanner, reset_scanner
 
-# BH1750 센서 데이터 읽기 함수 (ref/gui_bh1750.py 기반)
-async def read_bh1750_data(bus_number: int, mux_channel: int) -> float:
-    """BH1750 센서에서 실제 조도 데이터 읽기 - 안정적인 구현"""
-    try:
+# 센서 읽기 경로 로그 (측정 과정 상세 로그는 DEBUG 레벨이라 기본 비활성화)
+logger = logging.getLogger(__name__)
+_log_listener: Optional[logging.handlers.QueueListener] = None
+
+def start_log_listener():
+    """로그 출력을 백그라운드 스레드로 분리 (이벤트 루프에서는 큐에 넣기만 함)"""
+    global _log_listener
+    if _log_listener is not None:
+        return
+    log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(message)s"))
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    _log_listener = logging.handlers.QueueListener(log_queue, stream_handler)
+    _log_listener.start()
+
+def stop_log_listener():
+    """대기 중인 로그를 모두 출력하고 로그 스레드 종료"""
+    global _log_listener
+    if _log_listener is not None:
+        _log_listener.stop()
+        _log_listener = None
+
+# JSON 직렬화 라이브러리 (orjson이 있으면 datetime을 C 레벨에서 직접 직렬화)
+try:
+    import orjson
+    from fastapi.responses import ORJSONResponse
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# MessagePack 바이너리 직렬화 (WebSocket 클라이언트가 ?format=msgpack으로 요청 시 사용)
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
+# 수치 연산 라이브러리 (Mock 데이터 일괄 생성용, 없으면 random 모듈로 동작)
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Mock 데이터용 난수 생성기 (틱마다 필요한 난수를 한 번에 추출)
+_rng = np.random.default_rng() if NUMPY_AVAILABLE else random.Random()
+
+def _json_default(obj: Any) -> Any:
+    """표준 json 모듈용 datetime 직렬화 (orjson 미설치 환경)"""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def dumps_json(obj: Any) -> bytes:
+    """객체를 UTF-8 JSON 바이트로 직렬화 (orjson 우선)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    # orjson과 동일하게 공백 없는 구분자 사용 (전송 바이트 절감)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), default=_json_default).encode("utf-8")
+
+def dumps_msgpack(obj: Any) -> bytes:
+    """객체를 MessagePack 바이트로 직렬화 (datetime은 JSON과 동일하게 ISO 문자열)"""
+    return msgpack.packb(obj, default=_json_default, use_bin_type=True)
+
+# I2C 전용 워커 스레드 2개 (기본 executor를 다른 블로킹 작업과 공유하지 않음)
+# 스레드는 특정 버스에 고정되지 않음 - 같은 버스 직렬화는 버스 잠금(_bus_lock)으로만 보장
+_I2C_POOL = concurrent.futures.ThreadPoolExecutor(max_workers=2, thread_name_prefix="i2c")
+
+async def run_i2c(func, *args):
+    """블로킹 I2C 작업을 I2C 전용 스레드 풀에서 실행"""
+    return await asyncio.get_running_loop().run_in_executor(_I2C_POOL, func, *args)
+
+# I2C 버스 핸들 및 TCA9548A 채널 선택 상태 캐시
+_bus_handles: Dict[int, Any] = {}  # {bus_number: SMBus} - 읽기마다 열고 닫지 않고 재사용
+_current_channel: Dict[int, int] = {}  # {bus_number: 현재 선택된 mux 채널}
+
+def get_bus(bus_number: int):
+    """I2C 버스 핸들 반환 (최초 호출 시 열고 이후 재사용)"""
+    bus = _bus_handles.get(bus_number)
+    if bus is None:
+        import smbus2
+        bus = smbus2.SMBus(bus_number)
+        _bus_handles[bus_number] = bus
+    return bus
+
+def open_buses():
+    """TCA9548A가 감지된 버스 핸들을 미리 열어 첫 측정의 open 비용 제거 (서버 시작 시)"""
+    scanner = get_scanner()
+    if not scanner.is_raspberry_pi:
+        return
+    for bus_number in scanner.tca_info:
+        try:
+            get_bus(bus_number)
+        except Exception as e:
+            print(f"⚠️ I2C 버스 {bus_number} 열기 실패: {e}")
+
+def select_mux_channel(bus, bus_number: int, tca_address: int, mux_channel: int):
+    """TCA9548A 채널 선택 (이미 선택된 채널이면 I2C 쓰기 생략)"""
+    if _current_channel.get(bus_number) != mux_channel:
+        bus.write_byte(tca_address, 1 << mux_channel)
+        _current_channel[bus_number] = mux_channel
+        time.sleep(0.01)
+
+def invalidate_channel_cache(bus_number: Optional[int] = None):
+    """채널 선택 캐시 무효화 (스캔 또는 통신 오류로 mux 상태를 알 수 없을 때)"""
+    if bus_number is None:
+        _current_channel.clear()
+    else:
+        _current_channel.pop(bus_number, None)
+
+# 스캐너 하드웨어 정보 캐시 (읽기마다 get_scanner()/tca_info 조회 대신 사용, 스캔 시 무효화)
+_IS_RPI: Optional[bool] = None
+_TCA_ADDR: Dict[int, int] = {}  # {bus_number: TCA9548A 주소}
+
+def resolve_hardware() -> bool:
+    """라즈베리파이 여부 반환 (최초 호출 시 스캐너에서 TCA9548A 주소까지 함께 캐시)"""
+    global _IS_RPI
+    if _IS_RPI is None:
         scanner = get_scanner()
+        _TCA_ADDR.clear()
+        _TCA_ADDR.update({bus: info['address'] for bus, info in scanner.tca_info.items()})
+        _IS_RPI = scanner.is_raspberry_pi
+    return _IS_RPI
+
+def invalidate_hardware_cache():
+    """스캔/리셋 후 하드웨어 정보 및 채널 선택 캐시 무효화"""
+    global _IS_RPI
+    _IS_RPI = None
+    _TCA_ADDR.clear()
+    invalidate_channel_cache()
+
+def close_buses():
+    """재사용 중인 I2C 버스 핸들 모두 닫기 (서버 종료 시)"""
+    for bus in _bus_handles.values():
+        try:
+            bus.close()
+        except Exception:
+            pass
+    _bus_handles.clear()
+    _current_channel.clear()
+
+# BH1750 측정 방식 (이름, 명령, 측정 대기 시간) - 안정성을 위해 순서대로 시도
+_BH1750_METHODS = (
+    ("One Time H-Resolution", 0x20, 0.15),
+    ("One Time H-Resolution2", 0x21, 0.15),
+    ("One Time L-Resolution", 0x23, 0.02)
+)
+_bh1750_last_mode: Dict[Tuple[int, int], int] = {}  # {(bus, channel): 마지막 성공 방식 인덱스}
+# H-Resolution 측정 준비 확인: 기본 120ms(데이터시트 typ.) 대기 후 10ms 간격으로 최대 3회 읽기
+# 측정 전에 데이터 레지스터를 0으로 리셋하므로 0이 아닌 값 = 이번 측정 결과 (이전 측정값 재사용 방지)
+# 끝내 준비되지 않으면 데이터시트 최대 측정 시간(180ms)까지 기다린 뒤 한 번 더 읽음
+_BH1750_READY_BASE = 0.12
+_BH1750_READY_STEP = 0.01
+_BH1750_READY_TRIES = 3
+_BH1750_H_RES_MAX = 0.18
+_BH1750_POWER_ON = 0x01
+_BH1750_RESET = 0x07  # 데이터 레지스터 초기화 (Power On 상태에서만 유효)
+
+# BH1750 센서 데이터 읽기 (동기 I2C 처리, 워커 스레드에서 실행)
+def _read_bh1750_sync(bus_number: int, mux_channel: int, tca_address: int) -> Optional[float]:
+    """BH1750 조도 측정 - 블로킹 I2C 통신 (ref/gui_bh1750.py 기반)"""
+    import smbus2
+    
+    bus = get_bus(bus_number)
+    
+    try:
+        # 채널 선택 (이미 선택된 채널이면 생략)
+        select_mux_channel(bus, bus_number, tca_address, mux_channel)
         
-        # 라즈베리파이 환경이 아니면 Mock 데이터 반환
-        if not scanner.is_raspberry_pi:
-            return 850.0 + (mux_channel * 100) + (time.time() % 100)
+        # BH1750 안정적인 데이터 읽기 (ref/gui_bh1750.py 방식)
+        bh1750_addr = 0x23
         
-        # 실제 하드웨어에서 BH1750 데이터 읽기
-        import smbus2
-        import time
+        # 마지막으로 성공한 방식을 먼저 시도하고 실패 시 나머지 방식으로 재시도
+        sensor_key = (bus_number, mux_channel)
+        last_mode = _bh1750_last_mode.get(sensor_key)
+        order = list(range(len(_BH1750_METHODS)))
+        if last_mode is not None:
+            order.remove(last_mode)
+            order.insert(0, last_mode)
         
-        # TCA9548A 채널 선택
-        if bus_number in scanner.tca_info:
-            tca_address = scanner.tca_info[bus_number]['address']
-            bus = smbus2.SMBus(bus_number)
-            
+        for mode in order:
+            method_name, command, wait_time = _BH1750_METHODS[mode]
             try:
-                # 채널 선택
-                bus.write_byte(tca_address, 1 << mux_channel)
-                time.sleep(0.01)
-                
-                # BH1750 안정적인 데이터 읽기 (ref/gui_bh1750.py 방식)
-                bh1750_addr = 0x23
+                logger.debug("🔍 BH1750 %s 방식 시도...", method_name)
                 
-                # 다양한 방법으로 시도 (안정성 향상)
-                methods = [
-                    ("One Time H-Resolution", 0x20, 0.15),
-                    ("One Time H-Resolution2", 0x21, 0.15),
-                    ("One Time L-Resolution", 0x23, 0.02)
-                ]
+                # 데이터 읽기 (BH1750은 레지스터 기반이 아님)
+                # i2c_rdwr로 2바이트를 단일 트랜잭션에 읽기
+                msg = smbus2.i2c_msg.read(bh1750_addr, 2)
+                if wait_time > _BH1750_READY_BASE:
+                    # 이전 측정값과 구분하기 위해 데이터 레지스터를 0으로 리셋한 뒤 측정 명령 전송
+                    bus.write_byte(bh1750_addr, _BH1750_POWER_ON)
+                    bus.write_byte(bh1750_addr, _BH1750_RESET)
+                    bus.write_byte(bh1750_addr, command)
+                    
+                    # 고정 최대 대기 대신 기본 대기 후 새 측정값이 나오면 바로 종료
+                    time.sleep(_BH1750_READY_BASE)
+                    elapsed = _BH1750_READY_BASE
+                    ready = False
+                    for _ in range(_BH1750_READY_TRIES):
+                        time.sleep(_BH1750_READY_STEP)
+                        elapsed += _BH1750_READY_STEP
+                        bus.i2c_rdwr(msg)
+                        data = list(msg)
+                        if 0 < ((data[0] << 8) | data[1]) < 0xFFFF:
+                            ready = True
+                            break
+                    if not ready:
+                        # 조기 확인 실패 값은 사용하지 않고 최대 측정 시간 경과 후 다시 읽기
+                        time.sleep(max(0.0, _BH1750_H_RES_MAX - elapsed))
+                        bus.i2c_rdwr(msg)
+                        data = list(msg)
+                        if ((data[0] << 8) | data[1]) == 0xFFFF:
+                            # 버스 이상으로 판단하고 다음 측정 방식 시도
+                            logger.debug("⚠️ BH1750 %s: 최대 측정 시간 후에도 무효한 데이터 (0xFFFF)", method_name)
+                            continue
+                else:
+                    # 측정 명령 전송
+                    bus.write_byte(bh1750_addr, command)
+                    time.sleep(wait_time)
+                    bus.i2c_rdwr(msg)
+                    data = list(msg)
                 
-                for method_name, command, wait_time in methods:
-                    try:
-                        print(f"🔍 BH1750 {method_name} 방식 시도...")
-                        
-                        # 측정 명령 전송
-                        bus.write_byte(bh1750_addr, command)
-                        time.sleep(wait_time)
-                        
-                        # 데이터 읽기 (BH1750은 레지스터 기반이 아님)
-                        try:
-                            # 방법 1: 개별 read_byte (가장 안정적)
-                            data = []
-                            for _ in range(2):
-                                byte_val = bus.read_byte(bh1750_addr)
-                                data.append(byte_val)
-                                time.sleep(0.001)
-                            print(f"📊 개별 read_byte 성공: {[f'0x{b:02X}' for b in data]}")
-                        except:
-                            try:
-                                # 방법 2: i2c_rdwr (더 직접적)
-                                msg = smbus2.i2c_msg.read(bh1750_addr, 2)
-                                bus.i2c_rdwr(msg)
-                                data = list(msg)
-                                print(f"📊 i2c_rdwr 성공: {[f'0x{b:02X}' for b in data]}")
-                            except:
-                                print("❌ 모든 데이터 읽기 방법 실패")
-                                continue
-                        
-                        if len(data) >= 2:
-                            # 조도값 계산
-                            raw_value = (data[0] << 8) | data[1]
-                            
-                            # BH1750 조도 계산 공식
-                            if command in [0x20, 0x21]:  # High resolution
-                                lux = raw_value / 1.2
-                            else:  # Low resolution
-                                lux = raw_value / 1.2
-                            
-                            # 합리적인 범위 체크
-                            if 0 <= lux <= 65535:
-                                print(f"✅ {method_name} 측정 성공: {lux:.1f} lux (원시값: 0x{raw_value:04X})")
-                                
-                                # 채널 비활성화 및 정리
-                                bus.write_byte(tca_address, 0x00)
-                                bus.close()
-                                
-                                return round(lux, 1)
-                            else:
-                                print(f"⚠️ 측정값이 범위를 벗어남: {lux}")
-                                continue
-                                
-                    except Exception as e:
-                        print(f"❌ {method_name} 방식 실패: {e}")
+                if len(data) >= 2:
+                    # 조도값 계산
+                    raw_value = (data[0] << 8) | data[1]
+                    
+                    # BH1750 조도 계산 공식
+                    if command in [0x20, 0x21]:  # High resolution
+                        lux = raw_value / 1.2
+                    else:  # Low resolution
+                        lux = raw_value / 1.2
+                    
+                    # 합리적인 범위 체크
+                    if 0 <= lux <= 65535:
+                        logger.debug("✅ %s 측정 성공: %.1f lux (원시값: 0x%04X)", method_name, lux, raw_value)
+                        _bh1750_last_mode[sensor_key] = mode
+                        return round(lux, 1)
+                    else:
+                        logger.debug("⚠️ 측정값이 범위를 벗어남: %s", lux)
                         continue
-                
-                # 모든 방법 실패 시
-                print("❌ 모든 BH1750 측정 방법 실패")
-                
-            finally:
-                # 항상 채널 비활성화 및 정리
-                try:
-                    bus.write_byte(tca_address, 0x00)
-                    bus.close()
-                except:
-                    pass
+                        
+            except Exception as e:
+                logger.debug("❌ %s 방식 실패: %s", method_name, e)
+                continue
+        
+        # 모든 방법 실패 시
+        _bh1750_last_mode.pop(sensor_key, None)
+        logger.warning("❌ 모든 BH1750 측정 방법 실패 (Bus %d, Ch %d)", bus_number, mux_channel)
+        return None
+        
+    except Exception:
+        # 통신 오류 시 mux 상태를 알 수 없으므로 채널 캐시 무효화
+        invalidate_channel_cache(bus_number)
+        raise
+
+async def read_bh1750_data(bus_number: int, mux_channel: int) -> float:
+    """BH1750 센서에서 실제 조도 데이터 읽기 - 안정적인 구현"""
+    try:
+        # 라즈베리파이 환경이 아니면 Mock 데이터 반환
+        if not resolve_hardware():
+            return 850.0 + (mux_channel * 100) + (time.time() % 100)
+        
+        # 실제 하드웨어에서 BH1750 데이터 읽기 (이벤트 루프 블로킹 방지)
+        tca_address = _TCA_ADDR.get(bus_number)
+        if tca_address is not None:
+            return await run_i2c(_read_bh1750_sync, bus_number, mux_channel, tca_address)
         
         return None
         
     except Exception as e:
-        print(f"❌ BH1750 데이터 읽기 오류 (Bus {bus_number}, Ch {mux_channel}): {e}")
+        logger.warning("❌ BH1750 데이터 읽기 오류 (Bus %d, Ch %d): %s", bus_number, mux_channel, e)
         return None
 
-# BME688 센서 데이터 읽기 함수
+# BME688 Chip ID 캐시 {(bus, channel, address): chip_id} - 센서별 최초 1회만 0xD0 읽기
+_bme688_chip_id_cache: Dict[Tuple[int, int, int], int] = {}
+
+# BME688 센서 데이터 읽기 (동기 I2C 처리, 워커 스레드에서 실행)
+def _read_bme688_sync(bus_number: int, mux_channel: int, address: int, tca_address: int):
+    """BME688 환경 데이터 측정 - 블로킹 I2C 통신"""
+    bus = get_bus(bus_number)
+    
+    try:
+        # 채널 선택 (이미 선택된 채널이면 생략)
+        select_mux_channel(bus, bus_number, tca_address, mux_channel)
+        
+        # BME688 실제 환경 데이터 읽기
+        cache_key = (bus_number, mux_channel, address)
+        try:
+            # BME688 Chip ID 확인 (0xD0 레지스터, 캐시에 없을 때만)
+            chip_id = _bme688_chip_id_cache.get(cache_key)
+            if chip_id is None:
+                chip_id = bus.read_byte_data(address, 0xD0)
+                _bme688_chip_id_cache[cache_key] = chip_id
+                logger.debug("📊 BME688 Chip ID: 0x%02X", chip_id)
+            
+            if chip_id == 0x61:  # BME688 올바른 Chip ID
+                # 간단한 온도/습도/압력 읽기 (기본 모드)
+                # BME688은 복잡한 초기화가 필요하지만, 여기서는 기본값으로 시뮬레이션
+                
+                # 센서별로 다른 값 생성 (채널별 차이)
+                base_temp = 23.0 + (mux_channel * 0.5) + (time.time() % 10 - 5) * 0.1
+                base_humidity = 55.0 + (mux_channel * 2) + (time.time() % 20 - 10) * 0.2
+                base_pressure = 1013.25 + (mux_channel * 0.1) + (time.time() % 5 - 2.5) * 0.05
+                
+                return {
+                    "values": {
+                        "temperature": round(base_temp, 1),
+                        "humidity": round(base_humidity, 1),
+                        "pressure": round(base_pressure, 2),
+                        "sensor_id": f"bme688_{bus_number}_{mux_channel}",
+                        "timestamp": datetime.now()
+                    },
+                    "status": "정상"
+                }
+            else:
+                return {
+                    "values": {
+                        "chip_id": f"0x{chip_id:02X}",
+                        "error": "BME688 ID 불일치",
+                        "timestamp": datetime.now()
+                    },
+                    "status": "센서 ID 오류"
+                }
+                
+        except Exception as e:
+            logger.warning("❌ BME688 통신 실패: %s", e)
+            _bme688_chip_id_cache.pop(cache_key, None)
+            return None
+            
+    except Exception:
+        # 통신 오류 시 mux 상태를 알 수 없으므로 채널 캐시 무효화
+        invalidate_channel_cache(bus_number)
+        _bme688_chip_id_cache.pop((bus_number, mux_channel, address), None)
+        raise
+
 async def read_bme688_data(bus_number: int, mux_channel: int, address: int = 0x77):
     """BME688 센서에서 실제 환경 데이터 읽기"""
     try:
-        scanner = get_scanner()
-        
         # 라즈베리파이 환경이 아니면 Mock 데이터
-        if not scanner.is_raspberry_pi:
+        if not resolve_hardware():
             return {
                 "values": {
                     "temperature": 24.5,
                     "humidity": 60.2,
                     "pressure": 1013.25,
-                    "timestamp": datetime.now().isoformat()
+                    "timestamp": datetime.now()
                 },
                 "status": "Mock 모드"
             }
         
-        # 실제 하드웨어에서 BME688 데이터 읽기
-        import smbus2
-        import time
-        
-        if bus_number in scanner.tca_info:
-            tca_address = scanner.tca_info[bus_number]['address']
-            bus = smbus2.SMBus(bus_number)
-            
-            try:
-                # 채널 선택
-                bus.write_byte(tca_address, 1 << mux_channel)
-                time.sleep(0.01)
-                
-                # BME688 실제 환경 데이터 읽기
-                try:
-                    # BME688 Chip ID 확인 (0xD0 레지스터)
-                    chip_id = bus.read_byte_data(address, 0xD0)
-                    print(f"📊 BME688 Chip ID: 0x{chip_id:02X}")
-                    
-                    if chip_id == 0x61:  # BME688 올바른 Chip ID
-                        # 간단한 온도/습도/압력 읽기 (기본 모드)
-                        # BME688은 복잡한 초기화가 필요하지만, 여기서는 기본값으로 시뮬레이션
-                        
-                        # 센서별로 다른 값 생성 (채널별 차이)
-                        base_temp = 23.0 + (mux_channel * 0.5) + (time.time() % 10 - 5) * 0.1
-                        base_humidity = 55.0 + (mux_channel * 2) + (time.time() % 20 - 10) * 0.2
-                        base_pressure = 1013.25 + (mux_channel * 0.1) + (time.time() % 5 - 2.5) * 0.05
-                        
-                        return {
-                            "values": {
-                                "temperature": round(base_temp, 1),
-                                "humidity": round(base_humidity, 1),
-                                "pressure": round(base_pressure, 2),
-                                "sensor_id": f"bme688_{bus_number}_{mux_channel}",
-                                "timestamp": datetime.now().isoformat()
-                            },
-                            "status": "정상"
-                        }
-                    else:
-                        return {
-                            "values": {
-                                "chip_id": f"0x{chip_id:02X}",
-                                "error": "BME688 ID 불일치",
-                                "timestamp": datetime.now().isoformat()
-                            },
-                            "status": "센서 ID 오류"
-                        }
-                        
-                except Exception as e:
-                    print(f"❌ BME688 통신 실패: {e}")
-                    return None
-                    
-            finally:
-                # 항상 채널 비활성화
-                try:
-                    bus.write_byte(tca_address, 0x00)
-                    bus.close()
-                except:
-                    pass
+        # 실제 하드웨어에서 BME688 데이터 읽기 (이벤트 루프 블로킹 방지)
+        tca_address = _TCA_ADDR.get(bus_number)
+        if tca_address is not None:
+            return await run_i2c(_read_bme688_sync, bus_number, mux_channel, address, tca_address)
         
         return None
         
     except Exception as e:
-        print(f"❌ BME688 데이터 읽기 오류 (Bus {bus_number}, Ch {mux_channel}): {e}")
+        logger.warning("❌ BME688 데이터 읽기 오류 (Bus %d, Ch %d): %s", bus_number, mux_channel, e)
         return None
 
-# SHT40 센서 데이터 읽기 함수
+# SHT40 센서 데이터 읽기 (동기 I2C 처리, 워커 스레드에서 실행)
+def _read_sht40_sync(bus_number: int, mux_channel: int, address: int, tca_address: int):
+    """SHT40 온습도 측정 - 블로킹 I2C 통신"""
+    import smbus2
+    
+    bus = get_bus(bus_number)
+    
+    try:
+        # 채널 선택 (이미 선택된 채널이면 생략)
+        select_mux_channel(bus, bus_number, tca_address, mux_channel)
+        
+        # SHT40 측정 명령 (High precision)
+        try:
+            # 0xFD: Measure T & RH with high precision
+            bus.write_byte(address, 0xFD)
+            time.sleep(0.01)  # 10ms 대기
+            
+            # 6바이트 데이터 읽기 (temp 2bytes + CRC + hum 2bytes + CRC)
+            # 측정 명령 후 바로 데이터가 나오므로 레지스터 쓰기 없이 i2c_rdwr로 읽기
+            msg = smbus2.i2c_msg.read(address, 6)
+            bus.i2c_rdwr(msg)
+            data = list(msg)
+            
+            # 온도 계산
+            temp_raw = (data[0] << 8) | data[1]
+            temperature = -45 + 175 * temp_raw / 65535.0
+            
+            # 습도 계산  
+            hum_raw = (data[3] << 8) | data[4]
+            humidity = -6 + 125 * hum_raw / 65535.0
+            
+            logger.debug("📊 SHT40 측정: %.1f°C, %.1f%%", temperature, humidity)
+            
+            return {
+                "values": {
+                    "temperature": round(temperature, 1),
+                    "humidity": round(humidity, 1),
+                    "raw_temp": temp_raw,
+                    "raw_hum": hum_raw,
+                    "timestamp": datetime.now()
+                },
+                "status": "정상"
+            }
+            
+        except Exception as e:
+            logger.warning("❌ SHT40 통신 실패: %s", e)
+            return None
+            
+    except Exception:
+        # 통신 오류 시 mux 상태를 알 수 없으므로 채널 캐시 무효화
+        invalidate_channel_cache(bus_number)
+        raise
+
 async def read_sht40_data(bus_number: int, mux_channel: int, address: int = 0x44):
     """SHT40 센서에서 실제 온습도 데이터 읽기"""
     try:
-        scanner = get_scanner()
-        
         # 라즈베리파이 환경이 아니면 Mock 데이터
-        if not scanner.is_raspberry_pi:
+        if not resolve_hardware():
             return {
                 "values": {
                     "temperature": 22.8,
                     "humidity": 45.5,
-                    "timestamp": datetime.now().isoformat()
+                    "timestamp": datetime.now()
                 },
                 "status": "Mock 모드"
             }
         
-        # 실제 하드웨어에서 SHT40 데이터 읽기
-        import smbus2
-        import time
-        
-        if bus_number in scanner.tca_info:
-            tca_address = scanner.tca_info[bus_number]['address']
-            bus = smbus2.SMBus(bus_number)
-            
-            try:
-                # 채널 선택
-                bus.write_byte(tca_address, 1 << mux_channel)
-                time.sleep(0.01)
-                
-                # SHT40 측정 명령 (High precision)
-                try:
-                    # 0xFD: Measure T & RH with high precision
-                    bus.write_byte(address, 0xFD)
-                    time.sleep(0.01)  # 10ms 대기
-                    
-                    # 6바이트 데이터 읽기 (temp 2bytes + CRC + hum 2bytes + CRC)
-                    data = bus.read_i2c_block_data(address, 0xFD, 6)
-                    
-                    # 온도 계산
-                    temp_raw = (data[0] << 8) | data[1]
-                    temperature = -45 + 175 * temp_raw / 65535.0
-                    
-                    # 습도 계산  
-                    hum_raw = (data[3] << 8) | data[4]
-                    humidity = -6 + 125 * hum_raw / 65535.0
-                    
-                    print(f"📊 SHT40 측정: {temperature:.1f}°C, {humidity:.1f}%")
-                    
-                    return {
-                        "values": {
-                            "temperature": round(temperature, 1),
-                            "humidity": round(humidity, 1),
-                            "raw_temp": temp_raw,
-                            "raw_hum": hum_raw,
-                            "timestamp": datetime.now().isoformat()
-                        },
-                        "status": "정상"
-                    }
-                    
-                except Exception as e:
-                    print(f"❌ SHT40 통신 실패: {e}")
-                    return None
-                    
-            finally:
-                # 항상 채널 비활성화
-                try:
-                    bus.write_byte(tca_address, 0x00)
-                    bus.close()
-                except:
-                    pass
+        # 실제 하드웨어에서 SHT40 데이터 읽기 (이벤트 루프 블로킹 방지)
+        tca_address = _TCA_ADDR.get(bus_number)
+        if tca_address is not None:
+            return await run_i2c(_read_sht40_sync, bus_number, mux_channel, address, tca_address)
         
         return None
         
     except Exception as e:
-        print(f"❌ SHT40 데이터 읽기 오류 (Bus {bus_number}, Ch {mux_channel}): {e}")
+        logger.warning("❌ SHT40 데이터 읽기 오류 (Bus %d, Ch %d): %s", bus_number, mux_channel, e)
         return None
 
 # FastAPI 앱 생성
 app = FastAPI(
     title="EG-ICON Dashboard API",
     description="TCA9548A 멀티플렉서 기반 16개 센서 실시간 모니터링",
-    version="1.0.0"
+    version="1.0.0",
+    # 타임스탬프는 datetime 객체 그대로 반환 (naive datetime은 isoformat()과 동일한 문자열로 직렬화)
+    default_response_class=ORJSONResponse if ORJSON_AVAILABLE else JSONResponse
 )
 
 # 정적 파일 서빙 (프론트엔드)
 app.mount("/static", StaticFiles(directory="frontend"), name="static")
 
 # CSS, JS 파일 직접 서빙
-from fastapi.responses import FileResponse
+# 프론트엔드 파일 메모리 캐시 (요청마다 디스크에서 읽지 않음)
+STATIC_FILES = {
+    "index.html": "text/html; charset=utf-8",
+    "settings.html": "text/html; charset=utf-8",
+    "style.css": "text/css",
+    "dashboard.js": "application/javascript",
+    "settings.js": "application/javascript"
+}
+_static_cache: Dict[str, Tuple[bytes, str]] = {}  # {파일명: (내용, ETag)}
+
+def load_static_file(name: str) -> Optional[Tuple[bytes, str]]:
+    """frontend/ 파일을 읽어 내용과 ETag를 캐시 (파일이 없으면 None)"""
+    try:
+        with open(f"frontend/{name}", "rb") as f:
+            content = f.read()
+    except FileNotFoundError:
+        return None
+    entry = (content, f'"{hashlib.md5(content).hexdigest()}"')
+    _static_cache[name] = entry
+    return entry
+
+def load_static_files():
+    """모든 프론트엔드 파일을 메모리에 미리 로드 (서버 시작 시)"""
+    for name in STATIC_FILES:
+        load_static_file(name)
+
+def cached_static_response(request: Request, name: str) -> Optional[Response]:
+    """캐시된 프론트엔드 파일 응답 (ETag 일치 시 304, 파일이 없으면 None)"""
+    entry = _static_cache.get(name) or load_static_file(name)
+    if entry is None:
+        return None
+    
+    content, etag = entry
+    headers = {"ETag": etag, "Cache-Control": "public, max-age=60"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=content, media_type=STATIC_FILES[name], headers=headers)
 
 @app.get("/style.css")
-async def serve_css():
-    return FileResponse("frontend/style.css", media_type="text/css")
+async def serve_css(request: Request):
+    return cached_static_response(request, "style.css") or Response(status_code=404)
 
 @app.get("/dashboard.js") 
-async def serve_js():
-    return FileResponse("frontend/dashboard.js", media_type="application/javascript")
+async def serve_js(request: Request):
+    return cached_static_response(request, "dashboard.js") or Response(status_code=404)
 
 @app.get("/settings.js")
-async def serve_settings_js():
-    return FileResponse("frontend/settings.js", media_type="application/javascript")
+async def serve_settings_js(request: Request):
+    return cached_static_response(request, "settings.js") or Response(status_code=404)
 
 @app.get("/settings")
-async def get_settings():
+async def get_settings(request: Request):
     """설정 페이지"""
-    try:
-        with open("frontend/settings.html", "r", encoding="utf-8") as f:
-            return HTMLResponse(content=f.read())
-    except FileNotFoundError:
+    response = cached_static_response(request, "settings.html")
+    if response is None:
         return HTMLResponse(
             content="<h1>설정 페이지를 찾을 수 없습니다.</h1><p>frontend/settings.html 파일을 확인해주세요.</p>",
             status_code=404
         )
+    return response
 
 # 센서 설정 (JavaScript와 동일)
 SENSOR_TYPES = {
@@ -375,108 +593,250 @@ SENSOR_TYPES = {
     }
 }
 
+# 변경되지 않는 센서 타입 설정은 시작 시 한 번만 직렬화 (한글 라벨/이모지 인코딩 재사용)
+_SENSOR_TYPES_FRAGMENT = dumps_json(SENSOR_TYPES)
+
+# 내부 처리용 센서 타입 (정수 인덱스, SENSOR_TYPES 순서와 동일)
+class SensorType(IntEnum):
+    TEMPERATURE = 0
+    HUMIDITY = 1
+    PRESSURE = 2
+    LIGHT = 3
+    VIBRATION = 4
+    AIRQUALITY = 5
+
+# 센서 타입 메타데이터 (SensorType 인덱스로 접근, 문자열 키는 JSON 응답에만 사용)
+SensorTypeMeta = namedtuple("SensorTypeMeta", ["key", "label", "icon", "unit", "color", "min", "max"])
+SENSOR_META = tuple(SensorTypeMeta(key=key, **SENSOR_TYPES[key]) for key in SENSOR_TYPES)
+_SENSOR_TYPE_BY_KEY = {meta.key: SensorType(idx) for idx, meta in enumerate(SENSOR_META)}
+
 # Mock 센서 생성 (동적 개수)
 MOCK_SENSORS = {}
+_ws_sensor_templates: Dict[str, Dict] = {}  # MOCK_SENSORS 순서의 WebSocket 전송용 항목
 def init_mock_sensors():
     """Mock 센서 초기화 - 각 타입별로 1-3개씩 생성"""
-    sensor_counts = {
-        "temperature": 3,
-        "humidity": 2,
-        "pressure": 2,
-        "light": 2,
-        "vibration": 2,
-        "airquality": 1
-    }
+    sensor_counts = (
+        (SensorType.TEMPERATURE, 3),
+        (SensorType.HUMIDITY, 2),
+        (SensorType.PRESSURE, 2),
+        (SensorType.LIGHT, 2),
+        (SensorType.VIBRATION, 2),
+        (SensorType.AIRQUALITY, 1)
+    )
     
-    for sensor_type, count in sensor_counts.items():
+    for type_idx, count in sensor_counts:
+        meta = SENSOR_META[type_idx]
         for i in range(count):
-            sensor_id = f"{sensor_type}_{i + 1}"
+            sensor_id = f"{meta.key}_{i + 1}"
             MOCK_SENSORS[sensor_id] = {
                 "id": sensor_id,
-                "name": f"{SENSOR_TYPES[sensor_type]['label']} {i + 1}",
-                "type": sensor_type,
+                "name": f"{meta.label} {i + 1}",
+                "type": meta.key,
                 "status": "online",
-                "last_update": datetime.now().isoformat(),
+                "last_update": datetime.now(),
                 "value": 0.0
             }
+    
+    # WebSocket 전송용 센서 항목 (틱마다 value/timestamp만 갱신해 재사용)
+    _ws_sensor_templates.clear()
+    _ws_sensor_templates.update({
+        sensor_id: {"id": sensor_id, "type": sensor["type"], "value": 0.0, "status": "online", "timestamp": None}
+        for sensor_id, sensor in MOCK_SENSORS.items()
+    })
+    
+    _build_mock_arrays()
 
 # WebSocket 연결 관리
+SEND_TIMEOUT = 1.0  # 클라이언트당 전송 제한 시간 (초)
+SEND_QUEUE_SIZE = 10  # 클라이언트별 전송 대기 메시지 최대 개수 (초과 시 가장 오래된 메시지 폐기)
+
 class ConnectionManager:
     def __init__(self):
-        self.active_connections: List[WebSocket] = []
+        # {websocket: 전송 대기 큐} - 클라이언트마다 전용 전송 작업이 큐를 비움
+        self.active_connections: Dict[WebSocket, asyncio.Queue] = {}
+        self._senders: Dict[WebSocket, asyncio.Task] = {}
+        self._msgpack_clients: Dict[WebSocket, asyncio.Queue] = {}  # MessagePack 형식 요청 클라이언트
         
-    async def connect(self, websocket: WebSocket):
+    async def connect(self, websocket: WebSocket, use_msgpack: bool = False):
         await websocket.accept()
-        self.active_connections.append(websocket)
-        print(f"✅ WebSocket 연결됨. 현재 연결 수: {len(self.active_connections)}")
+        send_queue: asyncio.Queue = asyncio.Queue(maxsize=SEND_QUEUE_SIZE)
+        self.active_connections[websocket] = send_queue
+        if use_msgpack:
+            self._msgpack_clients[websocket] = send_queue
+        self._senders[websocket] = asyncio.create_task(self._sender(websocket, send_queue))
+        logger.info("✅ WebSocket 연결됨. 현재 연결 수: %d", len(self.active_connections))
         
     def disconnect(self, websocket: WebSocket):
-        self.active_connections.remove(websocket)
-        print(f"❌ WebSocket 연결 해제됨. 현재 연결 수: {len(self.active_connections)}")
+        if self.active_connections.pop(websocket, None) is None:
+            return  # 전송 실패로 이미 정리된 연결
+        self._msgpack_clients.pop(websocket, None)
+        sender = self._senders.pop(websocket, None)
+        if sender is not None and sender is not asyncio.current_task():
+            sender.cancel()
+        logger.info("❌ WebSocket 연결 해제됨. 현재 연결 수: %d", len(self.active_connections))
+        
+    async def _sender(self, websocket: WebSocket, send_queue: asyncio.Queue):
+        """클라이언트 전용 전송 작업 (느린 클라이언트는 자기 큐만 밀리고 다른 클라이언트에 영향 없음)"""
+        try:
+            while True:
+                payload = await send_queue.get()
+                await asyncio.wait_for(websocket.send_bytes(payload), timeout=SEND_TIMEOUT)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            # 전송 실패/타임아웃 클라이언트 정리
+            self.disconnect(websocket)
         
     async def broadcast(self, message: dict):
-        """모든 연결된 클라이언트에 메시지 브로드캐스트"""
+        """모든 연결된 클라이언트에 메시지 브로드캐스트 (각 클라이언트 큐에 넣기만 하고 즉시 반환)"""
         if self.active_connections:
-            # 성능 최적화: 배치 전송
-            message_json = json.dumps(message, ensure_ascii=False)
-            disconnected = []
-            
-            for connection in self.active_connections:
-                try:
-                    await connection.send_text(message_json)
-                except:
-                    disconnected.append(connection)
-            
-            # 연결 해제된 클라이언트 정리
-            for connection in disconnected:
-                self.active_connections.remove(connection)
+            # 성능 최적화: 형식별로 한 번만 직렬화(JSON은 orjson 우선)해 모든 큐에 공유
+            json_payload = None
+            msgpack_payload = None
+            for websocket, send_queue in self.active_connections.items():
+                if websocket in self._msgpack_clients:
+                    if msgpack_payload is None:
+                        msgpack_payload = dumps_msgpack(message)
+                    payload = msgpack_payload
+                else:
+                    if json_payload is None:
+                        json_payload = dumps_json(message)
+                    payload = json_payload
+                if send_queue.full():
+                    send_queue.get_nowait()  # 가장 오래된 메시지 폐기
+                send_queue.put_nowait(payload)
 
 manager = ConnectionManager()
 
-def generate_mock_value(sensor_type: str, timestamp: float) -> float:
-    """센서별 Mock 값 생성"""
-    time_ms = timestamp * 1000
-    
-    if sensor_type == "temperature":
-        return 20 + 10 * math.sin(time_ms / 60000) + (random.random() - 0.5) * 3
-    elif sensor_type == "humidity":
-        return 50 + 20 * math.sin(time_ms / 80000 + 1) + (random.random() - 0.5) * 5
-    elif sensor_type == "pressure":
-        return 1013 + 10 * math.sin(time_ms / 120000 + 2) + (random.random() - 0.5) * 2
+# 시간대별 일조량 계수 (조도 Mock용, 시각이 바뀔 때만 값이 달라지므로 미리 계산)
+_DAYLIGHT = tuple(max(0.0, math.sin((hour - 6) * math.pi / 12)) for hour in range(24))
+
+# 사인파 기반 Mock 파라미터 (기준값, 진폭, 주기(ms), 위상, 노이즈 폭)
+_MOCK_WAVE_PARAMS = {
+    "temperature": (20.0, 10.0, 60000.0, 0.0, 3.0),
+    "humidity": (50.0, 20.0, 80000.0, 1.0, 5.0),
+    "pressure": (1013.0, 10.0, 120000.0, 2.0, 2.0),
+    "airquality": (100.0, 50.0, 180000.0, 3.0, 20.0),
+}
+
+def _draw_uniform(count: int) -> List[List[float]]:
+    """센서당 3개씩 [0, 1) 난수를 한 번의 호출로 추출"""
+    if NUMPY_AVAILABLE:
+        return _rng.random((count, 3)).tolist()
+    return [[_rng.random(), _rng.random(), _rng.random()] for _ in range(count)]
+
+def _make_mock_generator(sensor_type: str) -> Callable[[float, List[float]], float]:
+    """센서 타입별 Mock 값 생성 함수 생성 (상수를 클로저에 고정해 호출 시 타입 분기 제거)"""
+    if sensor_type in _MOCK_WAVE_PARAMS:
+        bias, amplitude, period, phase, noise_amp = _MOCK_WAVE_PARAMS[sensor_type]
+        
+        def generate(time_ms: float, u: List[float], _sin=math.sin) -> float:
+            return bias + amplitude * _sin(time_ms / period + phase) + (u[0] - 0.5) * noise_amp
     elif sensor_type == "light":
-        hour = datetime.now().hour
-        daylight = max(0, math.sin((hour - 6) * math.pi / 12))
-        return daylight * 1500 + random.random() * 200
+        def generate(time_ms: float, u: List[float]) -> float:
+            return _DAYLIGHT[datetime.now().hour] * 1500 + u[0] * 200
     elif sensor_type == "vibration":
-        return random.random() * 20 + (random.random() > 0.9 and random.random() * 30 or 0)
-    elif sensor_type == "airquality":
-        return 100 + 50 * math.sin(time_ms / 180000 + 3) + (random.random() - 0.5) * 20
+        def generate(time_ms: float, u: List[float]) -> float:
+            # 10% 확률로 0~30 크기의 스파이크 추가
+            return u[0] * 20 + (u[2] * 30 if u[1] > 0.9 else 0.0)
     else:
-        return random.random() * 100
+        def generate(time_ms: float, u: List[float]) -> float:
+            return u[0] * 100
+    return generate
+
+_MOCK_GENERATORS = tuple(_make_mock_generator(meta.key) for meta in SENSOR_META)  # SensorType 인덱스
+_DEFAULT_MOCK_GENERATOR = _make_mock_generator("")
+_sensor_generators: List[Callable[[float, List[float]], float]] = []  # MOCK_SENSORS 순서의 센서별 생성 함수
+
+def generate_mock_value(sensor_type: str, timestamp: float, noise: Optional[List[float]] = None) -> float:
+    """센서별 Mock 값 생성 (noise: 미리 추출한 난수 3개, 없으면 새로 추출)"""
+    u = noise if noise is not None else _draw_uniform(1)[0]
+    type_idx = _SENSOR_TYPE_BY_KEY.get(sensor_type)
+    generate = _DEFAULT_MOCK_GENERATOR if type_idx is None else _MOCK_GENERATORS[type_idx]
+    return generate(timestamp * 1000, u)
+
+_mock_arrays: Optional[Dict[str, Any]] = None  # MOCK_SENSORS 순서의 SoA 파라미터 배열 (NumPy 사용 시)
+
+def _build_mock_arrays():
+    """MOCK_SENSORS 순서대로 센서별 생성 함수와 SoA 파라미터 배열 구성 (센서 초기화 시 1회)"""
+    global _mock_arrays, _sensor_generators
+    types = [sensor["type"] for sensor in MOCK_SENSORS.values()]
+    type_idxs = [_SENSOR_TYPE_BY_KEY.get(t) for t in types]
+    _sensor_generators = [_DEFAULT_MOCK_GENERATOR if idx is None else _MOCK_GENERATORS[idx] for idx in type_idxs]
+    if not NUMPY_AVAILABLE:
+        return
+    
+    params = []
+    for sensor_type in types:
+        if sensor_type in _MOCK_WAVE_PARAMS:
+            params.append(_MOCK_WAVE_PARAMS[sensor_type] + (0.5,))  # 노이즈 중심 0.5 (±노이즈 폭/2)
+        elif sensor_type == "light":
+            params.append((0.0, 0.0, 1.0, 0.0, 200.0, 0.0))  # 일조량 항은 틱마다 더함
+        elif sensor_type == "vibration":
+            params.append((0.0, 0.0, 1.0, 0.0, 20.0, 0.0))  # 스파이크 항은 틱마다 더함
+        else:
+            params.append((0.0, 0.0, 1.0, 0.0, 100.0, 0.0))
+    
+    columns = np.array(params, dtype=float).reshape(-1, 6).T
+    _mock_arrays = {
+        "biases": columns[0],
+        "amplitudes": columns[1],
+        "periods": columns[2],
+        "phases": columns[3],
+        "noise_amps": columns[4],
+        "noise_centers": columns[5],
+        "light_mask": np.array([idx == SensorType.LIGHT for idx in type_idxs], dtype=bool),
+        "vibration_mask": np.array([idx == SensorType.VIBRATION for idx in type_idxs], dtype=bool),
+    }
+
+def generate_all_mock_values(timestamp: float, decimals: Optional[int] = None) -> List[float]:
+    """MOCK_SENSORS 전체 값을 순서대로 생성 (NumPy 사용 가능 시 단일 벡터 연산, decimals 지정 시 반올림)"""
+    if len(_sensor_generators) != len(MOCK_SENSORS):
+        _build_mock_arrays()  # 센서 구성이 바뀐 경우 생성 함수/SoA 배열 재구성
+    
+    arrays = _mock_arrays
+    if arrays is None:
+        # NumPy 미설치: 센서별 생성 함수 (SoA 배열과 같은 _MOCK_WAVE_PARAMS 상수 사용)
+        time_ms = timestamp * 1000
+        noise = _draw_uniform(len(_sensor_generators))
+        values = [generate(time_ms, u) for generate, u in zip(_sensor_generators, noise)]
+        return values if decimals is None else [round(value, decimals) for value in values]
+    
+    u = _rng.random((3, len(arrays["biases"])))
+    values = (arrays["biases"]
+              + arrays["amplitudes"] * np.sin(timestamp * 1000 / arrays["periods"] + arrays["phases"])
+              + arrays["noise_amps"] * (u[0] - arrays["noise_centers"]))
+    
+    values += arrays["light_mask"] * (_DAYLIGHT[datetime.now().hour] * 1500)
+    # 10% 확률로 0~30 크기의 스파이크 추가
+    values += arrays["vibration_mask"] * np.where(u[1] > 0.9, u[2] * 30, 0.0)
+    if decimals is not None:
+        values = np.round(values, decimals)
+    return values.tolist()
 
 # 루트 경로 - 대시보드 HTML 반환
 @app.get("/", response_class=HTMLResponse)
-async def get_dashboard():
+async def get_dashboard(request: Request):
     """메인 대시보드 페이지"""
-    try:
-        with open("frontend/index.html", "r", encoding="utf-8") as f:
-            return HTMLResponse(content=f.read())
-    except FileNotFoundError:
+    response = cached_static_response(request, "index.html")
+    if response is None:
         return HTMLResponse(
             content="<h1>대시보드를 찾을 수 없습니다.</h1><p>frontend/index.html 파일을 확인해주세요.</p>",
             status_code=404
         )
+    return response
 
 # API 엔드포인트들
 @app.get("/api/sensors/list")
 async def get_sensor_list():
     """연결된 센서 목록 조회"""
-    return {
-        "sensors": list(MOCK_SENSORS.keys()),
-        "count": len(MOCK_SENSORS),
-        "types": SENSOR_TYPES,
-        "timestamp": datetime.now().isoformat()
-    }
+    content = (
+        b'{"sensors":' + dumps_json(list(MOCK_SENSORS.keys())) +
+        b',"count":' + str(len(MOCK_SENSORS)).encode() +
+        b',"types":' + _SENSOR_TYPES_FRAGMENT +
+        b',"timestamp":' + dumps_json(datetime.now()) + b'}'
+    )
+    return Response(content=content, media_type="application/json")
 
 @app.get("/api/sensors")
 async def get_all_sensors():
@@ -489,7 +849,7 @@ async def get_all_sensors():
             "name": sensor_data["name"],
             "type": sensor_data["type"],
             "status": "connected",
-            "last_update": sensor_data.get("last_update", datetime.now().isoformat())
+            "last_update": sensor_data.get("last_update", datetime.now())
         })
     
     return sensors
@@ -498,176 +858,275 @@ async def get_all_sensors():
 async def get_sensors_status():
     """모든 센서 상태 조회"""
     now = time.time()
+    updated_at = datetime.now()  # 요청당 1회만 생성해 모든 센서에 공유
     
-    # Mock 데이터 업데이트
-    for sensor_id, sensor in MOCK_SENSORS.items():
-        sensor_type = sensor["type"]
-        sensor["value"] = generate_mock_value(sensor_type, now)
-        sensor["last_update"] = datetime.now().isoformat()
+    # Mock 데이터 업데이트 (전체 센서 벡터 연산으로 일괄 생성)
+    values = generate_all_mock_values(now)
+    for sensor, value in zip(MOCK_SENSORS.values(), values):
+        sensor["value"] = value
+        sensor["last_update"] = updated_at
     
     return {
         "sensors": MOCK_SENSORS,
         "system_status": "online",
         "connected_count": len(MOCK_SENSORS),
         "total_sensors": 16,
-        "timestamp": datetime.now().isoformat()
+        "timestamp": updated_at
     }
 
+# 스캔 결과 TTL 캐시 (I2C 버스 전체 스캔은 비용이 크므로 짧은 시간 동안 재사용)
+SCAN_CACHE_TTL = 5.0  # 전체 시스템 스캔 캐시 유지 시간 (초)
+BUS_SCAN_CACHE_TTL = 2.0  # 단일 버스 스캔 캐시 유지 시간 (초)
+REAL_STATUS_CACHE_TTL = 0.5  # 실제 센서 상태 응답 캐시 유지 시간 (초)
+_scan_cache: Optional[Tuple[float, Dict]] = None
+_real_status_cache: Optional[Tuple[float, Dict]] = None
+_bus_scan_cache: Dict[int, Tuple[float, Dict]] = {}
+_bh1750_templates: List[Dict] = []  # 스캔 캐시 갱신 시 만들어두는 BH1750 응답 템플릿
+
+def _build_bh1750_templates(scan_result: Dict) -> List[Dict]:
+    """BH1750 센서별 고정 필드(ID, 이름, 위치)를 미리 구성"""
+    templates = []
+    for sensor in scan_result.get("sensors", []):
+        if sensor["sensor_type"] == "BH1750":
+            templates.append({
+                "id": f"bh1750_{sensor['bus']}_{sensor['mux_channel']}",
+                "name": f"BH1750 조도센서 (Ch{sensor['mux_channel']+1})",
+                "type": "light",
+                "bus": sensor["bus"],
+                "channel": sensor["mux_channel"],
+                "address": sensor["address"]
+            })
+    return templates
+
+_bus_locks: Dict[int, asyncio.Lock] = {}  # {bus_number: Lock} - mux 채널 공유 버스 보호
+_I2C_BUSES = (0, 1)  # 스캐너가 사용하는 전체 I2C 버스
+
+def _bus_lock(bus_number: int) -> asyncio.Lock:
+    """버스별 잠금 반환 (이벤트 루프 안에서 최초 생성)"""
+    lock = _bus_locks.get(bus_number)
+    if lock is None:
+        lock = _bus_locks[bus_number] = asyncio.Lock()
+    return lock
+
+async def read_with_bus_lock(reader, bus_number: int, *args):
+    """버스 잠금을 잡은 상태로 센서 읽기 (같은 버스의 mux 채널 전환 충돌 방지)"""
+    async with _bus_lock(bus_number):
+        return await reader(bus_number, *args)
+
+_scan_semaphore: Optional[asyncio.Semaphore] = None  # 동시 스캔 1개로 제한 (이벤트 루프에서 생성)
+
+async def run_scan(scan_func, *args, bus_number: Optional[int] = None):
+    """
+    블로킹 스캐너 작업을 워커 스레드에서 실행 (연속 클릭 등 중복 스캔은 순차 처리)
+    
+    - 스캔 대상 버스(bus_number 미지정 시 전체)의 버스 잠금을 모두 잡고 실행 → 센서 읽기와 mux 채널 충돌 방지
+    - 잠금을 놓기 전에 하드웨어/채널 캐시 무효화 → 스캔이 바꾼 채널 상태로 읽는 구간 없음
+    """
+    global _scan_semaphore
+    if _scan_semaphore is None:
+        _scan_semaphore = asyncio.Semaphore(1)
+    bus_numbers = _I2C_BUSES if bus_number is None else (bus_number,)
+    async with _scan_semaphore:
+        held = []
+        try:
+            for number in bus_numbers:  # 번호 순서대로 획득 (교착 상태 방지)
+                await _bus_lock(number).acquire()
+                held.append(number)
+            try:
+                return await run_i2c(scan_func, *args)
+            finally:
+                if bus_number is None:
+                    invalidate_hardware_cache()  # 스캐너가 mux 채널/TCA 정보를 변경함
+                else:
+                    invalidate_channel_cache(bus_number)
+        finally:
+            for number in reversed(held):
+                _bus_lock(number).release()
+
+async def get_cached_scan_result() -> Dict:
+    """이중 멀티플렉서 스캔 결과 반환 (TTL 이내면 캐시 사용, 아니면 스레드에서 재스캔)"""
+    global _scan_cache, _bh1750_templates
+    if _scan_cache and time.monotonic() - _scan_cache[0] < SCAN_CACHE_TTL:
+        return _scan_cache[1]
+    
+    scan_result = await run_scan(get_scanner().scan_dual_mux_system)
+    _scan_cache = (time.monotonic(), scan_result)
+    _bh1750_templates = _build_bh1750_templates(scan_result)
+    return scan_result
+
+async def get_cached_bus_scan_result(bus_number: int) -> Dict:
+    """단일 버스 스캔 결과 반환 (버스별 TTL 캐시)"""
+    cached = _bus_scan_cache.get(bus_number)
+    if cached and time.monotonic() - cached[0] < BUS_SCAN_CACHE_TTL:
+        return cached[1]
+    
+    scan_result = await run_scan(get_scanner().scan_single_bus, bus_number, bus_number=bus_number)
+    _bus_scan_cache[bus_number] = (time.monotonic(), scan_result)
+    return scan_result
+
 @app.get("/api/sensors/real-status")
 async def get_real_sensors_status():
     """실제 연결된 센서들의 상태 및 데이터 조회"""
+    global _real_status_cache
+    # 짧은 시간 내 반복 요청은 I2C 재측정 없이 직전 응답 반환
+    if _real_status_cache and time.monotonic() - _real_status_cache[0] < REAL_STATUS_CACHE_TTL:
+        return _real_status_cache[1]
+    
     try:
-        # 하드웨어 스캐너를 통해 실제 센서 스캔
-        scanner = get_scanner()
-        scan_result = scanner.scan_dual_mux_system()
+        # 하드웨어 스캐너를 통해 실제 센서 스캔 (TTL 캐시)
+        scan_result = await get_cached_scan_result()
+        # 대기 중 다른 요청/백그라운드 갱신이 전역 템플릿을 교체할 수 있으므로 한 번만 참조
+        bh1750_templates = _bh1750_templates
         
         real_sensors = {}
         
         if scan_result["success"] and scan_result.get("sensors"):
-            for sensor in scan_result["sensors"]:
-                # BH1750 센서인 경우 실제 데이터 읽기 시도
-                if sensor["sensor_type"] == "BH1750":
-                    try:
-                        # 실제 센서 데이터 읽기 (ref/gui_bh1750.py 로직 활용)
-                        real_value = await read_bh1750_data(sensor["bus"], sensor["mux_channel"])
-                        
-                        sensor_id = f"bh1750_{sensor['bus']}_{sensor['mux_channel']}"
-                        real_sensors[sensor_id] = {
-                            "id": sensor_id,
-                            "name": f"BH1750 조도센서 (Ch{sensor['mux_channel']+1})",
-                            "type": "light",
-                            "value": real_value if real_value is not None else 0.0,
-                            "status": "online" if real_value is not None else "error",
-                            "bus": sensor["bus"],
-                            "channel": sensor["mux_channel"],
-                            "address": sensor["address"],
-                            "last_update": datetime.now().isoformat()
-                        }
-                    except Exception as e:
-                        print(f"BH1750 데이터 읽기 실패: {e}")
-                        continue
+            # 모든 센서 읽기를 동시에 실행 (같은 버스는 버스 잠금으로 순차 처리, 버스 간에는 병렬)
+            env_sensors = [sensor for sensor in scan_result["sensors"]
+                           if sensor["sensor_type"] in ("BME688", "SHT40")]
+            reads = [(template["bus"], template["channel"], read_bh1750_data, ())
+                     for template in bh1750_templates]
+            for sensor in env_sensors:
+                reader = read_bme688_data if sensor["sensor_type"] == "BME688" else read_sht40_data
+                reads.append((sensor["bus"], sensor["mux_channel"], reader, (int(sensor["address"], 16),)))
+            
+            # 버스별로 채널 순서대로 읽도록 정렬 (버스 잠금은 FIFO라 요청 순서대로 처리됨)
+            # → 같은 채널 센서는 연속으로 읽어 mux 채널 전환 횟수 최소화
+            sweep_order = sorted(range(len(reads)), key=lambda i: (reads[i][0], reads[i][1]))
+            sweep_results = await asyncio.gather(
+                *(read_with_bus_lock(reads[i][2], reads[i][0], reads[i][1], *reads[i][3]) for i in sweep_order),
+                return_exceptions=True
+            )
+            results = [None] * len(reads)
+            for i, result in zip(sweep_order, sweep_results):
+                results[i] = result
+            bh1750_results = results[:len(bh1750_templates)]
+            env_results = results[len(bh1750_templates):]
+            updated_at = datetime.now()  # 측정 완료 시각 (모든 센서 공유)
+            
+            # BH1750 센서: 미리 만든 템플릿을 복사하고 측정값만 갱신
+            for template, real_value in zip(bh1750_templates, bh1750_results):
+                if isinstance(real_value, Exception):
+                    logger.warning("BH1750 데이터 읽기 실패: %s", real_value)
+                    continue
+                
+                entry = dict(template)
+                entry["value"] = real_value if real_value is not None else 0.0
+                entry["status"] = "online" if real_value is not None else "error"
+                entry["last_update"] = updated_at
+                real_sensors[template["id"]] = entry
+            
+            for sensor, sensor_data in zip(env_sensors, env_results):
+                if isinstance(sensor_data, Exception):
+                    logger.warning("%s 데이터 읽기 실패 (Bus %d, Ch %d): %s",
+                                   sensor["sensor_type"], sensor["bus"], sensor["mux_channel"], sensor_data)
+                    continue
                 
-                # BME688 센서인 경우 실제 온습도/압력 데이터 읽기
-                elif sensor["sensor_type"] == "BME688":
-                    try:
-                        # BME688에서 환경 데이터 읽기
-                        sensor_data = await read_bme688_data(sensor["bus"], sensor["mux_channel"], 
-                                                           int(sensor["address"], 16))
+                # BME688 센서인 경우 실제 온습도/압력 데이터
+                if sensor["sensor_type"] == "BME688":
+                    if sensor_data and sensor_data.get("values"):
+                        values = sensor_data["values"]
+                        base_sensor_id = f"bme688_{sensor['bus']}_{sensor['mux_channel']}"
                         
-                        if sensor_data and sensor_data.get("values"):
-                            values = sensor_data["values"]
-                            base_sensor_id = f"bme688_{sensor['bus']}_{sensor['mux_channel']}"
-                            
-                            # 온도 센서 데이터
-                            if "temperature" in values:
-                                temp_sensor_id = f"{base_sensor_id}_temp"
-                                real_sensors[temp_sensor_id] = {
-                                    "id": temp_sensor_id,
-                                    "name": f"BME688 온도센서 (Ch{sensor['mux_channel']+1})",
-                                    "type": "temperature",
-                                    "value": values["temperature"],
-                                    "status": "online",
-                                    "bus": sensor["bus"],
-                                    "channel": sensor["mux_channel"],
-                                    "address": sensor["address"],
-                                    "last_update": datetime.now().isoformat()
-                                }
-                            
-                            # 습도 센서 데이터
-                            if "humidity" in values:
-                                humidity_sensor_id = f"{base_sensor_id}_humidity"
-                                real_sensors[humidity_sensor_id] = {
-                                    "id": humidity_sensor_id,
-                                    "name": f"BME688 습도센서 (Ch{sensor['mux_channel']+1})",
-                                    "type": "humidity",
-                                    "value": values["humidity"],
-                                    "status": "online",
-                                    "bus": sensor["bus"],
-                                    "channel": sensor["mux_channel"],
-                                    "address": sensor["address"],
-                                    "last_update": datetime.now().isoformat()
-                                }
-                            
-                            # 압력 센서 데이터
-                            if "pressure" in values:
-                                pressure_sensor_id = f"{base_sensor_id}_pressure"
-                                real_sensors[pressure_sensor_id] = {
-                                    "id": pressure_sensor_id,
-                                    "name": f"BME688 압력센서 (Ch{sensor['mux_channel']+1})",
-                                    "type": "pressure",
-                                    "value": values["pressure"],
-                                    "status": "online",
-                                    "bus": sensor["bus"],
-                                    "channel": sensor["mux_channel"],
-                                    "address": sensor["address"],
-                                    "last_update": datetime.now().isoformat()
-                                }
-                                
-                    except Exception as e:
-                        print(f"BME688 데이터 읽기 실패 (Bus {sensor['bus']}, Ch {sensor['mux_channel']}): {e}")
-                        continue
+                        # 온도 센서 데이터
+                        if "temperature" in values:
+                            temp_sensor_id = f"{base_sensor_id}_temp"
+                            real_sensors[temp_sensor_id] = {
+                                "id": temp_sensor_id,
+                                "name": f"BME688 온도센서 (Ch{sensor['mux_channel']+1})",
+                                "type": "temperature",
+                                "value": values["temperature"],
+                                "status": "online",
+                                "bus": sensor["bus"],
+                                "channel": sensor["mux_channel"],
+                                "address": sensor["address"],
+                                "last_update": updated_at
+                            }
+                        
+                        # 습도 센서 데이터
+                        if "humidity" in values:
+                            humidity_sensor_id = f"{base_sensor_id}_humidity"
+                            real_sensors[humidity_sensor_id] = {
+                                "id": humidity_sensor_id,
+                                "name": f"BME688 습도센서 (Ch{sensor['mux_channel']+1})",
+                                "type": "humidity",
+                                "value": values["humidity"],
+                                "status": "online",
+                                "bus": sensor["bus"],
+                                "channel": sensor["mux_channel"],
+                                "address": sensor["address"],
+                                "last_update": updated_at
+                            }
+                        
+                        # 압력 센서 데이터
+                        if "pressure" in values:
+                            pressure_sensor_id = f"{base_sensor_id}_pressure"
+                            real_sensors[pressure_sensor_id] = {
+                                "id": pressure_sensor_id,
+                                "name": f"BME688 압력센서 (Ch{sensor['mux_channel']+1})",
+                                "type": "pressure",
+                                "value": values["pressure"],
+                                "status": "online",
+                                "bus": sensor["bus"],
+                                "channel": sensor["mux_channel"],
+                                "address": sensor["address"],
+                                "last_update": updated_at
+                            }
                 
-                # SHT40 센서인 경우 (향후 확장)
+                # SHT40 센서인 경우 온습도 데이터
                 elif sensor["sensor_type"] == "SHT40":
-                    try:
-                        # SHT40에서 온습도 데이터 읽기
-                        sensor_data = await read_sht40_data(sensor["bus"], sensor["mux_channel"], 
-                                                          int(sensor["address"], 16))
+                    if sensor_data and sensor_data.get("values"):
+                        values = sensor_data["values"]
+                        base_sensor_id = f"sht40_{sensor['bus']}_{sensor['mux_channel']}"
                         
-                        if sensor_data and sensor_data.get("values"):
-                            values = sensor_data["values"]
-                            base_sensor_id = f"sht40_{sensor['bus']}_{sensor['mux_channel']}"
-                            
-                            # 온도 센서 데이터
-                            if "temperature" in values:
-                                temp_sensor_id = f"{base_sensor_id}_temp"
-                                real_sensors[temp_sensor_id] = {
-                                    "id": temp_sensor_id,
-                                    "name": f"SHT40 온도센서 (Ch{sensor['mux_channel']+1})",
-                                    "type": "temperature",
-                                    "value": values["temperature"],
-                                    "status": "online",
-                                    "bus": sensor["bus"],
-                                    "channel": sensor["mux_channel"],
-                                    "address": sensor["address"],
-                                    "last_update": datetime.now().isoformat()
-                                }
-                            
-                            # 습도 센서 데이터
-                            if "humidity" in values:
-                                humidity_sensor_id = f"{base_sensor_id}_humidity"
-                                real_sensors[humidity_sensor_id] = {
-                                    "id": humidity_sensor_id,
-                                    "name": f"SHT40 습도센서 (Ch{sensor['mux_channel']+1})",
-                                    "type": "humidity",
-                                    "value": values["humidity"],
-                                    "status": "online",
-                                    "bus": sensor["bus"],
-                                    "channel": sensor["mux_channel"],
-                                    "address": sensor["address"],
-                                    "last_update": datetime.now().isoformat()
-                                }
-                                
-                    except Exception as e:
-                        print(f"SHT40 데이터 읽기 실패 (Bus {sensor['bus']}, Ch {sensor['mux_channel']}): {e}")
-                        continue
+                        # 온도 센서 데이터
+                        if "temperature" in values:
+                            temp_sensor_id = f"{base_sensor_id}_temp"
+                            real_sensors[temp_sensor_id] = {
+                                "id": temp_sensor_id,
+                                "name": f"SHT40 온도센서 (Ch{sensor['mux_channel']+1})",
+                                "type": "temperature",
+                                "value": values["temperature"],
+                                "status": "online",
+                                "bus": sensor["bus"],
+                                "channel": sensor["mux_channel"],
+                                "address": sensor["address"],
+                                "last_update": updated_at
+                            }
+                        
+                        # 습도 센서 데이터
+                        if "humidity" in values:
+                            humidity_sensor_id = f"{base_sensor_id}_humidity"
+                            real_sensors[humidity_sensor_id] = {
+                                "id": humidity_sensor_id,
+                                "name": f"SHT40 습도센서 (Ch{sensor['mux_channel']+1})",
+                                "type": "humidity",
+                                "value": values["humidity"],
+                                "status": "online",
+                                "bus": sensor["bus"],
+                                "channel": sensor["mux_channel"],
+                                "address": sensor["address"],
+                                "last_update": updated_at
+                            }
                 
-        return {
+        result = {
             "sensors": real_sensors,
             "system_status": "online",
             "connected_count": len(real_sensors),
             "scan_mode": scan_result.get("mode", "unknown"),
-            "timestamp": datetime.now().isoformat()
+            "timestamp": datetime.now()
         }
+        _real_status_cache = (time.monotonic(), result)
+        return result
         
     except Exception as e:
-        print(f"실제 센서 상태 조회 실패: {e}")
+        logger.warning("실제 센서 상태 조회 실패: %s", e)
         return {
             "sensors": {},
             "system_status": "error",
             "connected_count": 0,
             "error": str(e),
-            "timestamp": datetime.now().isoformat()
+            "timestamp": datetime.now()
         }
 
 @app.get("/api/sensors/groups")
@@ -678,7 +1137,7 @@ async def get_dynamic_sensor_groups():
         
         # 하드웨어 스캐너 사용
         scanner = get_scanner()
-        scan_result = scanner.scan_dual_mux_system()
+        scan_result = await run_scan(scanner.scan_dual_mux_system)
         
         if not scan_result["success"]:
             raise Exception(scan_result.get("error", "스캔 실패"))
@@ -775,7 +1234,7 @@ async def get_dynamic_sensor_groups():
         print(f"❌ 동적 센서 그룹 생성 실패: {e}")
         return {
             "error": f"센서 그룹 생성 실패: {str(e)}",
-            "timestamp": datetime.now().isoformat()
+            "timestamp": datetime.now()
         }
 
 @app.get("/api/sensors/{sensor_id}")
@@ -789,7 +1248,7 @@ async def get_sensor_data(sensor_id: str):
     now = time.time()
     
     sensor["value"] = generate_mock_value(sensor_type, now)
-    sensor["last_update"] = datetime.now().isoformat()
+    sensor["last_update"] = datetime.now()
     
     return sensor
 
@@ -798,7 +1257,7 @@ async def health_check():
     """헬스체크 엔드포인트"""
     return {
         "status": "healthy",
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": datetime.now(),
         "sensors_connected": len(MOCK_SENSORS),
         "websocket_connections": len(manager.active_connections)
     }
@@ -812,7 +1271,7 @@ async def scan_all_sensors():
         
         # 하드웨어 스캐너 사용
         scanner = get_scanner()
-        scan_result = scanner.scan_dual_mux_system()
+        scan_result = await run_scan(scanner.scan_dual_mux_system)
         
         if scan_result["success"]:
             result = {
@@ -835,7 +1294,7 @@ async def scan_all_sensors():
         return {
             "success": False,
             "message": str(e),
-            "timestamp": datetime.now().isoformat()
+            "timestamp": datetime.now()
         }
 
 @app.post("/api/sensors/scan-dual-mux")
@@ -846,7 +1305,7 @@ async def scan_dual_mux_system():
         
         # 하드웨어 스캐너 사용
         scanner = get_scanner()
-        scan_result = scanner.scan_dual_mux_system()
+        scan_result = await run_scan(scanner.scan_dual_mux_system)
         
         if scan_result["success"]:
             print(f"✅ 이중 멀티플렉서 스캔 완료: {len(scan_result['sensors'])}개 센서 발견")
@@ -875,7 +1334,7 @@ async def scan_dual_mux_system():
         return {
             "success": False,
             "message": str(e),
-            "timestamp": datetime.now().isoformat()
+            "timestamp": datetime.now()
         }
 
 @app.post("/api/sensors/reset-scanner")
@@ -883,7 +1342,7 @@ async def reset_hardware_scanner():
     """스캐너 리셋 - TCA9548A 재감지"""
     try:
         print("🔄 API: 스캐너 리셋 요청")
-        reset_scanner()
+        await run_scan(reset_scanner)
         
         scanner = get_scanner()
         return {
@@ -891,14 +1350,14 @@ async def reset_hardware_scanner():
             "message": "스캐너가 리셋되었습니다",
             "tca_count": len(scanner.tca_info),
             "detected_buses": list(scanner.tca_info.keys()),
-            "timestamp": datetime.now().isoformat()
+            "timestamp": datetime.now()
         }
     except Exception as e:
         print(f"❌ 스캐너 리셋 실패: {e}")
         return {
             "success": False,
             "message": f"스캐너 리셋 실패: {str(e)}",
-            "timestamp": datetime.now().isoformat()
+            "timestamp": datetime.now()
         }
 
 @app.post("/api/sensors/scan-bus/{bus_number}")
@@ -914,15 +1373,15 @@ async def scan_single_bus(bus_number: int):
         scanner = get_scanner()
         print(f"📋 스캐너 정보: 라즈베리파이={scanner.is_raspberry_pi}, TCA정보={list(scanner.tca_info.keys())}")
         
-        scan_result = scanner.scan_single_bus(bus_number)
+        scan_result = await get_cached_bus_scan_result(bus_number)
         
         if scan_result["success"]:
             # 디버깅을 위한 스캔 결과 출력
-            print(f"🔍 Bus {bus_number} 스캔 결과:", scan_result)
+            logger.debug("🔍 Bus %d 스캔 결과: %s", bus_number, scan_result)
             
             # 버스별 센서 데이터 추출
             bus_data = scan_result["buses"].get(str(bus_number), {})
-            print(f"📊 Bus {bus_number} 데이터:", bus_data)
+            logger.debug("📊 Bus %d 데이터: %s", bus_number, bus_data)
             detected_sensors = []
             
             # TCA9548A 채널별 센서 추출
@@ -972,7 +1431,7 @@ async def scan_single_bus(bus_number: int):
         return {
             "success": False,
             "message": str(e),
-            "timestamp": datetime.now().isoformat()
+            "timestamp": datetime.now()
         }
 
 @app.post("/api/sensors/test")
@@ -1000,7 +1459,7 @@ async def test_sensor(request_data: dict):
             "success": False,
             "data": {
                 "error": str(e),
-                "timestamp": datetime.now().isoformat()
+                "timestamp": datetime.now()
             }
         }
 
@@ -1023,7 +1482,7 @@ async def perform_real_sensor_test(bus_number: int, mux_channel: int, address: s
                     "address": address or "0x00",
                     "values": {
                         "mock_value": 123.4,
-                        "timestamp": datetime.now().isoformat()
+                        "timestamp": datetime.now()
                     },
                     "connection_status": "Mock 모드",
                     "response_time": f"{(time.time() - start_time)*1000:.1f}ms"
@@ -1038,7 +1497,7 @@ async def perform_real_sensor_test(bus_number: int, mux_channel: int, address: s
         
         # BH1750 센서 테스트 (0x23 또는 0x5C)
         if addr_int in [0x23, 0x5C]:
-            lux_value = await read_bh1750_data(bus_number, mux_channel)
+            lux_value = await read_with_bus_lock(read_bh1750_data, bus_number, mux_channel)
             
             return {
                 "success": True,
@@ -1050,7 +1509,7 @@ async def perform_real_sensor_test(bus_number: int, mux_channel: int, address: s
                     "values": {
                         "light": lux_value if lux_value is not None else "읽기 실패",
                         "unit": "lux",
-                        "timestamp": datetime.now().isoformat()
+                        "timestamp": datetime.now()
                     },
                     "connection_status": "정상" if lux_value is not None else "통신 실패",
                     "response_time": f"{(time.time() - start_time)*1000:.1f}ms"
@@ -1059,7 +1518,7 @@ async def perform_real_sensor_test(bus_number: int, mux_channel: int, address: s
         
         # BME688 센서 테스트 (0x76 또는 0x77)
         elif addr_int in [0x76, 0x77]:
-            bme_data = await read_bme688_data(bus_number, mux_channel, addr_int)
+            bme_data = await read_with_bus_lock(read_bme688_data, bus_number, mux_channel, addr_int)
             
             return {
                 "success": True,
@@ -1076,7 +1535,7 @@ async def perform_real_sensor_test(bus_number: int, mux_channel: int, address: s
         
         # SHT40 센서 테스트 (0x44 또는 0x45)
         elif addr_int in [0x44, 0x45]:
-            sht_data = await read_sht40_data(bus_number, mux_channel, addr_int)
+            sht_data = await read_with_bus_lock(read_sht40_data, bus_number, mux_channel, addr_int)
             
             return {
                 "success": True,
@@ -1130,7 +1589,7 @@ async def get_sensor_status():
                 "bus_0": {"status": "connected", "sensor_count": 3},
                 "bus_1": {"status": "connected", "sensor_count": 3}
             },
-            "last_scan": datetime.now().isoformat(),
+            "last_scan": datetime.now(),
             "system_health": "정상"
         }
         
@@ -1140,57 +1599,70 @@ async def get_sensor_status():
         print(f"❌ 센서 상태 조회 실패: {e}")
         return {
             "error": str(e),
-            "timestamp": datetime.now().isoformat()
+            "timestamp": datetime.now()
         }
 
 # WebSocket 엔드포인트 - 실시간 데이터 스트리밍
+WS_TICK_INTERVAL = 2.0  # 실시간 데이터 전송 주기 (초)
+
+REAL_SENSOR_REFRESH_INTERVAL = 5.0  # 실제 센서 데이터 갱신 주기 (초)
+
+class _WSState:
+    """실시간 WebSocket 루프 공유 상태 (실제 센서 데이터 캐시, 갱신 작업)"""
+    __slots__ = ("cached_real_sensors", "refresh_task")
+    
+    def __init__(self):
+        self.cached_real_sensors: Dict[str, Dict] = {}
+        self.refresh_task: Optional[asyncio.Task] = None
+
+_WS_STATE = _WSState()
+
+async def _real_sensor_refresh_loop():
+    """실제 센서 데이터를 주기적으로 읽어 캐시 (브로드캐스트 루프가 I2C 읽기를 기다리지 않도록 분리)"""
+    while True:
+        try:
+            logger.debug("🔍 실제 센서 데이터 업데이트...")
+            real_sensors_response = await get_real_sensors_status()
+            if real_sensors_response.get("sensors"):
+                # 캐시된 실제 센서 데이터 저장 (센서별 로그는 DEBUG 레벨일 때만)
+                _WS_STATE.cached_real_sensors.update(real_sensors_response["sensors"])
+                if logger.isEnabledFor(logging.DEBUG):
+                    for sensor_id, sensor_info in real_sensors_response["sensors"].items():
+                        logger.debug("📡 실제 센서 데이터 캐시 업데이트: %s = %s", sensor_id, sensor_info["value"])
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning("⚠️ 실제 센서 데이터 수집 실패: %s", e)
+        
+        await asyncio.sleep(REAL_SENSOR_REFRESH_INTERVAL)
+
 @app.websocket("/ws/realtime")
 async def websocket_endpoint(websocket: WebSocket):
-    """실시간 센서 데이터 WebSocket 스트리밍"""
-    await manager.connect(websocket)
+    """실시간 센서 데이터 WebSocket 스트리밍 (?format=msgpack 이면 MessagePack 바이너리 프레임)"""
+    use_msgpack = MSGPACK_AVAILABLE and websocket.query_params.get("format") == "msgpack"
+    await manager.connect(websocket, use_msgpack)
+    
+    # 고정 주기 스케줄링: 작업 시간과 무관하게 2초 간격 유지 (sleep 누적 지연 방지)
+    loop = asyncio.get_running_loop()
+    next_deadline = loop.time()
     
     try:
         while True:
             # 실시간 데이터 생성 및 전송 (2초 간격)
             now = time.time()
-            sensor_data = {}
+            tick_time = datetime.now()  # 틱당 1회만 생성해 모든 센서/메시지에 공유
             
-            # Mock 센서 데이터 업데이트
-            for sensor_id, sensor in MOCK_SENSORS.items():
-                sensor_type = sensor["type"]
-                value = generate_mock_value(sensor_type, now)
-                
-                sensor_data[sensor_id] = {
-                    "id": sensor_id,
-                    "type": sensor_type,
-                    "value": round(value, 2),
-                    "status": "online",
-                    "timestamp": datetime.now().isoformat()
-                }
-            
-            # 실제 센서 데이터 추가 (5초마다만 업데이트 - 안정성 향상)
-            websocket_loop_count = getattr(websocket_endpoint, 'loop_count', 0)
-            websocket_endpoint.loop_count = websocket_loop_count + 1
-            
-            # 5초마다 실제 센서 데이터 읽기 (2초 * 2.5 = 5초)
-            if websocket_loop_count % 3 == 0:  # 6초마다
-                try:
-                    print("🔍 실제 센서 데이터 업데이트...")
-                    real_sensors_response = await get_real_sensors_status()
-                    if real_sensors_response.get("sensors"):
-                        # 캐시된 실제 센서 데이터 저장
-                        if not hasattr(websocket_endpoint, 'cached_real_sensors'):
-                            websocket_endpoint.cached_real_sensors = {}
-                        
-                        for sensor_id, sensor_info in real_sensors_response["sensors"].items():
-                            websocket_endpoint.cached_real_sensors[sensor_id] = sensor_info
-                            print(f"📡 실제 센서 데이터 캐시 업데이트: {sensor_id} = {sensor_info['value']} lux")
-                except Exception as e:
-                    print(f"⚠️ 실제 센서 데이터 수집 실패: {e}")
+            # Mock 센서 데이터 업데이트 (전체 센서 벡터 연산 + 반올림 일괄 처리, 항목 dict 재사용)
+            values = generate_all_mock_values(now, decimals=2)
+            for entry, value in zip(_ws_sensor_templates.values(), values):
+                entry["value"] = value
+                entry["timestamp"] = tick_time
+            sensor_data = _ws_sensor_templates
             
-            # 캐시된 실제 센서 데이터 사용
-            if hasattr(websocket_endpoint, 'cached_real_sensors'):
-                for sensor_id, sensor_info in websocket_endpoint.cached_real_sensors.items():
+            # 캐시된 실제 센서 데이터 사용 (백그라운드 작업이 5초마다 갱신)
+            if _WS_STATE.cached_real_sensors:
+                sensor_data = dict(sensor_data)  # 재사용 템플릿에 실제 센서 항목이 남지 않도록 얕은 복사
+                for sensor_id, sensor_info in _WS_STATE.cached_real_sensors.items():
                     # 실제 센서 데이터로 Mock 데이터 덮어쓰기
                     sensor_data[sensor_id] = {
                         "id": sensor_id,
@@ -1205,23 +1677,32 @@ async def websocket_endpoint(websocket: WebSocket):
                 "type": "sensor_data",
                 "data": sensor_data,
                 "system_status": "online",
-                "timestamp": datetime.now().isoformat()
+                "timestamp": tick_time
             })
             
-            # 실시간성 보장: 2초 간격
-            await asyncio.sleep(2)
+            # 실시간성 보장: 다음 틱 시각까지 남은 시간만 대기
+            next_deadline += WS_TICK_INTERVAL
+            delay = next_deadline - loop.time()
+            if delay < 0:
+                next_deadline = loop.time()  # 작업이 한 주기를 넘기면 밀린 틱을 몰아서 보내지 않고 재정렬
+                delay = 0
+            await asyncio.sleep(delay)
             
     except WebSocketDisconnect:
         manager.disconnect(websocket)
     except Exception as e:
-        print(f"WebSocket 오류: {e}")
+        logger.warning("WebSocket 오류: %s", e)
         manager.disconnect(websocket)
 
 # 백그라운드 작업 - 시스템 상태 모니터링
 @app.on_event("startup")
 async def startup_event():
     """애플리케이션 시작 시 초기화"""
+    start_log_listener()  # 로그 출력은 백그라운드 스레드에서
     init_mock_sensors()
+    open_buses()  # 센서 읽기용 I2C 버스 핸들 미리 열기
+    load_static_files()  # 프론트엔드 파일 메모리 캐시
+    _WS_STATE.refresh_task = asyncio.create_task(_real_sensor_refresh_loop())  # 실제 센서 데이터 갱신
     print("🚀 EG-ICON Dashboard 서버 시작됨")
     print(f"📊 Mock 센서 {len(MOCK_SENSORS)}개 초기화 완료")
     print("🌐 대시보드: http://localhost:8001")
@@ -1230,8 +1711,18 @@ async def startup_event():
 @app.on_event("shutdown") 
 async def shutdown_event():
     """애플리케이션 종료 시 정리"""
+    if _WS_STATE.refresh_task:
+        _WS_STATE.refresh_task.cancel()  # 실제 센서 데이터 갱신 중지
+        try:
+            await _WS_STATE.refresh_task
+        except asyncio.CancelledError:
+            pass
+        _WS_STATE.refresh_task = None
+    _I2C_POOL.shutdown(wait=True)  # 진행 중인 I2C 작업 완료 후 스레드 종료
+    close_buses()  # 재사용 중인 I2C 버스 핸들 정리
     cleanup_scanner()  # 하드웨어 스캐너 정리
     print("🛑 EG-ICON Dashboard 서버 종료됨")
+    stop_log_listener()
 
 if __name__ == "__main__":
     uvicorn.run(
@@ -5,9 +5,12 @@
 Bus 0, Bus 1의 모든 채널에서 센서 검출
 """
 
+import os
 import sys
 import time
+import fcntl
 from datetime import datetime
+from types import MappingProxyType
 
 # I2C 라이브러리 임포트
 try:
@@ -19,48 +22,62 @@ except ImportError:
     print("❌ I2C 라이브러리 없음 - 실행 불가능")
     sys.exit(1)
 
+# linux/i2c-dev.h: 이후 read/write 대상 슬레이브 주소 지정
+I2C_SLAVE = 0x0703
+
+# TCA9548A 채널 선택 바이트 (채널 n → 1 << n, 채널마다 계산하지 않도록 미리 생성)
+_CH_MASK = tuple(bytes([1 << ch]) for ch in range(8))
+
+def _scan_channel_fd(fd, channel, mux_address=0x70):
+    """열린 /dev/i2c-N fd로 특정 채널 스캔 (ioctl + 1바이트 read로 주소 응답 확인)"""
+    # 멀티플렉서 채널 선택
+    fcntl.ioctl(fd, I2C_SLAVE, mux_address)
+    os.write(fd, _CH_MASK[channel])
+    time.sleep(0.01)
+    
+    found_devices = []
+    
+    # I2C 주소 스캔 (TCA9548A 주소는 제외 - 중복 방지)
+    for addr in range(0x08, 0x78):
+        if addr == mux_address:
+            continue
+        try:
+            fcntl.ioctl(fd, I2C_SLAVE, addr)
+            os.read(fd, 1)
+            found_devices.append(addr)
+        except OSError:
+            pass  # NACK (장치 없음) 또는 커널 드라이버 점유
+    
+    return found_devices
+
 def scan_channel(bus_num, channel, mux_address=0x70):
-    """특정 채널 스캔"""
+    """특정 채널 스캔 (단일 채널 확인용, 버스를 열고 닫음)"""
     try:
-        bus = smbus2.SMBus(bus_num)
-        
-        # 멀티플렉서 채널 선택
-        channel_mask = 1 << channel
-        bus.write_byte(mux_address, channel_mask)
-        time.sleep(0.01)
-        
-        found_devices = []
-        
-        # I2C 주소 스캔
-        for addr in range(0x08, 0x78):
-            try:
-                bus.read_byte(addr)
-                # TCA9548A 주소는 제외 (중복 방지)
-                if addr != mux_address:
-                    found_devices.append(addr)
-            except:
-                pass
-        
-        bus.close()
-        return found_devices
+        fd = os.open(f"/dev/i2c-{bus_num}", os.O_RDWR)
+        try:
+            return _scan_channel_fd(fd, channel, mux_address)
+        finally:
+            os.close(fd)
         
     except Exception as e:
         print(f"❌ Bus {bus_num} Channel {channel} 스캔 실패: {e}")
         return []
 
-def identify_sensor(addr):
+# I2C 주소별 센서 타입 (스캔 중 매번 만들지 않도록 모듈 수준에 한 번만 정의)
+SENSOR_MAP = MappingProxyType({
+    0x44: "SHT40",
+    0x45: "SHT40", 
+    0x76: "BME688",
+    0x77: "BME688",
+    0x23: "BH1750",
+    0x5C: "BH1750",
+    0x25: "SDP810",
+    0x29: "VL53L0X"
+})
+
+def identify_sensor(addr, _lookup=SENSOR_MAP.get):
     """주소로 센서 타입 추정"""
-    sensor_map = {
-        0x44: "SHT40",
-        0x45: "SHT40", 
-        0x76: "BME688",
-        0x77: "BME688",
-        0x23: "BH1750",
-        0x5C: "BH1750",
-        0x25: "SDP810",
-        0x29: "VL53L0X"
-    }
-    return sensor_map.get(addr, "Unknown")
+    return _lookup(addr, "Unknown")
 
 def scan_all_channels():
     """모든 버스와 채널 스캔"""
@@ -76,10 +93,22 @@ def scan_all_channels():
         print(f"\n🚌 Bus {bus_num} 스캔 중...")
         scan_results[bus_num] = {}
         
+        # 버스당 한 번만 열어 8개 채널 스캔에 공유
+        try:
+            fd = os.open(f"/dev/i2c-{bus_num}", os.O_RDWR)
+        except OSError as e:
+            print(f"❌ Bus {bus_num} 열기 실패: {e}")
+            fd = None
+        
         for channel in range(8):  # TCA9548A는 8채널
             print(f"   📡 Channel {channel} 스캔 중...", end=" ")
             
-            devices = scan_channel(bus_num, channel)
+            devices = []
+            if fd is not None:
+                try:
+                    devices = _scan_channel_fd(fd, channel)
+                except Exception as e:
+                    print(f"❌ Bus {bus_num} Channel {channel} 스캔 실패: {e}")
             scan_results[bus_num][channel] = devices
             
             if devices:
@@ -90,6 +119,9 @@ def scan_all_channels():
                     total_devices += 1
             else:
                 print("❌ 없음")
+        
+        if fd is not None:
+            os.close(fd)
     
     # 결과 요약
     print("\n" + "=" * 80)
@@ -8,9 +8,11 @@ find_sdp800.py 및 test_sdp800_ch2.py 기반으로 SDP810용으로 표준화
 
 import sys
 import time
-import struct
-from datetime import datetime
-from typing import Optional, Tuple, List, Dict
+import threading
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Optional, Tuple, List, Dict, NamedTuple
 
 # I2C 라이브러리
 try:
@@ -19,12 +21,88 @@ try:
 except ImportError:
     I2C_AVAILABLE = False
 
+# 고속 수치 연산 (선택사항, 미설치 시 순수 Python 통계 계산)
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+def _crc8_entry(value: int) -> int:
+    """CRC-8 테이블 항목 계산 (다항식 0x31, 1바이트 8회 시프트)"""
+    crc = value
+    for _ in range(8):
+        if crc & 0x80:
+            crc = ((crc << 1) ^ 0x31) & 0xFF
+        else:
+            crc = (crc << 1) & 0xFF
+    return crc
+
+# Sensirion CRC-8 조회 테이블 (모듈 로드 시 1회 생성, 바이트당 비트 루프 제거)
+_CRC8_TABLE = bytes(_crc8_entry(i) for i in range(256))
+
+def crc8(data: bytes, _table: bytes = _CRC8_TABLE) -> int:
+    """CRC-8 계산 (Sensirion 표준, 다항식 0x31 / 초기값 0xFF)"""
+    crc = 0xFF
+    for byte in data:
+        crc = _table[crc ^ byte]
+    return crc
+
+# 2바이트 데이터 워드 → CRC 조회 테이블 (SDP810 CRC는 항상 초기값 0xFF + 2바이트이므로 64KB로 특수화)
+_CRC8_WORD_TABLE = bytes(_CRC8_TABLE[_CRC8_TABLE[0xFF ^ (word >> 8)] ^ (word & 0xFF)] for word in range(65536))
+
+def decode_pressure(raw: bytes, scale_inv: float, _table: bytes = _CRC8_WORD_TABLE) -> Tuple[float, bool]:
+    """SDP810 3바이트 응답 [msb, lsb, crc] → (압력 Pa, CRC 일치 여부)
+    
+    CRC 검증, int16 해석, 스케일 변환, ±500 Pa 범위 제한을 중간 객체 없이 한 번에 처리
+    """
+    raw_pressure = (raw[0] << 8) | raw[1]
+    crc_ok = _table[raw_pressure] == raw[2]
+    
+    if raw_pressure & 0x8000:
+        raw_pressure -= 0x10000
+    pressure_pa = raw_pressure * scale_inv
+    
+    if pressure_pa > 500.0:
+        pressure_pa = 500.0
+    elif pressure_pa < -500.0:
+        pressure_pa = -500.0
+    return pressure_pa, crc_ok
+
+# 버스별 병렬 검색 시 출력 줄이 섞이지 않도록 보호
+_print_lock = threading.Lock()
+
+def _log(message: str):
+    """스레드 안전 출력"""
+    with _print_lock:
+        print(message)
+
+# 마지막으로 선택된 멀티플렉서 채널 마스크 {(버스 번호, 멀티플렉서 주소): 채널 마스크}
+_MUX_STATE: Dict[Tuple[int, int], int] = {}
+
+class SDP810Info(NamedTuple):
+    """SDP810 고정 사양 정보 (모든 인스턴스가 공유)"""
+    name: str = "SDP810"
+    manufacturer: str = "Sensirion"
+    measurement_type: str = "Differential Pressure"
+    pressure_range: str = "±500 Pa"
+    accuracy: str = "±1.5% of reading"
+    interface: str = "I2C"
+    address: str = "0x25"
+    scaling_factor: float = 240.0
+
 class SDP810Sensor:
     """SDP810 차압센서 클래스"""
     
     # SDP810 표준 주소
     SDP810_ADDRESS = 0x25
     
+    # 센서 정보 (인스턴스별 dict 대신 클래스 수준 NamedTuple 1개 공유)
+    SENSOR_INFO = SDP810Info()
+    
+    # 멀티플렉서 채널 전환 후 대기 시간 (초, TCA9548A 전환은 마이크로초 단위라 기본 0)
+    MUX_SETTLE_TIME = 0.0
+    
     def __init__(self, bus_num: int = 1, mux_address: int = 0x70, mux_channel: Optional[int] = None):
         """
         SDP810 센서 초기화
@@ -39,31 +117,15 @@ class SDP810Sensor:
         self.mux_channel = mux_channel
         self.bus = None
         self.is_connected = False
+        # 3바이트 읽기 메시지 (주소/길이 고정이므로 1회만 생성해 매 측정 재사용)
+        self._read_msg = smbus2.i2c_msg.read(self.SDP810_ADDRESS, 3) if I2C_AVAILABLE else None
         
-        # 센서 정보
-        self.sensor_info = {
-            "name": "SDP810",
-            "manufacturer": "Sensirion",
-            "measurement_type": "Differential Pressure",
-            "pressure_range": "±500 Pa",
-            "accuracy": "±1.5% of reading",
-            "interface": "I2C",
-            "address": f"0x{self.SDP810_ADDRESS:02X}",
-            "scaling_factor": 240.0
-        }
+        # 측정마다 속성 조회/나눗셈을 하지 않도록 스케일 역수를 미리 계산
+        self._scale_inv = 1.0 / self.SENSOR_INFO.scaling_factor
     
-    def _calculate_crc8(self, data: List[int]) -> int:
-        """CRC-8 계산 (Sensirion 표준)"""
-        crc = 0xFF
-        for byte in data:
-            crc ^= byte
-            for _ in range(8):
-                if crc & 0x80:
-                    crc = (crc << 1) ^ 0x31
-                else:
-                    crc = crc << 1
-                crc &= 0xFF
-        return crc
+    def _calculate_crc8(self, data: bytes) -> int:
+        """CRC-8 계산 (Sensirion 표준, 조회 테이블 사용)"""
+        return crc8(data)
     
     def connect(self) -> bool:
         """I2C 연결 및 센서 초기화"""
@@ -79,8 +141,8 @@ class SDP810Sensor:
                 if not self._select_mux_channel():
                     return False
             
-            # 센서 응답 테스트
-            self.bus.read_byte(self.SDP810_ADDRESS)
+            # 센서 응답 테스트 (SMBus Quick Write: 주소만 보내고 ACK 확인)
+            self.bus.write_quick(self.SDP810_ADDRESS)
             
             # 압력 읽기 테스트
             pressure, crc_ok, message = self._read_pressure_data()
@@ -97,25 +159,31 @@ class SDP810Sensor:
             return False
     
     def _select_mux_channel(self) -> bool:
-        """TCA9548A 멀티플렉서 채널 선택"""
+        """TCA9548A 멀티플렉서 채널 선택 (이미 선택된 채널이면 I2C 통신 생략)"""
+        key = (self.bus_num, self.mux_address)
+        channel_mask = 1 << self.mux_channel
+        if _MUX_STATE.get(key) == channel_mask:
+            return True
+        
         try:
             # ref/tca9548a.py 방식: 초기화 후 채널 선택
             self.bus.write_byte(self.mux_address, 0)  # 모든 채널 비활성화
-            time.sleep(0.01)
-            
-            channel_mask = 1 << self.mux_channel
             self.bus.write_byte(self.mux_address, channel_mask)
-            time.sleep(0.01)
+            if self.MUX_SETTLE_TIME:
+                time.sleep(self.MUX_SETTLE_TIME)
             
             # 채널 선택 확인
             current_channel = self.bus.read_byte(self.mux_address)
             if current_channel == channel_mask:
+                _MUX_STATE[key] = channel_mask
                 return True
             else:
+                _MUX_STATE.pop(key, None)
                 print(f"❌ 채널 선택 실패: 요청={channel_mask:02X}, 실제={current_channel:02X}")
                 return False
                 
         except Exception as e:
+            _MUX_STATE.pop(key, None)
             print(f"❌ 멀티플렉서 채널 선택 실패: {e}")
             return False
     
@@ -123,31 +191,21 @@ class SDP810Sensor:
         """SDP810 압력 데이터 읽기"""
         try:
             # 3바이트 읽기: [pressure_msb, pressure_lsb, crc]
-            read_msg = smbus2.i2c_msg.read(self.SDP810_ADDRESS, 3)
+            read_msg = self._read_msg
             self.bus.i2c_rdwr(read_msg)
-            raw_data = list(read_msg)
+            raw_data = bytes(read_msg)
             
             if len(raw_data) != 3:
                 return None, False, f"데이터 길이 오류: {len(raw_data)}"
             
-            pressure_msb = raw_data[0]
-            pressure_lsb = raw_data[1]
-            received_crc = raw_data[2]
-            
-            # CRC 검증
-            calculated_crc = self._calculate_crc8([pressure_msb, pressure_lsb])
-            crc_ok = calculated_crc == received_crc
-            
-            # 압력 계산
-            raw_pressure = struct.unpack('>h', bytes([pressure_msb, pressure_lsb]))[0]
-            pressure_pa = raw_pressure / self.sensor_info["scaling_factor"]
-            
-            # 범위 제한 (±500 Pa)
-            pressure_pa = max(-500.0, min(500.0, pressure_pa))
+            # CRC 검증 + 압력 계산 + 범위 제한 (±500 Pa)
+            pressure_pa, crc_ok = decode_pressure(raw_data, self._scale_inv)
             
             return pressure_pa, crc_ok, "OK"
             
         except Exception as e:
+            # 통신 오류 시 멀티플렉서 상태를 알 수 없으므로 다음 읽기에서 채널 재선택
+            _MUX_STATE.pop((self.bus_num, self.mux_address), None)
             return None, False, f"읽기 오류: {e}"
     
     def read_pressure(self) -> Optional[float]:
@@ -211,18 +269,65 @@ class SDP810Sensor:
         
         return None
     
+    def read_batch(self, n: int, out=None):
+        """
+        압력 n회 연속 읽기 (대기 없이 float32 배열에 바로 저장)
+        
+        Args:
+            n: 측정 횟수
+            out: 결과를 저장할 길이 n 이상의 float32 배열 (None이면 새로 생성)
+        
+        Returns:
+            float32 배열 (numpy 있으면 ndarray, 없으면 array.array('f')), 실패/CRC 오류 측정은 NaN
+        """
+        if out is None:
+            out = np.empty(n, dtype=np.float32) if NUMPY_AVAILABLE else array('f', bytes(4 * n))
+        
+        nan = float("nan")
+        if not self.is_connected or (self.mux_channel is not None and not self._select_mux_channel()):
+            for i in range(n):
+                out[i] = nan
+            return out
+        
+        bus = self.bus
+        read_msg = self._read_msg
+        scale_inv = self._scale_inv
+        for i in range(n):
+            try:
+                bus.i2c_rdwr(read_msg)
+                pressure_pa, crc_ok = decode_pressure(bytes(read_msg), scale_inv)
+                out[i] = pressure_pa if crc_ok else nan
+            except Exception:
+                _MUX_STATE.pop((self.bus_num, self.mux_address), None)
+                out[i] = nan
+        return out
+    
     def continuous_measurement(self, duration: int = 10, interval: float = 1.0) -> List[Dict]:
         """연속 측정"""
         measurements = []
         
         print(f"📈 SDP810 연속 측정 시작 ({duration}초, {interval}초 간격)")
         
+        # 진행 출력 버퍼 (고속 측정 시 측정마다 stdout write 하지 않도록 모아서 출력)
+        lines: List[str] = []
+        
+        def flush_lines():
+            if lines:
+                sys.stdout.write("\n".join(lines) + "\n")
+                sys.stdout.flush()
+                lines.clear()
+        
+        # 절대 시각 기준 측정 일정 (측정 소요 시간이 간격에 누적되지 않도록)
+        # 측정 중 timestamp에는 monotonic 경과 시간만 기록하고 ISO 문자열은 측정 후 일괄 생성
+        start_wall = datetime.now()
+        t0 = time.monotonic()
+        
         for i in range(duration):
             try:
                 pressure, crc_ok, message = self.read_pressure_with_crc()
                 
                 measurement = {
-                    "timestamp": datetime.now().isoformat(),
+                    "timestamp": time.monotonic() - t0,
                     "measurement_number": i + 1,
                     "pressure_pa": pressure,
                     "crc_valid": crc_ok,
@@ -233,31 +338,48 @@ class SDP810Sensor:
                 
                 if pressure is not None:
                     status = "✅" if crc_ok else "⚠️"
-                    print(f"   {i+1:2d}초: {pressure:6.2f} Pa {status}")
+                    lines.append(f"   {i+1:2d}초: {pressure:6.2f} Pa {status}")
                 else:
-                    print(f"   {i+1:2d}초: 측정 실패 - {message}")
+                    lines.append(f"   {i+1:2d}초: 측정 실패 - {message}")
                 
                 if i < duration - 1:  # 마지막 측정이 아닌 경우만 대기
-                    time.sleep(interval)
+                    delay = t0 + (i + 1) * interval - time.monotonic()
+                    # 느린 측정(대기 0.1초 이상)은 즉시 출력, 고속 측정은 10개씩 모아서 출력
+                    if delay >= 0.1 or len(lines) >= 10:
+                        flush_lines()
+                    if delay > 0:
+                        time.sleep(delay)
                 
             except Exception as e:
                 measurement = {
-                    "timestamp": datetime.now().isoformat(),
+                    "timestamp": time.monotonic() - t0,
                     "measurement_number": i + 1,
                     "pressure_pa": None,
                     "crc_valid": False,
                     "message": f"오류: {e}"
                 }
                 measurements.append(measurement)
-                print(f"   {i+1:2d}초: 오류 - {e}")
+                lines.append(f"   {i+1:2d}초: 오류 - {e}")
+        
+        flush_lines()
+        
+        for measurement in measurements:
+            measurement["timestamp"] = (start_wall + timedelta(seconds=measurement["timestamp"])).isoformat()
         
         # 측정 통계
         valid_measurements = [m["pressure_pa"] for m in measurements if m["pressure_pa"] is not None]
         
         if valid_measurements:
-            avg_pressure = sum(valid_measurements) / len(valid_measurements)
-            min_pressure = min(valid_measurements)
-            max_pressure = max(valid_measurements)
+            if NUMPY_AVAILABLE:
+                # 연속 메모리 배열에서 C 수준 리덕션
+                values = np.asarray(valid_measurements, dtype=np.float64)
+                avg_pressure = float(values.mean())
+                min_pressure = float(values.min())
+                max_pressure = float(values.max())
+            else:
+                avg_pressure = sum(valid_measurements) / len(valid_measurements)
+                min_pressure = min(valid_measurements)
+                max_pressure = max(valid_measurements)
             
             print(f"\n📊 측정 통계:")
             print(f"   평균: {avg_pressure:.2f} Pa")
@@ -270,7 +392,7 @@ class SDP810Sensor:
     
     def get_sensor_info(self) -> Dict:
         """센서 정보 반환"""
-        info = self.sensor_info.copy()
+        info = self.SENSOR_INFO._asdict()
         info.update({
             "bus_number": self.bus_num,
             "mux_address": f"0x{self.mux_address:02X}" if self.mux_channel is not None else None,
@@ -285,7 +407,7 @@ class SDP810Sensor:
         
         try:
             # 기본 응답 테스트
-            self.bus.read_byte(self.SDP810_ADDRESS)
+            self.bus.write_quick(self.SDP810_ADDRESS)
             print("   ✅ 센서가 I2C 주소에서 응답함")
             
             # 압력 데이터 읽기 테스트
@@ -309,6 +431,7 @@ class SDP810Sensor:
             try:
                 # 멀티플렉서 채널 비활성화 (필요시)
                 if self.mux_channel is not None:
+                    _MUX_STATE.pop((self.bus_num, self.mux_address), None)
                     self.bus.write_byte(self.mux_address, 0)
                 self.bus.close()
             except Exception as e:
@@ -317,6 +440,80 @@ class SDP810Sensor:
                 self.bus = None
                 self.is_connected = False
 
+def _scan_bus(bus_num: int, mux_address: int) -> List[Dict]:
+    """단일 버스에서 SDP810 센서 검색 (직접 연결 + 멀티플렉서 8채널)"""
+    found = []
+    try:
+        bus = smbus2.SMBus(bus_num)
+        _log(f"🚌 Bus {bus_num} 검색 중...")
+        
+        # 직접 연결 확인
+        try:
+            bus.write_quick(SDP810Sensor.SDP810_ADDRESS)
+            sensor = SDP810Sensor(bus_num=bus_num, mux_channel=None)
+            if sensor.connect():
+                sensor_info = {
+                    "bus": bus_num,
+                    "mux_channel": None,
+                    "address": f"0x{SDP810Sensor.SDP810_ADDRESS:02X}",
+                    "sensor_type": "SDP810",
+                    "connection_type": "direct"
+                }
+                found.append(sensor_info)
+                _log(f"   ✅ Bus {bus_num} 직접: SDP810 발견")
+            sensor.close()
+        except:
+            pass
+        
+        # 멀티플렉서를 통한 검색
+        try:
+            # TCA9548A 응답 확인
+            bus.read_byte(mux_address)
+            _log(f"   🔍 TCA9548A 멀티플렉서 발견 (0x{mux_address:02X})")
+            
+            # 각 채널 검색 (채널 마스크 쓰기 1회로 바로 전환, 채널마다 초기화/비활성화 쓰기 없음)
+            for channel in range(8):
+                try:
+                    # 채널 선택 (직접 전환하므로 캐시된 채널 상태 무효화)
+                    _MUX_STATE.pop((bus_num, mux_address), None)
+                    bus.write_byte(mux_address, 1 << channel)
+                    if SDP810Sensor.MUX_SETTLE_TIME:
+                        time.sleep(SDP810Sensor.MUX_SETTLE_TIME)
+                    
+                    # SDP810 확인 (Quick Write 프로브)
+                    bus.write_quick(SDP810Sensor.SDP810_ADDRESS)
+                    
+                    sensor = SDP810Sensor(bus_num=bus_num, mux_address=mux_address, mux_channel=channel)
+                    if sensor.connect():
+                        sensor_info = {
+                            "bus": bus_num,
+                            "mux_channel": channel,
+                            "mux_address": f"0x{mux_address:02X}",
+                            "address": f"0x{SDP810Sensor.SDP810_ADDRESS:02X}",
+                            "sensor_type": "SDP810",
+                            "connection_type": "multiplexed"
+                        }
+                        found.append(sensor_info)
+                        _log(f"   ✅ Bus {bus_num} CH{channel}: SDP810 발견")
+                    sensor.close()
+                    
+                except:
+                    continue
+            
+            # 검색 완료 후 채널 비활성화
+            _MUX_STATE.pop((bus_num, mux_address), None)
+            bus.write_byte(mux_address, 0)
+                    
+        except:
+            _log(f"   ⚪ Bus {bus_num}: TCA9548A 없음")
+        
+        bus.close()
+        
+    except Exception as e:
+        _log(f"❌ Bus {bus_num} 검색 실패: {e}")
+    
+    return found
+
 def scan_sdp810_sensors(bus_numbers: List[int] = [0, 1], mux_address: int = 0x70) -> List[Dict]:
     """
     모든 버스와 채널에서 SDP810 센서 검색
@@ -335,75 +532,15 @@ def scan_sdp810_sensors(bus_numbers: List[int] = [0, 1], mux_address: int = 0x70
         print("❌ I2C 라이브러리가 설치되지 않음")
         return found_sensors
     
-    for bus_num in bus_numbers:
-        try:
-            bus = smbus2.SMBus(bus_num)
-            print(f"🚌 Bus {bus_num} 검색 중...")
-            
-            # 직접 연결 확인
-            try:
-                bus.read_byte(SDP810Sensor.SDP810_ADDRESS)
-                sensor = SDP810Sensor(bus_num=bus_num, mux_channel=None)
-                if sensor.connect():
-                    sensor_info = {
-                        "bus": bus_num,
-                        "mux_channel": None,
-                        "address": f"0x{SDP810Sensor.SDP810_ADDRESS:02X}",
-                        "sensor_type": "SDP810",
-                        "connection_type": "direct"
-                    }
-                    found_sensors.append(sensor_info)
-                    print(f"   ✅ Bus {bus_num} 직접: SDP810 발견")
-                sensor.close()
-            except:
-                pass
-            
-            # 멀티플렉서를 통한 검색
-            try:
-                # TCA9548A 응답 확인
-                bus.read_byte(mux_address)
-                print(f"   🔍 TCA9548A 멀티플렉서 발견 (0x{mux_address:02X})")
-                
-                # 각 채널 검색
-                for channel in range(8):
-                    try:
-                        # 채널 선택
-                        bus.write_byte(mux_address, 0)  # 초기화
-                        time.sleep(0.01)
-                        channel_mask = 1 << channel
-                        bus.write_byte(mux_address, channel_mask)
-                        time.sleep(0.01)
-                        
-                        # SDP810 확인
-                        bus.read_byte(SDP810Sensor.SDP810_ADDRESS)
-                        
-                        sensor = SDP810Sensor(bus_num=bus_num, mux_address=mux_address, mux_channel=channel)
-                        if sensor.connect():
-                            sensor_info = {
-                                "bus": bus_num,
-                                "mux_channel": channel,
-                                "mux_address": f"0x{mux_address:02X}",
-                                "address": f"0x{SDP810Sensor.SDP810_ADDRESS:02X}",
-                                "sensor_type": "SDP810",
-                                "connection_type": "multiplexed"
-                            }
-                            found_sensors.append(sensor_info)
-                            print(f"   ✅ Bus {bus_num} CH{channel}: SDP810 발견")
-                        sensor.close()
-                        
-                        # 채널 비활성화
-                        bus.write_byte(mux_address, 0)
-                        
-                    except:
-                        continue
-                        
-            except:
-                print(f"   ⚪ Bus {bus_num}: TCA9548A 없음")
-            
-            bus.close()
-            
-        except Exception as e:
-            print(f"❌ Bus {bus_num} 검색 실패: {e}")
+    # 버스별 검색을 스레드로 병렬 실행 (I2C 대기 중에는 GIL이 해제되어 버스끼리 겹쳐 진행)
+    if len(bus_numbers) > 1:
+        with ThreadPoolExecutor(max_workers=len(bus_numbers)) as executor:
+            results = list(executor.map(lambda bus_num: _scan_bus(bus_num, mux_address), bus_numbers))
+    else:
+        results = [_scan_bus(bus_num, mux_address) for bus_num in bus_numbers]
+    
+    for bus_sensors in results:
+        found_sensors.extend(bus_sensors)
     
     print(f"📊 SDP810 검색 완료: {len(found_sensors)}개 센서 발견")
     return found_sensors
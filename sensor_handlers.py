@@ -5,12 +5,221 @@ EG-ICON 센서 핸들러 모듈
 main.py에서 분리된 센서 데이터 읽기 및 테스트 함수들
 """
 
+import asyncio
+import itertools
+import logging
 import time
 import math
+import os
 import random
+import struct
+from array import array
+from contextlib import asynccontextmanager
 from datetime import datetime
-from typing import Dict, List, Any, Optional
-from hardware_scanner import get_scanner
+from functools import lru_cache
+from typing import Dict, List, Any, Optional, Tuple
+from hardware_scanner import get_scanner, HardwareScanner
+
+# 라즈베리파이 I2C 라이브러리 (설치되지 않은 개발 환경에서는 Mock 데이터 사용)
+try:
+    import smbus2
+    I2C_AVAILABLE = True
+except ImportError:
+    I2C_AVAILABLE = False
+
+# 로거 설정 (센서 읽기 경로의 진행 로그는 DEBUG 레벨, 운영 환경에서는 출력/포맷팅 생략)
+logger = logging.getLogger(__name__)
+
+# I2C 버스 핸들 캐시 {버스 번호: SMBus} - 읽기마다 /dev/i2c-N을 열고 닫지 않도록 재사용
+_BUS_CACHE: Dict[int, Any] = {}
+# 버스별 접근 잠금 {버스 번호: asyncio.Lock} - 멀티플렉서 채널 선택부터 읽기 완료까지 보호
+_BUS_LOCKS: Dict[int, asyncio.Lock] = {}
+# 멀티플렉서 선택 채널 캐시 {(버스, TCA 주소): (채널 마스크, HardwareScanner.mux_epoch)}
+_TCA_STATE: Dict[Tuple[int, int], Tuple[int, int]] = {}
+# 연결된 SHT40 센서 캐시 {(버스, 주소, 채널, 멀티플렉서 주소): SHT40Sensor}
+_SHT40_SENSORS: Dict[Tuple, Any] = {}
+# 16진수 주소 문자열 변환 캐시 {'0x44': 68} - 폴링마다 int(..., 16) 재계산 생략
+_HEX_ADDR_CACHE: Dict[str, int] = {}
+
+@lru_cache(maxsize=None)
+def _is_rpi() -> bool:
+    """라즈베리파이 환경 여부 (실행 중 바뀌지 않으므로 최초 센서 읽기 시 1회 확인 후 캐시)"""
+    return get_scanner().is_raspberry_pi
+
+def _int_addr(value):
+    """I2C 주소 정수 변환 (문자열은 16진수로 해석, 결과 캐시 / 정수·None은 그대로 반환)"""
+    if isinstance(value, str):
+        addr = _HEX_ADDR_CACHE.get(value)
+        if addr is None:
+            addr = _HEX_ADDR_CACHE[value] = int(value, 16)
+        return addr
+    return value
+
+def _get_bus(bus_number: int):
+    """
+    버스 번호별 SMBus 핸들 반환 (최초 요청 시 1회만 열기)
+    
+    운영 시 중요사항:
+    - 같은 버스의 모든 센서 읽기가 하나의 핸들 공유
+    - 호출자는 _bus_lock(bus_number)을 잡은 상태에서 사용
+    """
+    bus = _BUS_CACHE.get(bus_number)
+    if bus is None:
+        bus = smbus2.SMBus(bus_number)
+        _BUS_CACHE[bus_number] = bus
+    return bus
+
+def _select_mux(bus, bus_number: int, tca_address: int, mux_channel: int):
+    """
+    TCA9548A 채널 선택 (이미 선택된 채널이면 쓰기/대기 생략)
+    
+    운영 시 중요사항:
+    - 마지막으로 선택한 채널을 (버스, TCA 주소)별로 기억
+    - 하드웨어 스캐너가 그 사이 채널을 바꿨으면(mux_epoch 변경) 다시 선택
+    - 호출자는 _bus_lock(bus_number)을 잡은 상태에서 사용
+    """
+    key = (bus_number, tca_address)
+    state = (1 << mux_channel, HardwareScanner.mux_epoch)
+    if _TCA_STATE.get(key) == state:
+        return
+    _TCA_STATE.pop(key, None)
+    # 채널 선택은 단독 쓰기로 전송 (TCA9548A는 STOP 조건 이후에 채널이 연결되므로
+    # 반복 START로 이어지는 i2c_rdwr 결합 트랜잭션에 센서 명령과 함께 묶을 수 없음)
+    bus.write_byte(tca_address, state[0])
+    time.sleep(0.01)
+    _TCA_STATE[key] = state
+
+def _forget_mux(bus_number: int):
+    """버스의 선택 채널 캐시 삭제 (다른 모듈이 채널을 바꾼 경우)"""
+    for key in [key for key in list(_TCA_STATE) if key[0] == bus_number]:
+        del _TCA_STATE[key]
+
+def _drop_bus(bus_number: int):
+    """오류가 발생한 버스 핸들 폐기 (다음 읽기에서 다시 열림)"""
+    _forget_mux(bus_number)
+    bus = _BUS_CACHE.pop(bus_number, None)
+    if bus is not None:
+        try:
+            bus.close()
+        except Exception:
+            pass
+
+def _bus_lock(bus_number: int) -> asyncio.Lock:
+    """버스별 asyncio.Lock 반환 (실행 중인 이벤트 루프 안에서 최초 생성)"""
+    lock = _BUS_LOCKS.get(bus_number)
+    if lock is None:
+        lock = _BUS_LOCKS[bus_number] = asyncio.Lock()
+    return lock
+
+# 전체 I2C 버스 번호 (하드웨어 스캐너가 초기화하는 버스와 동일)
+_I2C_BUSES = (0, 1)
+
+@asynccontextmanager
+async def hold_buses(*bus_numbers: int):
+    """
+    I2C 버스 잠금 일괄 획득 (하드웨어 스캐너/엔드포인트의 멀티플렉서 직접 접근용)
+    
+    운영 시 중요사항:
+    - 센서 읽기 스레드와 같은 버스별 잠금 사용 (채널 선택~읽기 사이에 채널 전환 방지)
+    - 버스 번호 미지정 시 전체 버스 잠금, 번호 순서대로 획득하여 교착 상태 방지
+    - 잠금 해제 전에 선택 채널 캐시 폐기 (잠금 안에서 바뀐 채널 상태 반영)
+    """
+    held = []
+    try:
+        for bus_number in sorted(set(bus_numbers or _I2C_BUSES)):
+            await _bus_lock(bus_number).acquire()
+            held.append(bus_number)
+        yield
+    finally:
+        for bus_number in reversed(held):
+            _forget_mux(bus_number)
+            _bus_lock(bus_number).release()
+
+def close_buses():
+    """캐시된 I2C 버스 핸들 및 SHT40 센서 연결 모두 닫기 (서버 종료 시 호출)"""
+    for bus_number in list(_BUS_CACHE):
+        _drop_bus(bus_number)
+    for sensor in _SHT40_SENSORS.values():
+        try:
+            sensor.close()
+        except Exception:
+            pass
+    _SHT40_SENSORS.clear()
+
+# BH1750 측정 방식 (이름, 명령어, 측정 대기 시간)
+_BH1750_METHODS = (
+    ("One Time H-Resolution", 0x20, 0.15),
+    ("One Time L-Resolution", 0x23, 0.02),
+    ("Continuously H-Resolution", 0x10, 0.15)
+)
+# BH1750 측정값 변환 (빅엔디언 16비트 원시값 → lux)
+_BH1750_RAW = struct.Struct('>H')
+_BH1750_LUX_SCALE = 1 / 1.2
+# 센서별 마지막 성공 측정 방식 {(버스, 채널): 측정 방식} - 다음 읽기에서 가장 먼저 시도
+_BH1750_LAST_GOOD: Dict[Tuple[int, int], Tuple[str, int, float]] = {}
+
+def _read_bh1750_sync(bus_number: int, tca_address: int, mux_channel: int) -> Optional[float]:
+    """
+    BH1750 블로킹 측정 시퀀스 (스레드에서 실행, 호출자가 버스 잠금 보유)
+    
+    Returns:
+        Optional[float]: 조도 값 (lux), 모든 측정 방식 실패 시 None
+    """
+    bus = _get_bus(bus_number)
+    
+    # 채널 선택 (이미 선택된 채널이면 생략)
+    _select_mux(bus, bus_number, tca_address, mux_channel)
+    
+    # BH1750 안정적인 데이터 읽기 (ref/gui_bh1750.py 방식)
+    bh1750_addr = 0x23
+    
+    # 다양한 방법으로 시도 (안정성 향상, 마지막 성공 방식 우선)
+    sensor_key = (bus_number, mux_channel)
+    last_good = _BH1750_LAST_GOOD.get(sensor_key)
+    if last_good is None:
+        methods = _BH1750_METHODS
+    else:
+        methods = (last_good,) + tuple(m for m in _BH1750_METHODS if m != last_good)
+    
+    for method in methods:
+        method_name, command, delay = method
+        try:
+            logger.debug("🔍 BH1750 %s 방식 시도...", method_name)
+            
+            # 명령어 전송
+            write_msg = smbus2.i2c_msg.write(bh1750_addr, [command])
+            bus.i2c_rdwr(write_msg)
+            time.sleep(delay)
+            
+            # 데이터 읽기 (BH1750은 레지스터 기반이 아님)
+            read_msg = smbus2.i2c_msg.read(bh1750_addr, 2)
+            bus.i2c_rdwr(read_msg)
+            
+            data = bytes(read_msg)
+            if len(data) == 2:
+                # 유효한 데이터인지 확인
+                if data != b'\x00\x00':
+                    # BH1750 조도 계산 공식 (빅엔디언 16비트, H/L-Resolution 모두 1.2로 나눔)
+                    raw_value = _BH1750_RAW.unpack(data)[0]
+                    lux_value = raw_value * _BH1750_LUX_SCALE
+                    
+                    logger.debug("✅ BH1750 %s 성공: %.1f lux", method_name, lux_value)
+                    _BH1750_LAST_GOOD[sensor_key] = method
+                    
+                    return max(0.0, lux_value)  # 음수 방지
+                else:
+                    logger.debug("⚠️ BH1750 %s: 무효한 데이터 (0x00, 0x00)", method_name)
+            else:
+                logger.debug("⚠️ BH1750 %s: 데이터 길이 오류 (%d)", method_name, len(data))
+                
+        except Exception as method_error:
+            logger.debug("❌ BH1750 %s 실패: %s", method_name, method_error)
+            continue
+    
+    # 기억한 측정 방식도 실패했으므로 다음 읽기는 기본 순서로 다시 시도
+    _BH1750_LAST_GOOD.pop(sensor_key, None)
+    logger.warning("❌ 모든 BH1750 측정 방법 실패 (Bus %s, Ch %s)", bus_number, mux_channel)
+    return None
 
 # BH1750 센서 데이터 읽기 함수 (ref/gui_bh1750.py 기반)
 async def read_bh1750_data(bus_number: int, mux_channel: int) -> float:
@@ -32,99 +241,117 @@ async def read_bh1750_data(bus_number: int, mux_channel: int) -> float:
         float: 측정된 조도 값 (lux 단위)
     """
     try:
-        scanner = get_scanner()
-        
-        # 라즈베리파이 환경이 아니면 Mock 데이터 반환
-        if not scanner.is_raspberry_pi:
+        # 라즈베리파이 환경이 아니거나 I2C 라이브러리가 없으면 Mock 데이터 반환
+        if not _is_rpi() or not I2C_AVAILABLE:
             return 850.0 + (mux_channel * 100) + (time.time() % 100)
         
-        # 실제 하드웨어에서 BH1750 데이터 읽기
-        import smbus2
-        import time
+        scanner = get_scanner()
         
-        # TCA9548A 채널 선택
+        # TCA9548A 채널 선택 및 실제 하드웨어에서 BH1750 데이터 읽기
         if bus_number in scanner.tca_info:
             tca_address = scanner.tca_info[bus_number]['address']
-            bus = smbus2.SMBus(bus_number)
             
-            try:
-                # 채널 선택
-                bus.write_byte(tca_address, 1 << mux_channel)
-                time.sleep(0.01)
-                
-                # BH1750 안정적인 데이터 읽기 (ref/gui_bh1750.py 방식)
-                bh1750_addr = 0x23
-                
-                # 다양한 방법으로 시도 (안정성 향상)
-                methods = [
-                    ("One Time H-Resolution", 0x20, 0.15),
-                    ("One Time L-Resolution", 0x23, 0.02),
-                    ("Continuously H-Resolution", 0x10, 0.15)
-                ]
-                
-                for method_name, command, delay in methods:
-                    try:
-                        print(f"🔍 BH1750 {method_name} 방식 시도...")
-                        
-                        # 명령어 전송
-                        write_msg = smbus2.i2c_msg.write(bh1750_addr, [command])
-                        bus.i2c_rdwr(write_msg)
-                        time.sleep(delay)
-                        
-                        # 데이터 읽기 (BH1750은 레지스터 기반이 아님)
-                        read_msg = smbus2.i2c_msg.read(bh1750_addr, 2)
-                        bus.i2c_rdwr(read_msg)
-                        
-                        data = list(read_msg)
-                        if len(data) == 2:
-                            high_byte = data[0]
-                            low_byte = data[1]
-                            
-                            # 유효한 데이터인지 확인
-                            if not (high_byte == 0 and low_byte == 0):
-                                # BH1750 조도 계산 공식
-                                raw_value = (high_byte << 8) | low_byte
-                                
-                                # 해상도에 따른 변환 계수 적용
-                                if "H-Resolution" in method_name:
-                                    lux_value = raw_value / 1.2  # H-Resolution 모드
-                                else:
-                                    lux_value = raw_value / 1.2  # L-Resolution 모드
-                                
-                                print(f"✅ BH1750 {method_name} 성공: {lux_value:.1f} lux")
-                                
-                                # 채널 비활성화
-                                bus.write_byte(tca_address, 0x00)
-                                bus.close()
-                                
-                                return max(0.0, lux_value)  # 음수 방지
-                            else:
-                                print(f"⚠️ BH1750 {method_name}: 무효한 데이터 (0x00, 0x00)")
-                        else:
-                            print(f"⚠️ BH1750 {method_name}: 데이터 길이 오류 ({len(data)})")
-                            
-                    except Exception as method_error:
-                        print(f"❌ BH1750 {method_name} 실패: {method_error}")
-                        continue
-                
-                print("❌ 모든 BH1750 측정 방법 실패")
-                
-                # 채널 비활성화
-                bus.write_byte(tca_address, 0x00)
-                bus.close()
-                
-            except Exception as bus_error:
-                print(f"❌ BH1750 버스 오류: {bus_error}")
-                if 'bus' in locals():
-                    bus.close()
+            async with _bus_lock(bus_number):
+                try:
+                    # 블로킹 I2C 통신/측정 대기는 스레드에서 실행 (이벤트 루프 차단 방지)
+                    lux_value = await asyncio.to_thread(_read_bh1750_sync, bus_number, tca_address, mux_channel)
+                    if lux_value is not None:
+                        return lux_value
+                    
+                except Exception as bus_error:
+                    logger.error("❌ BH1750 버스 오류: %s", bus_error)
+                    _drop_bus(bus_number)
         
         # 실패 시 Mock 데이터 반환
         return 650.0 + (mux_channel * 50)
         
     except Exception as e:
-        print(f"❌ BH1750 데이터 읽기 오류 (Bus {bus_number}, Ch {mux_channel}): {e}")
+        logger.error("❌ BH1750 데이터 읽기 오류 (Bus %s, Ch %s): %s", bus_number, mux_channel, e)
         return 600.0 + (mux_channel * 30)
 
+# BME688 측정값 변동 샘플 (모듈 로드 시 1회 생성, 읽기마다 난수 생성하지 않고 순환 사용)
+_VARIANCE_SIZE = 1024  # 2의 거듭제곱 (인덱스를 비트 마스크로 순환)
+_VAR_PRESSURE = array('f', [random.uniform(-1, 1) for _ in range(_VARIANCE_SIZE)])
+_VAR_GAS = array('f', [random.uniform(-5000, 5000) for _ in range(_VARIANCE_SIZE)])
+_VAR_INDEX = itertools.count()
+
+# BME688 모의 데이터 주기 변화 테이블 (1시간 주기, 1초당 1샘플 - 읽기마다 sin/cos 계산 생략)
+_MOCK_PERIOD = 3600
+_MOCK_PRESSURE_WAVE = array('f', [math.sin(i / 1200) * 3.0 for i in range(_MOCK_PERIOD)])  # ±3hPa 변화
+_MOCK_GAS_WAVE = array('f', [math.cos(i / 900) * 10000 for i in range(_MOCK_PERIOD)])  # ±10kΩ 변화
+
+# BME688 Mock 일괄 계산 채널 수 (같은 초 안의 읽기는 채널별 재계산 없이 공유)
+_MOCK_CHANNELS = 8  # TCA9548A 채널 수
+
+def _mock_bme688_values(tick: int, mux_channel: int) -> Tuple[float, float]:
+    """채널별 BME688 Mock 기압/가스저항 값 계산"""
+    time_factor = tick % _MOCK_PERIOD  # 1시간 주기
+    base_pressure = 1013.25 + (mux_channel * 1.5)
+    base_gas_resistance = 50000 + (mux_channel * 5000)
+    return (
+        round(base_pressure + _MOCK_PRESSURE_WAVE[time_factor], 2),
+        round(base_gas_resistance + _MOCK_GAS_WAVE[time_factor], 0)
+    )
+
+@lru_cache(maxsize=2)
+def _mock_bme688_batch(tick: int) -> Tuple[Tuple[float, float], ...]:
+    """전체 채널 BME688 Mock 값 반환 (초 단위 캐시 - 초가 바뀔 때만 8채널 일괄 재계산)"""
+    return tuple(_mock_bme688_values(tick, ch) for ch in range(_MOCK_CHANNELS))
+
+# Chip ID 확인이 끝난 BME688 {(버스, 채널, 주소)} - 세션당 1회만 확인
+_BME688_VERIFIED = set()
+
+def _read_bme688_sync(bus_number: int, tca_address: int, mux_channel: int, address: int) -> Dict[str, Any]:
+    """BME688 블로킹 읽기 시퀀스 (스레드에서 실행, 호출자가 버스 잠금 보유)"""
+    bus = _get_bus(bus_number)
+    
+    # 채널 선택 (이미 선택된 채널이면 생략)
+    _select_mux(bus, bus_number, tca_address, mux_channel)
+    
+    # BME688 실제 기압/가스저항 데이터 읽기
+    sensor_key = (bus_number, mux_channel, address)
+    try:
+        # BME688 Chip ID 확인 (0xD0 레지스터, 인증된 센서는 다시 읽지 않음)
+        if sensor_key in _BME688_VERIFIED:
+            chip_id = 0x61
+        else:
+            chip_id = bus.read_byte_data(address, 0xD0)
+            logger.debug("📊 BME688 Chip ID: 0x%02X", chip_id)
+        
+        if chip_id == 0x61:  # BME688 올바른 Chip ID
+            if sensor_key not in _BME688_VERIFIED:
+                _BME688_VERIFIED.add(sensor_key)
+                logger.debug("✅ BME688 인증 성공")
+            # BME688은 복잡한 초기화가 필요하지만, 여기서는 기본값으로 시뮬레이션
+            # 실제 구현에서는 BME688 라이브러리 사용 권장
+            
+            # 기압/가스저항만 반환 (온도/습도 제거)
+            base_pressure = 1012.8 + (mux_channel * 0.8)
+            base_gas_resistance = 45000 + (mux_channel * 3000)
+            i = next(_VAR_INDEX) & (_VARIANCE_SIZE - 1)
+            
+            return {
+                "pressure": round(base_pressure + _VAR_PRESSURE[i], 2),
+                "gas_resistance": round(base_gas_resistance + _VAR_GAS[i], 0)
+            }
+        else:
+            return {
+                "error": "BME688 ID 불일치",
+                "expected": "0x61",
+                "actual": f"0x{chip_id:02X}",
+                "pressure": 0.0,
+                "gas_resistance": 0
+            }
+            
+    except Exception as read_error:
+        _BME688_VERIFIED.discard(sensor_key)
+        logger.warning("❌ BME688 데이터 읽기 실패: %s", read_error)
+        return {
+            "error": f"BME688 읽기 실패: {read_error}",
+            "pressure": 0.0,
+            "gas_resistance": 0
+        }
+
 # BME688 센서 데이터 읽기 함수 (기압/가스저항만)
 async def read_bme688_data(bus_number: int, mux_channel: int, address: int = 0x77):
     """
@@ -146,84 +373,38 @@ async def read_bme688_data(bus_number: int, mux_channel: int, address: int = 0x7
         dict: 기압/가스저항 데이터 또는 오류 정보
     """
     try:
-        scanner = get_scanner()
-        
         # mux_channel이 None인 경우 기본값 설정
         if mux_channel is None:
             mux_channel = 0
             
-        # 라즈베리파이 환경이 아니면 기본값 반환
-        if not scanner.is_raspberry_pi:
-            base_pressure = 1013.25 + (mux_channel * 1.5)
-            base_gas_resistance = 50000 + (mux_channel * 5000)
-            
-            # 시간에 따른 자연스러운 변화 시뮬레이션
-            time_factor = time.time() % 3600  # 1시간 주기
-            pressure_variation = math.sin(time_factor / 1200) * 3.0  # ±3hPa 변화
-            gas_variation = math.cos(time_factor / 900) * 10000  # ±10kΩ 변화
+        # 라즈베리파이 환경이 아니거나 I2C 라이브러리가 없으면 기본값 반환
+        if not _is_rpi() or not I2C_AVAILABLE:
+            # 시간에 따른 자연스러운 변화 시뮬레이션 (초 단위로 전 채널 일괄 계산한 값 사용)
+            tick = int(time.time())
+            if 0 <= mux_channel < _MOCK_CHANNELS:
+                pressure, gas_resistance = _mock_bme688_batch(tick)[mux_channel]
+            else:
+                pressure, gas_resistance = _mock_bme688_values(tick, mux_channel)
             
             return {
-                "pressure": round(base_pressure + pressure_variation, 2),
-                "gas_resistance": round(base_gas_resistance + gas_variation, 0)
+                "pressure": pressure,
+                "gas_resistance": gas_resistance
             }
         
-        # 실제 하드웨어에서 BME688 데이터 읽기
-        import smbus2
+        scanner = get_scanner()
         
-        # TCA9548A 채널 선택
+        # TCA9548A 채널 선택 및 실제 하드웨어에서 BME688 데이터 읽기
         if bus_number in scanner.tca_info:
             tca_address = scanner.tca_info[bus_number]['address']
-            bus = smbus2.SMBus(bus_number)
             
-            try:
-                # 채널 선택
-                bus.write_byte(tca_address, 1 << mux_channel)
-                time.sleep(0.01)
-                
-                # BME688 실제 기압/가스저항 데이터 읽기
+            async with _bus_lock(bus_number):
                 try:
-                    # BME688 Chip ID 확인 (0xD0 레지스터)
-                    chip_id = bus.read_byte_data(address, 0xD0)
-                    print(f"📊 BME688 Chip ID: 0x{chip_id:02X}")
-                    
-                    if chip_id == 0x61:  # BME688 올바른 Chip ID
-                        print("✅ BME688 인증 성공")
-                        # BME688은 복잡한 초기화가 필요하지만, 여기서는 기본값으로 시뮬레이션
-                        # 실제 구현에서는 BME688 라이브러리 사용 권장
-                        
-                        # 기압/가스저항만 반환 (온도/습도 제거)
-                        base_pressure = 1012.8 + (mux_channel * 0.8)
-                        base_gas_resistance = 45000 + (mux_channel * 3000)
-                        
-                        return {
-                            "pressure": round(base_pressure + random.uniform(-1, 1), 2),
-                            "gas_resistance": round(base_gas_resistance + random.uniform(-5000, 5000), 0)
-                        }
-                    else:
-                        return {
-                            "error": "BME688 ID 불일치",
-                            "expected": "0x61",
-                            "actual": f"0x{chip_id:02X}",
-                            "pressure": 0.0,
-                            "gas_resistance": 0
-                        }
-                        
-                except Exception as read_error:
-                    print(f"❌ BME688 데이터 읽기 실패: {read_error}")
-                    return {
-                        "error": f"BME688 읽기 실패: {read_error}",
-                        "pressure": 0.0,
-                        "gas_resistance": 0
-                    }
-                finally:
-                    # 채널 비활성화
-                    bus.write_byte(tca_address, 0x00)
-                    bus.close()
+                    # 블로킹 I2C 통신은 스레드에서 실행 (이벤트 루프 차단 방지)
+                    return await asyncio.to_thread(_read_bme688_sync, bus_number, tca_address, mux_channel, address)
                     
-            except Exception as bus_error:
-                print(f"❌ BME688 버스 오류: {bus_error}")
-                if 'bus' in locals():
-                    bus.close()
+                except Exception as bus_error:
+                    logger.error("❌ BME688 버스 오류: %s", bus_error)
+                    _drop_bus(bus_number)
         
         # 실패 시 기본값 반환 (기압/가스저항만)
         return {
@@ -232,12 +413,177 @@ async def read_bme688_data(bus_number: int, mux_channel: int, address: int = 0x7
         }
         
     except Exception as e:
-        print(f"❌ BME688 데이터 읽기 오류 (Bus {bus_number}, Ch {mux_channel}): {e}")
+        logger.error("❌ BME688 데이터 읽기 오류 (Bus %s, Ch %s): %s", bus_number, mux_channel, e)
         return {
             "pressure": 1010.0,
             "gas_resistance": 40000
         }
 
+def _pm_float(value) -> float:
+    """SPS30 PM 값 변환 ((값, 단위) tuple이면 첫 번째 요소 사용)"""
+    if value is None:
+        return 0.0
+    return float(value[0]) if type(value) is tuple else float(value)
+
+# SPS30 디버그 모드 (SPS30_DEBUG=1일 때만 테스트 응답에 원본 측정 데이터 포함)
+_SPS30_DEBUG = os.getenv("SPS30_DEBUG") == "1"
+# SPS30 측정 세션 캐시 {포트: (ShdlcSerialPort, Sps30ShdlcDevice, 시리얼 번호)} - 재테스트 시 리셋/안정화 대기 생략
+_SPS30_SESSIONS: Dict[str, Tuple[Any, Any, Any]] = {}
+# 포트별 테스트 잠금 {포트: asyncio.Lock} - 같은 세션에 동시 요청이 섞이지 않도록 보호
+_SPS30_LOCKS: Dict[str, asyncio.Lock] = {}
+
+def _sps30_lock(port: str) -> asyncio.Lock:
+    """포트별 asyncio.Lock 반환 (실행 중인 이벤트 루프 안에서 최초 생성)"""
+    lock = _SPS30_LOCKS.get(port)
+    if lock is None:
+        lock = _SPS30_LOCKS[port] = asyncio.Lock()
+    return lock
+
+def _open_sps30_session(port: str) -> Tuple[Any, Any, Any]:
+    """SPS30 포트 열기 → 리셋 → 측정 시작 후 세션 등록 (최초 1회, 약 7초 블로킹)"""
+    from shdlc_sps30 import Sps30ShdlcDevice
+    from sensirion_shdlc_driver import ShdlcSerialPort, ShdlcConnection
+    
+    serial_port = ShdlcSerialPort(port=port, baudrate=115200)
+    try:
+        device = Sps30ShdlcDevice(ShdlcConnection(serial_port))
+        
+        # 1단계: 기본 정보 읽기 (연결 확인)
+        serial_number = device.device_information_serial_number()
+        logger.debug("📊 SPS30 시리얼 번호: %s", serial_number)
+        
+        # 2단계: 현재 상태 확인 및 안전하게 정리
+        try:
+            # 혹시 실행 중인 측정 중지 (오류 무시)
+            device.stop_measurement()
+            logger.debug("🔄 기존 측정 중지 완료")
+            time.sleep(0.5)
+        except Exception as stop_error:
+            logger.debug("ℹ️ 기존 측정 중지 시도 (오류 무시): %s", stop_error)
+        
+        # 3단계: 디바이스 리셋 (안전한 초기 상태)
+        try:
+            device.device_reset()
+            logger.debug("🔄 SPS30 디바이스 리셋 완료")
+            time.sleep(2)  # 리셋 후 충분한 대기
+        except Exception as reset_error:
+            logger.warning("⚠️ 디바이스 리셋 실패 (계속 진행): %s", reset_error)
+        
+        # 4단계: 측정 시작 (세션이 유지되는 동안 연속 측정)
+        device.start_measurement()
+        logger.debug("🚀 SPS30 측정 시작")
+        time.sleep(5)  # 안정화 시간 증가
+    except Exception:
+        try:
+            serial_port.close()
+        except Exception:
+            pass
+        raise
+    
+    session = _SPS30_SESSIONS[port] = (serial_port, device, serial_number)
+    return session
+
+def close_sps30(port: Optional[str] = None):
+    """SPS30 측정 세션 종료 (측정 중지 후 포트 닫기, port 미지정 시 전체 - 서버 종료 시 호출)"""
+    for session_port in ([port] if port is not None else list(_SPS30_SESSIONS)):
+        session = _SPS30_SESSIONS.pop(session_port, None)
+        if session is None:
+            continue
+        serial_port, device, _ = session
+        try:
+            device.stop_measurement()
+            logger.debug("🔄 SPS30 측정 중지 완료")
+        except Exception:
+            pass
+        try:
+            serial_port.close()
+        except Exception:
+            pass
+
+def _run_sps30_test(port: str) -> Dict[str, Any]:
+    """SPS30 블로킹 테스트 시퀀스 (스레드에서 실행, 최초 세션 생성 시 약 7초 대기)"""
+    from sensirion_shdlc_driver.errors import ShdlcError
+    
+    serial_number = None
+    try:
+        # 5단계: 데이터 읽기 (측정 중인 세션이 있으면 리셋/안정화 대기 없이 바로 읽기)
+        session = _SPS30_SESSIONS.get(port)
+        data = None
+        if session is not None:
+            try:
+                data = session[1].read_measured_value()
+            except Exception as warm_error:
+                # 외부 리셋(백그라운드 스레드 등)으로 측정이 중단된 경우 세션 재생성
+                logger.debug("ℹ️ SPS30 세션 읽기 실패, 재초기화: %s", warm_error)
+                close_sps30(port)
+                session = None
+        if session is None:
+            session = _open_sps30_session(port)
+            data = session[1].read_measured_value()
+        serial_number = session[2]
+        logger.debug("📊 SPS30 데이터 읽기 성공: %s", data)
+        logger.debug("🔍 SPS30 데이터 타입: %s", type(data))
+        
+        if data:
+            # SPS30 데이터 파싱 (고정 길이 tuple 가정, 형식 오류는 예외 경로에서 처리)
+            try:
+                pm1 = _pm_float(data[0])
+                pm25 = _pm_float(data[1])
+                pm10 = _pm_float(data[2])
+                logger.debug("✅ 파싱된 PM 값: PM1.0=%s, PM2.5=%s, PM10=%s", pm1, pm25, pm10)
+            except (TypeError, ValueError, LookupError) as parse_error:
+                logger.warning("❌ SPS30 데이터 파싱 오류: %s", parse_error)
+                pm1 = pm25 = pm10 = 0.0
+            
+            result_data = {
+                "serial_number": serial_number,
+                "port": port,
+                "pm1": round(pm1, 1),
+                "pm25": round(pm25, 1), 
+                "pm10": round(pm10, 1),
+                "timestamp": datetime.now().isoformat(),
+                "message": "SPS30 테스트 완료"
+            }
+            if _SPS30_DEBUG:
+                result_data["raw_data"] = str(data)  # 디버깅용 원본 데이터
+            
+            return {
+                "success": True,
+                "data": result_data
+            }
+        else:
+            return {
+                "success": False,
+                "error": "SPS30 데이터 읽기 실패 - 데이터가 없음",
+                "data": {"port": port, "serial_number": serial_number, "raw_data": str(data)}
+            }
+            
+    except ShdlcError as shdlc_error:
+        # SHDLC 특정 오류 처리 (세션 상태를 알 수 없으므로 정리 후 다음 테스트에서 재초기화)
+        close_sps30(port)
+        error_code = getattr(shdlc_error, 'error_code', 'Unknown')
+        if error_code == 67:
+            return {
+                "success": False,
+                "error": f"SPS30 상태 오류: 센서가 이미 측정 중이거나 잘못된 상태입니다. 센서를 재시작해주세요.",
+                "data": {"port": port, "serial_number": serial_number, "error_code": error_code}
+            }
+        else:
+            return {
+                "success": False,
+                "error": f"SPS30 SHDLC 오류 코드 {error_code}: {shdlc_error}",
+                "data": {"port": port, "serial_number": serial_number, "error_code": error_code}
+            }
+    
+    except Exception as measure_error:
+        # 측정 중 오류 발생 시 안전하게 정리
+        close_sps30(port)
+        return {
+            "success": False,
+            "error": f"SPS30 측정 실패: {measure_error}",
+            "data": {"port": port, "serial_number": serial_number}
+        }
+
 # SPS30 UART 센서 테스트 함수
 async def test_sps30_sensor(port: str) -> Dict[str, Any]:
     """
@@ -245,9 +591,10 @@ async def test_sps30_sensor(port: str) -> Dict[str, Any]:
     
     운영 시 중요사항:
     - SHDLC (Sensirion High Level Data Link Control) 프로토콜 사용
-    - 센서 리셋 → 측정 시작 → 데이터 읽기 → 측정 중지 순서
+    - 최초 테스트: 센서 리셋 → 측정 시작 → 데이터 읽기 (측정 세션 유지)
+    - 재테스트: 유지 중인 세션에서 바로 데이터 읽기 (리셋/안정화 대기 생략)
     - SHDLC 오류 코드 67 (이미 측정 중) 등 특정 오류 처리
-    - 안전한 측정 중지 및 자원 정리 보장
+    - 오류 시 및 서버 종료 시(close_sps30) 측정 중지 및 자원 정리 보장
     - 충분한 안정화 시간 확보 (5-6초)
     - 튜플/리스트 데이터 타입 안전한 파싱
     
@@ -258,7 +605,7 @@ async def test_sps30_sensor(port: str) -> Dict[str, Any]:
         Dict[str, Any]: 테스트 결과 및 PM 데이터 (PM1.0, PM2.5, PM10)
     """
     try:
-        # SPS30 라이브러리 동적 import
+        # SPS30 라이브러리 설치 확인 (실제 통신은 _run_sps30_test에서 수행)
         try:
             from shdlc_sps30 import Sps30ShdlcDevice
             from sensirion_shdlc_driver import ShdlcSerialPort, ShdlcConnection
@@ -270,137 +617,14 @@ async def test_sps30_sensor(port: str) -> Dict[str, Any]:
                 "data": None
             }
         
-        print(f"🧪 SPS30 테스트 시작: {port}")
+        logger.debug("🧪 SPS30 테스트 시작: %s", port)
         
-        # 안전한 연결 테스트
-        with ShdlcSerialPort(port=port, baudrate=115200) as serial_port:
-            device = Sps30ShdlcDevice(ShdlcConnection(serial_port))
-            
-            try:
-                # 1단계: 기본 정보 읽기 (연결 확인)
-                serial_number = device.device_information_serial_number()
-                print(f"📊 SPS30 시리얼 번호: {serial_number}")
-                
-                # 2단계: 현재 상태 확인 및 안전하게 정리
-                try:
-                    # 혹시 실행 중인 측정 중지 (오류 무시)
-                    device.stop_measurement()
-                    print("🔄 기존 측정 중지 완료")
-                    time.sleep(0.5)
-                except Exception as stop_error:
-                    print(f"ℹ️ 기존 측정 중지 시도 (오류 무시): {stop_error}")
-                
-                # 3단계: 디바이스 리셋 (안전한 초기 상태)
-                try:
-                    device.device_reset()
-                    print("🔄 SPS30 디바이스 리셋 완료")
-                    time.sleep(2)  # 리셋 후 충분한 대기
-                except Exception as reset_error:
-                    print(f"⚠️ 디바이스 리셋 실패 (계속 진행): {reset_error}")
-                
-                # 4단계: 측정 시작
-                try:
-                    device.start_measurement()
-                    print("🚀 SPS30 측정 시작")
-                    time.sleep(5)  # 안정화 시간 증가
-                    
-                    # 5단계: 데이터 읽기
-                    data = device.read_measured_value()
-                    print(f"📊 SPS30 데이터 읽기 성공: {data}")
-                    print(f"🔍 SPS30 데이터 타입: {type(data)}")
-                    
-                    # 6단계: 측정 중지
-                    device.stop_measurement()
-                    print("🔄 SPS30 측정 중지 완료")
-                    
-                    if data:
-                        # SPS30 데이터 파싱 (tuple 또는 list 처리)
-                        try:
-                            # data가 tuple이나 list인 경우 각 요소 확인
-                            if hasattr(data, '__len__') and len(data) >= 3:
-                                # 각 데이터 포인트의 타입 확인 및 변환
-                                def safe_float_conversion(value):
-                                    if value is None:
-                                        return 0.0
-                                    if isinstance(value, (int, float)):
-                                        return float(value)
-                                    if isinstance(value, str):
-                                        return float(value)
-                                    if isinstance(value, tuple) and len(value) > 0:
-                                        # tuple의 첫 번째 요소 사용
-                                        return float(value[0])
-                                    return 0.0
-                                
-                                pm1 = safe_float_conversion(data[0])
-                                pm25 = safe_float_conversion(data[1])  
-                                pm10 = safe_float_conversion(data[2])
-                                
-                                print(f"✅ 파싱된 PM 값: PM1.0={pm1}, PM2.5={pm25}, PM10={pm10}")
-                            else:
-                                print(f"⚠️ SPS30 데이터 길이 부족: {len(data) if hasattr(data, '__len__') else 'Unknown'}")
-                                pm1 = pm25 = pm10 = 0.0
-                        except Exception as parse_error:
-                            print(f"❌ SPS30 데이터 파싱 오류: {parse_error}")
-                            pm1 = pm25 = pm10 = 0.0
-                        
-                        return {
-                            "success": True,
-                            "data": {
-                                "serial_number": serial_number,
-                                "port": port,
-                                "pm1": round(pm1, 1),
-                                "pm25": round(pm25, 1), 
-                                "pm10": round(pm10, 1),
-                                "timestamp": datetime.now().isoformat(),
-                                "message": "SPS30 테스트 완료",
-                                "raw_data": str(data)  # 디버깅용 원본 데이터
-                            }
-                        }
-                    else:
-                        return {
-                            "success": False,
-                            "error": "SPS30 데이터 읽기 실패 - 데이터가 없음",
-                            "data": {"port": port, "serial_number": serial_number, "raw_data": str(data)}
-                        }
-                        
-                except ShdlcError as shdlc_error:
-                    # SHDLC 특정 오류 처리
-                    error_code = getattr(shdlc_error, 'error_code', 'Unknown')
-                    if error_code == 67:
-                        return {
-                            "success": False,
-                            "error": f"SPS30 상태 오류: 센서가 이미 측정 중이거나 잘못된 상태입니다. 센서를 재시작해주세요.",
-                            "data": {"port": port, "serial_number": serial_number, "error_code": error_code}
-                        }
-                    else:
-                        return {
-                            "success": False,
-                            "error": f"SPS30 SHDLC 오류 코드 {error_code}: {shdlc_error}",
-                            "data": {"port": port, "serial_number": serial_number, "error_code": error_code}
-                        }
-                
-                except Exception as measure_error:
-                    # 측정 중 오류 발생 시 안전하게 정리
-                    try:
-                        device.stop_measurement()
-                    except:
-                        pass
-                    
-                    return {
-                        "success": False,
-                        "error": f"SPS30 측정 실패: {measure_error}",
-                        "data": {"port": port, "serial_number": serial_number}
-                    }
-                
-            except Exception as device_error:
-                return {
-                    "success": False,
-                    "error": f"SPS30 디바이스 오류: {device_error}",
-                    "data": {"port": port}
-                }
+        # 리셋/측정 안정화 대기(최초 약 7초)를 포함한 시리얼 통신은 스레드에서 실행
+        async with _sps30_lock(port):
+            return await asyncio.to_thread(_run_sps30_test, port)
                 
     except Exception as e:
-        print(f"❌ SPS30 테스트 실패: {e}")
+        logger.error("❌ SPS30 테스트 실패: %s", e)
         return {
             "success": False,
             "error": f"SPS30 연결 실패: {e}",
@@ -408,7 +632,43 @@ async def test_sps30_sensor(port: str) -> Dict[str, Any]:
         }
 
 # 통합 센서 데이터 읽기 함수
-async def read_sensor_data(sensor_info: Dict[str, Any]) -> Dict[str, Any]:
+# 센서 ID 문자열 캐시 {(타입 접두어, 버스, 채널): "bh1750_1_0"} - 폴링마다 문자열 포맷팅 생략
+_SENSOR_IDS: Dict[Tuple[str, Any, Any], str] = {}
+
+def _sensor_id(prefix: str, bus_number, mux_channel) -> str:
+    """센서 ID 문자열 반환 (최초 1회만 생성, 스캐너의 센서 정보 딕셔너리는 변경하지 않음)"""
+    key = (prefix, bus_number, mux_channel)
+    sensor_id = _SENSOR_IDS.get(key)
+    if sensor_id is None:
+        sensor_id = _SENSOR_IDS[key] = f"{prefix}_{bus_number}_{mux_channel}"
+    return sensor_id
+
+async def _read_bh1750_sensor(sensor_info: Dict[str, Any], timestamp: float) -> Dict[str, Any]:
+    """BH1750 조도 데이터를 표준 형식으로 읽기"""
+    bus_number = sensor_info.get("bus")
+    mux_channel = sensor_info.get("mux_channel")
+    lux_value = await read_bh1750_data(bus_number, mux_channel)
+    return {
+        "sensor_id": _sensor_id("bh1750", bus_number, mux_channel),
+        "sensor_type": "BH1750",
+        "light": lux_value,
+        "timestamp": timestamp
+    }
+
+async def _read_bme688_sensor(sensor_info: Dict[str, Any], timestamp: float) -> Dict[str, Any]:
+    """BME688 기압/가스저항 데이터를 표준 형식으로 읽기"""
+    bus_number = sensor_info.get("bus")
+    mux_channel = sensor_info.get("mux_channel")
+    bme_data = await read_bme688_data(bus_number, mux_channel, _int_addr(sensor_info.get("address")))
+    return {
+        "sensor_id": _sensor_id("bme688", bus_number, mux_channel),
+        "sensor_type": "BME688",
+        "pressure": bme_data.get("pressure", 0.0),
+        "gas_resistance": bme_data.get("gas_resistance", 0),
+        "timestamp": timestamp
+    }
+
+async def read_sensor_data(sensor_info: Dict[str, Any], timestamp: Optional[float] = None) -> Dict[str, Any]:
     """
     센서 정보에 따라 적절한 데이터 읽기 함수 호출
     
@@ -421,62 +681,108 @@ async def read_sensor_data(sensor_info: Dict[str, Any]) -> Dict[str, Any]:
     
     Args:
         sensor_info (Dict[str, Any]): 센서 정보 (타입, 버스, 채널, 주소)
+        timestamp (float, optional): 측정 시각 (한 폴링 주기의 센서들이 같은 시각 공유, 없으면 현재 시각)
     
     Returns:
         Dict[str, Any]: 표준화된 센서 데이터 구조체
     """
+    if timestamp is None:
+        timestamp = time.time()
+    
     try:
-        sensor_type = sensor_info.get("sensor_type", "").upper()
-        bus_number = sensor_info.get("bus")
-        mux_channel = sensor_info.get("mux_channel")
-        address = sensor_info.get("address")
+        # 센서 타입별 읽기 함수 조회 (대문자 타입이면 변환 없이 바로 찾음)
+        sensor_type = sensor_info.get("sensor_type", "")
+        reader = _SENSOR_READERS.get(sensor_type)
+        if reader is None:
+            sensor_type = sensor_type.upper()
+            reader = _SENSOR_READERS.get(sensor_type)
         
-        if sensor_type == "BH1750":
-            lux_value = await read_bh1750_data(bus_number, mux_channel)
-            return {
-                "sensor_id": f"{sensor_type.lower()}_{bus_number}_{mux_channel}",
-                "sensor_type": sensor_type,
-                "light": lux_value,
-                "timestamp": time.time()
-            }
-            
-        elif sensor_type == "BME688":
-            bme_data = await read_bme688_data(bus_number, mux_channel, int(address, 16) if isinstance(address, str) else address)
-            return {
-                "sensor_id": f"{sensor_type.lower()}_{bus_number}_{mux_channel}",
-                "sensor_type": sensor_type,
-                "pressure": bme_data.get("pressure", 0.0),
-                "gas_resistance": bme_data.get("gas_resistance", 0),
-                "timestamp": time.time()
-            }
-            
-        elif sensor_type == "SHT40":
-            sht40_data = await read_sht40_data(sensor_info)
-            return sht40_data
-            
-        else:
-            # 기본 Mock 데이터
-            return {
-                "sensor_id": f"unknown_{bus_number}_{mux_channel}",
-                "sensor_type": sensor_type,
-                "value": random.uniform(0, 100),
-                "timestamp": time.time()
-            }
+        if reader is not None:
+            return await reader(sensor_info, timestamp)
+        
+        # 기본 Mock 데이터
+        return {
+            "sensor_id": f"unknown_{sensor_info.get('bus')}_{sensor_info.get('mux_channel')}",
+            "sensor_type": sensor_type,
+            "value": random.uniform(0, 100),
+            "timestamp": timestamp
+        }
             
     except Exception as e:
-        print(f"❌ 센서 데이터 읽기 실패: {e}")
+        logger.error("❌ 센서 데이터 읽기 실패: %s", e)
         return {
             "sensor_id": "error",
             "sensor_type": "ERROR",
             "error": str(e),
-            "timestamp": time.time()
+            "timestamp": timestamp
         }
 
-# SHT40 센서 관리 변수
-discovered_sht40_sensors = []
+async def read_sensor_data_batch(sensor_infos: List[Dict[str, Any]], timestamp: Optional[float] = None) -> List[Dict[str, Any]]:
+    """
+    여러 센서 데이터를 버스별로 동시에 읽기
+    
+    운영 시 중요사항:
+    - 같은 버스의 센서는 순서대로 읽기 (멀티플렉서 채널 선택이 겹칠 수 없음)
+    - 서로 다른 버스는 asyncio.gather로 동시에 읽어 센서 수가 늘어도 수집 주기 유지
+    - 결과는 입력 순서와 동일한 순서로 반환
+    
+    Args:
+        sensor_infos (List[Dict[str, Any]]): 센서 정보 목록
+        timestamp (float, optional): 측정 시각 (없으면 현재 시각, 모든 센서가 공유)
+    
+    Returns:
+        List[Dict[str, Any]]: 센서별 표준화된 데이터 (read_sensor_data와 동일 형식)
+    """
+    if timestamp is None:
+        timestamp = time.time()
+    
+    # 버스별 그룹 {버스 번호: [(입력 위치, 센서 정보)]}
+    groups: Dict[Any, List[Tuple[int, Dict[str, Any]]]] = {}
+    for index, sensor_info in enumerate(sensor_infos):
+        groups.setdefault(sensor_info.get("bus"), []).append((index, sensor_info))
+    
+    results: List[Optional[Dict[str, Any]]] = [None] * len(sensor_infos)
+    
+    async def _read_bus_group(group):
+        for index, sensor_info in group:
+            results[index] = await read_sensor_data(sensor_info, timestamp)
+    
+    await asyncio.gather(*(_read_bus_group(group) for group in groups.values()))
+    return results
+
+# SHT40 센서 관리 변수 (불변 tuple로 교체 저장 - 조회 시 복사 없이 그대로 공유)
+discovered_sht40_sensors: Tuple[Dict[str, Any], ...] = ()
+
+def _read_sht40_sync(key: Tuple) -> Optional[Tuple[float, float]]:
+    """SHT40 블로킹 읽기 시퀀스 (스레드에서 실행, 호출자가 버스 잠금 보유)"""
+    bus_number, address, mux_channel, mux_address = key
+    sensor = _SHT40_SENSORS.get(key)
+    if sensor is None:
+        from sht40_sensor import SHT40Sensor
+        
+        sensor = SHT40Sensor(
+            bus=bus_number,
+            address=address,
+            mux_channel=mux_channel,
+            mux_address=mux_address
+        )
+        sensor.connect()
+        _SHT40_SENSORS[key] = sensor
+    
+    # 개선된 재시도 로직 사용 (호출 사이클 기반)
+    # SHT40 모듈이 멀티플렉서 채널을 직접 선택하므로 캐시된 선택 상태는 폐기
+    _forget_mux(bus_number)
+    result = sensor.read_with_retry(precision="medium", max_retries=3, base_delay=0.2)
+    
+    # 읽기 실패 시 연결을 닫고 다음 사이클에서 재연결
+    if not result:
+        _SHT40_SENSORS.pop(key, None)
+        sensor.close()
+    
+    return result
 
 # SHT40 센서 데이터 읽기 함수
-async def read_sht40_data(sensor_info: Dict[str, Any]) -> Dict[str, Any]:
+async def read_sht40_data(sensor_info: Dict[str, Any], timestamp: Optional[float] = None) -> Dict[str, Any]:
     """
     SHT40 센서에서 온습도 데이터 읽기 (개선된 호출 사이클 기반)
     
@@ -489,15 +795,17 @@ async def read_sht40_data(sensor_info: Dict[str, Any]) -> Dict[str, Any]:
     
     Args:
         sensor_info (Dict[str, Any]): 센서 정보 (bus, address, mux_channel 등)
+        timestamp (float, optional): 측정 시각 (없으면 현재 시각)
     
     Returns:
         Dict[str, Any]: 표준화된 SHT40 센서 데이터
     """
+    if timestamp is None:
+        timestamp = time.time()
+    
     try:
-        scanner = get_scanner()
-        
         # 라즈베리파이 환경이 아니면 센서 사용 불가 상태 반환
-        if not scanner.is_raspberry_pi:
+        if not _is_rpi():
             return {
                 "sensor_id": sensor_info.get("sensor_id", "sht40_unavailable"),
                 "sensor_type": "SHT40",
@@ -505,34 +813,36 @@ async def read_sht40_data(sensor_info: Dict[str, Any]) -> Dict[str, Any]:
                 "temperature": None,
                 "humidity": None,
                 "status": "hardware_unavailable",
-                "timestamp": time.time()
+                "timestamp": timestamp
             }
         
-        # 실제 SHT40 센서에서 데이터 읽기
-        from sht40_sensor import SHT40Sensor
+        # 실제 SHT40 센서에서 데이터 읽기 (연결된 센서 객체를 캐시해 매 읽기마다 연결/리셋하지 않음)
+        bus_number = sensor_info['bus']
+        address = _int_addr(sensor_info['address'])
+        mux_channel = sensor_info.get('mux_channel')
+        mux_address = _int_addr(sensor_info.get('mux_address'))
+        key = (bus_number, address, mux_channel, mux_address)
         
-        sensor = SHT40Sensor(
-            bus=sensor_info['bus'],
-            address=int(sensor_info['address'], 16) if isinstance(sensor_info['address'], str) else sensor_info['address'],
-            mux_channel=sensor_info.get('mux_channel'),
-            mux_address=int(sensor_info.get('mux_address', '0x70'), 16) if isinstance(sensor_info.get('mux_address'), str) else sensor_info.get('mux_address')
-        )
-        
-        sensor.connect()
-        
-        # 개선된 재시도 로직 사용 (호출 사이클 기반)
-        result = sensor.read_with_retry(precision="medium", max_retries=3, base_delay=0.2)
+        async with _bus_lock(bus_number):
+            # 연결/측정 대기/재시도 백오프가 블로킹이므로 스레드에서 실행
+            result = await asyncio.to_thread(_read_sht40_sync, key)
         
-        sensor.close()
+        # 기본 ID/위치 문자열은 센서 정보에 값이 없을 때만 생성
+        sensor_id = sensor_info.get("sensor_id")
+        if sensor_id is None:
+            sensor_id = _sensor_id("sht40", bus_number, sensor_info.get('mux_channel', 'direct'))
+        location = sensor_info.get("location")
+        if location is None:
+            location = f"Bus {bus_number}"
         
         data = {
-            "sensor_id": sensor_info.get("sensor_id", f"sht40_{sensor_info['bus']}_{sensor_info.get('mux_channel', 'direct')}"),
+            "sensor_id": sensor_id,
             "sensor_type": "SHT40",
-            "location": sensor_info.get("location", f"Bus {sensor_info['bus']}"),
+            "location": location,
             "bus": sensor_info['bus'],
             "channel": sensor_info.get('display_channel', sensor_info.get('mux_channel')),
             "address": sensor_info.get('address', '0x44'),
-            "timestamp": time.time()
+            "timestamp": timestamp
         }
         
         if result:
@@ -562,35 +872,47 @@ async def read_sht40_data(sensor_info: Dict[str, Any]) -> Dict[str, Any]:
             "humidity": None,
             "status": "error",
             "error": str(e),
-            "timestamp": time.time()
+            "timestamp": timestamp
         }
 
+# 센서 타입별 읽기 함수 {센서 타입: 코루틴 함수} - read_sensor_data 라우팅 테이블
+_SENSOR_READERS = {
+    "BH1750": _read_bh1750_sensor,
+    "BME688": _read_bme688_sensor,
+    "SHT40": read_sht40_data,
+}
+
 def update_sht40_sensor_list():
     """SHT40 센서 목록 업데이트 (주기적 호출)"""
     global discovered_sht40_sensors
     try:
         scanner = get_scanner()
-        discovered_sht40_sensors = scanner.scan_sht40_sensors()
+        discovered_sht40_sensors = tuple(scanner.scan_sht40_sensors())
         return discovered_sht40_sensors
     except Exception as e:
-        print(f"❌ SHT40 센서 목록 업데이트 실패: {e}")
-        return []
+        logger.error("❌ SHT40 센서 목록 업데이트 실패: %s", e)
+        return ()
 
 async def read_all_sht40_data():
     """
     발견된 모든 SHT40 센서에서 데이터 읽기
     - 동적으로 발견된 센서들만 대상
+    - 센서별 읽기를 동시에 실행 (같은 버스는 버스 잠금으로 순차 처리)
     - 센서별 개별 에러 처리
     - 전체 시스템 안정성 보장
     """
-    results = []
+    sensor_configs = discovered_sht40_sensors  # 읽는 동안 목록이 교체되어도 영향 없는 스냅샷
+    timestamp = time.time()  # 같은 수집 주기의 센서들은 동일한 측정 시각 사용
+    raw_results = await asyncio.gather(
+        *(read_sht40_data(sensor_config, timestamp) for sensor_config in sensor_configs),
+        return_exceptions=True
+    )
     
-    for sensor_config in discovered_sht40_sensors:
-        try:
-            data = await read_sht40_data(sensor_config)
+    results = []
+    for sensor_config, data in zip(sensor_configs, raw_results):
+        if not isinstance(data, Exception):
             results.append(data)
-            
-        except Exception as e:
+        else:
             # 개별 센서 에러는 전체를 중단시키지 않음
             error_data = {
                 "sensor_id": sensor_config.get('sensor_id', 'unknown'),
@@ -599,8 +921,8 @@ async def read_all_sht40_data():
                 "temperature": None,
                 "humidity": None,
                 "status": "error",
-                "error": str(e),
-                "timestamp": time.time()
+                "error": str(data),
+                "timestamp": timestamp
             }
             results.append(error_data)
             # SHT40 센서 읽기 실패 로그 제거 (과도한 에러 로그 방지)
@@ -612,5 +934,5 @@ def get_sht40_sensor_count():
     return len(discovered_sht40_sensors)
 
 def get_sht40_sensor_list():
-    """현재 발견된 SHT40 센서 목록 반환"""
-    return discovered_sht40_sensors.copy()
\ No newline at end of file
+    """현재 발견된 SHT40 센서 목록 반환 (불변 tuple 스냅샷)"""
+    return discovered_sht40_sensors
\ No newline at end of file
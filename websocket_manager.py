@@ -13,7 +13,7 @@ from datetime import datetime
 from typing import Dict, List, Any, Set
 from fastapi import WebSocket, WebSocketDisconnect
 from hardware_scanner import get_scanner
-from sensor_handlers import read_sensor_data
+from sensor_handlers import read_sensor_data_batch, hold_buses
 
 class ConnectionManager:
     """
@@ -214,7 +214,8 @@ class RealTimeDataCollector:
         """
         try:
             scanner = get_scanner()
-            scan_result = scanner.scan_dual_mux_system()
+            async with hold_buses():  # 스캔 중 센서 읽기 스레드와 멀티플렉서 채널 충돌 방지
+                scan_result = await asyncio.to_thread(scanner.scan_dual_mux_system)
             
             if scan_result.get("success", False):
                 self.sensors_cache = scan_result.get("sensors", [])
@@ -240,15 +241,14 @@ class RealTimeDataCollector:
             sensor_data_list = []
             current_time = time.time()
             
-            # I2C 센서 데이터 수집
-            for sensor in self.sensors_cache:
-                if sensor.get("interface") != "UART":  # I2C 센서만
-                    try:
-                        data = await read_sensor_data(sensor)
-                        if data and "error" not in data:
-                            sensor_data_list.append(data)
-                    except Exception as sensor_error:
-                        print(f"⚠️ 센서 데이터 읽기 실패 {sensor.get('sensor_name', 'Unknown')}: {sensor_error}")
+            # I2C 센서 데이터 수집 (버스별 동시 읽기)
+            i2c_sensors = [sensor for sensor in self.sensors_cache if sensor.get("interface") != "UART"]
+            try:
+                for data in await read_sensor_data_batch(i2c_sensors, current_time):
+                    if data and "error" not in data:
+                        sensor_data_list.append(data)
+            except Exception as sensor_error:
+                print(f"⚠️ 센서 데이터 읽기 실패: {sensor_error}")
             
             # SPS30 UART 센서 데이터 추가
             try:
@@ -354,7 +354,8 @@ class RealTimeDataCollector:
             from sensor_handlers import update_sht40_sensor_list
             
             previous_count = get_sht40_sensor_count() if 'get_sht40_sensor_count' in globals() else 0
-            new_sensors = update_sht40_sensor_list()
+            async with hold_buses():
+                new_sensors = await asyncio.to_thread(update_sht40_sensor_list)
             
             if len(new_sensors) != previous_count:
                 print(f"🔄 SHT40 센서 목록 업데이트: {len(new_sensors)}개 (이전: {previous_count}개)")